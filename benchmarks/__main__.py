@@ -0,0 +1,101 @@
+import argparse
+import json
+import os
+import sys
+
+# Les chemins des assets et du cache sont relatifs à la racine du dépôt
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+os.chdir(ROOT)
+
+from benchmarks import bench_controller, bench_models, bench_render, bench_saves  # noqa: F401,E402
+from benchmarks.runner import (  # noqa: E402
+    DEFAULT_THRESHOLD,
+    compare,
+    confirm_regressions,
+    format_time,
+    load_report,
+    print_comparison,
+    run_benchmarks,
+    same_machine,
+    save_report,
+)
+
+BASELINE = os.path.join("benchmarks", "baseline.json")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Benchmarks du jeu ; compare les résultats à une référence.",
+    )
+    parser.add_argument("-k", "--filter", help="seulement les benchmarks contenant ce texte")
+    parser.add_argument("--quick", action="store_true", help="une seule mesure courte")
+    parser.add_argument("-o", "--output", help="fichier JSON de résultats")
+    parser.add_argument("--baseline", default=BASELINE, help="résultats de référence")
+    parser.add_argument(
+        "--save-baseline", action="store_true", help="enregistre ces résultats comme référence"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="ralentissement toléré de la médiane (0.25 = +25 %%)",
+    )
+    args = parser.parse_args(argv)
+
+    if args.quick and args.save_baseline:
+        parser.error("--save-baseline demande une mesure complète (sans --quick)")
+
+    def progress(name, result):
+        print(f"{name:<40}{format_time(result['median']):>12}", file=sys.stderr)
+
+    report = run_benchmarks(args.filter, args.quick, progress)
+
+    rows = baseline = None
+    if not args.save_baseline and os.path.exists(args.baseline):
+        baseline = load_report(args.baseline)
+        if args.quick:
+            # Mesures trop courtes pour conclure : comparaison indicative
+            rows = [row[:4] + (False,) for row in compare(report, baseline, args.threshold)]
+        else:
+            rows = compare(report, baseline, args.threshold)
+            if any(row[4] for row in rows):
+                print("\nNouvelle mesure des benchmarks en régression :", file=sys.stderr)
+                rows = confirm_regressions(report, baseline, args.threshold, progress)
+
+    if args.output:
+        save_report(report, args.output)
+    else:
+        print(json.dumps(report, indent=2))
+
+    if args.save_baseline:
+        if os.path.exists(args.baseline) and args.filter:
+            # Référence partielle : les autres benchmarks gardent leur valeur
+            baseline = load_report(args.baseline)
+            baseline["results"].update(report["results"])
+            baseline["machine"] = report["machine"]
+            report = baseline
+        save_report(report, args.baseline)
+        return 0
+
+    if baseline is None:
+        return 0
+    if not same_machine(report, baseline):
+        print(
+            "\nAttention : référence mesurée sur une autre machine "
+            f"({baseline['machine'].get('platform')}, {baseline['machine'].get('processor')})",
+            file=sys.stderr,
+        )
+    print("\nbenchmark                                  référence      actuel", file=sys.stderr)
+    print_comparison(rows)
+    if args.quick:
+        print("\n--quick : comparaison indicative, jamais d'échec", file=sys.stderr)
+        return 0
+    regressions = [row[0] for row in rows if row[4]]
+    if regressions:
+        print(f"\n{len(regressions)} régression(s) : {', '.join(regressions)}", file=sys.stderr)
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,89 @@
+import random
+from itertools import cycle, islice
+
+from benchmarks.runner import benchmark
+from controller.game_controller import GameController
+from controller.replay import GameRecord, replay
+
+
+def dice_stream(count=400, seed=3):
+    rng = random.Random(seed)
+    return [[rng.randint(1, 6) for _ in range(6)] for _ in range(count)]
+
+
+def played_rows(games=1000, seed=5):
+    """
+    (rangée d'habitants visible, lancer) au fil de parties de graines
+    différentes, parcourus en boucle : la rangée change à chaque lancer.
+    """
+    rng = random.Random(seed)
+    pairs = []
+    for game_seed in range(games):
+        game = GameController(3, seed=game_seed)
+        while not game.is_game_over():
+            dice = [rng.randint(1, 6) for _ in range(6)]
+            pairs.append((list(game.visible_habitants), dice))
+            game.recruit_or_penalize(dice)
+            game.next_player()
+    return GameController(3, seed=1), cycle(pairs)
+
+
+def seeded_games(count=500):
+    """Parties neuves de graines différentes, une par appel, et leurs lancers."""
+    return cycle([GameController(3, seed=seed) for seed in range(count)]), dice_stream()
+
+
+@benchmark("controller.new_game")
+def new_game(_):
+    GameController(3, seed=1)
+
+
+@benchmark("controller.apply_roll", setup=played_rows)
+def apply_roll(state):
+    """400 lancers, chacun sur la rangée d'un moment de partie différent."""
+    game, pairs = state
+    for row, dice in islice(pairs, 400):
+        game.visible_habitants = row
+        game.apply_roll(dice)
+
+
+@benchmark("controller.recruit_or_penalize", setup=seeded_games)
+def recruit_or_penalize(state):
+    """
+    Une partie complète : validation puis joueur suivant, jusqu'à la fin.
+    Chaque appel joue une graine différente.
+    """
+    games, rolls = state
+    game = next(games).snapshot()
+    for dice in rolls:
+        if game.is_game_over():
+            break
+        game.recruit_or_penalize(dice)
+        game.next_player()
+
+
+def finished_game():
+    game = GameController(4, seed=2)
+    for dice in dice_stream(seed=4):
+        if game.is_game_over():
+            break
+        game.recruit_or_penalize(dice)
+        game.next_player()
+    return game
+
+
+@benchmark("controller.calculate_scores", setup=finished_game)
+def calculate_scores(game):
+    for _ in range(100):
+        game.calculate_scores()
+
+
+@benchmark("controller.recompute_scores", setup=finished_game)
+def recompute_scores(game):
+    for _ in range(100):
+        game.recompute_scores()
+
+
+@benchmark("controller.replay", setup=lambda: GameRecord.from_game(finished_game()))
+def replay_game(record):
+    replay(record)
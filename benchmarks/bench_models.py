@@ -0,0 +1,75 @@
+import random
+from itertools import cycle, islice
+
+from benchmarks.runner import benchmark
+from models.cards import Deck, all_habitants, all_lieux, all_penalites
+from models.combo_index import default_index
+
+
+def random_rolls(count=200, seed=1):
+    rng = random.Random(seed)
+    return [[rng.randint(1, 6) for _ in range(6)] for _ in range(count)]
+
+
+@benchmark("models.is_combo_met", setup=random_rolls)
+def is_combo_met(rolls):
+    """Tous les habitants contre 200 lancers."""
+    for dice in rolls:
+        for card in all_habitants:
+            card.is_combo_met(dice)
+
+
+def random_rows(count=20000, seed=1):
+    """
+    Lancers et rangées tirés au hasard, parcourus en boucle : chaque appel
+    voit de nouvelles rangées, comme en partie.
+    """
+    rng = random.Random(seed)
+    return cycle(
+        [
+            ([rng.randint(1, 6) for _ in range(6)], rng.sample(all_habitants, 4))
+            for _ in range(count)
+        ]
+    )
+
+
+@benchmark("models.combo_index.first_match", setup=random_rows)
+def first_match(rows):
+    """200 lancers, chacun contre une rangée différente."""
+    for dice, row in islice(rows, 200):
+        default_index.first_match(dice, row)
+
+
+@benchmark("models.deck.create_shuffle", setup=lambda: random.Random(1))
+def deck_create_shuffle(rng):
+    for cards in (all_habitants, all_lieux, all_penalites):
+        Deck(cards).shuffle(rng)
+
+
+def shuffled_deck():
+    deck = Deck(all_habitants * 4)
+    deck.shuffle(random.Random(1))
+    return deck
+
+
+@benchmark("models.deck.draw_all", setup=shuffled_deck)
+def deck_draw_all(deck):
+    copy = deck.copy()
+    while copy.draw() is not None:
+        pass
+
+
+@benchmark("models.deck.discard_reshuffle", setup=shuffled_deck)
+def deck_discard_reshuffle(deck):
+    copy = deck.copy()
+    rng = random.Random(2)
+    for _ in range(len(all_habitants)):
+        copy.discard_card(copy.draw())
+    copy.reshuffle_discard(rng)
+
+
+@benchmark("models.deck.snapshot_restore", setup=shuffled_deck)
+def deck_snapshot_restore(deck):
+    snapshot = deck.snapshot()
+    deck.draw()
+    deck.restore(snapshot)
@@ -0,0 +1,66 @@
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from benchmarks.runner import benchmark
+from controller.game_controller import GameController
+from view.screen_manager import ScreenManager
+
+SCREEN_SIZE = (1280, 720)
+
+
+def manager():
+    pygame.init()
+    return ScreenManager(pygame.display.set_mode(SCREEN_SIZE))
+
+
+def menu():
+    from view.menu_screen import MenuScreen
+
+    screen = MenuScreen(manager())
+    return screen
+
+
+@benchmark("render.menu_frame", setup=menu)
+def menu_frame(screen):
+    screen.draw(screen.surface)
+    pygame.display.flip()
+
+
+def local_game():
+    from view.local_game_screen import LocalGameScreen
+
+    screen = LocalGameScreen(manager())
+    screen.enter(GameController(3, seed=6))
+    screen.do_roll()
+    return screen
+
+
+@benchmark("render.local_game_full_frame", setup=local_game)
+def local_game_full_frame(screen):
+    """Image complète (changement d'écran, overlay)."""
+    screen.invalidate()
+    screen.draw(screen.surface)
+    pygame.display.flip()
+
+
+@benchmark("render.local_game_idle_frame", setup=local_game)
+def local_game_idle_frame(screen):
+    """Rien n'a changé : seuls les tests de la scène."""
+    rects = screen.draw(screen.surface)
+    if rects:
+        pygame.display.update(rects)
+
+
+@benchmark("render.local_game_roll_frame", setup=local_game)
+def local_game_roll_frame(screen):
+    """Nouveau lancer : dés et compteur redessinés."""
+    session = screen.session
+    session.rolls_remaining = 3
+    screen.do_roll()
+    rects = screen.draw(screen.surface)
+    if rects:
+        pygame.display.update(rects)
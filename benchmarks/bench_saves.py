@@ -0,0 +1,107 @@
+import json
+import os
+import shutil
+import tempfile
+
+from benchmarks.runner import benchmark
+from controller.game_controller import GameController
+from models.save_codec import encode_game
+from models.save_index import SaveIndex
+from models.save_manager import SaveManager
+
+NUM_SAVES = 10000
+
+
+def sample_game():
+    game = GameController(3, seed=5)
+    for dice in ([1, 1, 1, 2, 3, 4], [6, 6, 6, 5, 5, 1], [2, 2, 2, 3, 3, 3]):
+        game.recruit_or_penalize(dice)
+        game.next_player()
+    return game
+
+
+class SavesDir:
+    """Dossier de sauvegardes temporaire, utilisé par SaveManager le temps du benchmark."""
+
+    def __init__(self, count=0):
+        self.path = tempfile.mkdtemp(prefix="bench_saves_")
+        self.previous = SaveManager.SAVES_DIR
+        SaveManager.SAVES_DIR = self.path
+        self.game = sample_game()
+        if count:
+            data = encode_game(self.game)
+            for i in range(count):
+                with open(os.path.join(self.path, f"save_{i:05d}.sav"), "wb") as f:
+                    f.write(data)
+            SaveManager.get_save_files(limit=1)  # index construit
+
+    def close(self):
+        SaveManager.SAVES_DIR = self.previous
+        with SaveIndex._instances_lock:
+            index = SaveIndex._instances.pop(os.path.abspath(self.path), None)
+        if index is not None:
+            index._db.close()
+        shutil.rmtree(self.path, ignore_errors=True)
+
+
+def close(saves):
+    saves.close()
+
+
+@benchmark("saves.save_game", setup=SavesDir, teardown=close, threshold=0.5)
+def save_game(saves):
+    SaveManager.save_game(saves.game, "bench")
+
+
+def one_save():
+    saves = SavesDir()
+    SaveManager.save_game(saves.game, "bench")
+    return saves
+
+
+@benchmark("saves.load_game", setup=one_save, teardown=close, threshold=0.5)
+def load_game(saves):
+    SaveManager.load_game("bench")
+
+
+def one_json_save():
+    """Sauvegarde à l'ancien format JSON (toujours lisible)."""
+    saves = SavesDir()
+    path = os.path.join(saves.path, "bench.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(SaveManager.game_to_dict(saves.game), f, ensure_ascii=False, indent=2)
+    return saves
+
+
+@benchmark("saves.load_game.json", setup=one_json_save, teardown=close, threshold=0.5)
+def load_game_json(saves):
+    SaveManager.load_game("bench")
+
+
+def many_saves():
+    return SavesDir(NUM_SAVES)
+
+
+@benchmark("saves.get_save_files.10k", setup=many_saves, teardown=close, threshold=0.5)
+def get_save_files(saves):
+    """Liste complète, index à jour."""
+    SaveManager.get_save_files()
+
+
+@benchmark("saves.get_save_files.10k_page", setup=many_saves, teardown=close, threshold=0.5)
+def get_save_files_page(saves):
+    """Une page de l'écran de chargement."""
+    SaveManager.get_save_files(offset=5000, limit=50)
+
+
+@benchmark(
+    "saves.get_save_files.10k_cold", setup=many_saves, teardown=close, repeat=3, threshold=0.5
+)
+def get_save_files_cold(saves):
+    """Index vidé : les 10 000 fichiers sont relus."""
+    index = SaveManager.index()
+    with index._lock:
+        index._db.execute("DELETE FROM saves")
+        index._db.execute("DELETE FROM meta")
+        index._db.commit()
+    SaveManager.get_save_files(limit=50)
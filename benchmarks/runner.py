@@ -0,0 +1,193 @@
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+
+
+# Écart relatif de la médiane au-delà duquel un benchmark est en régression
+DEFAULT_THRESHOLD = 0.25
+
+# Durée visée d'une mesure (number appels), comme timeit.autorange
+MIN_MEASURE_S = 0.1
+
+REGISTRY = []
+
+
+class Benchmark:
+    """
+    Un benchmark : func(state) est chronométrée, state venant de setup()
+    (non chronométré). teardown(state) libère ce que setup a créé.
+    """
+
+    def __init__(self, name, func, setup=None, teardown=None, repeat=5, threshold=None):
+        self.name = name
+        self.func = func
+        self.setup = setup
+        self.teardown = teardown
+        self.repeat = repeat
+        self.threshold = threshold
+
+    def _time(self, state, number):
+        func = self.func
+        start = time.perf_counter()
+        for _ in range(number):
+            func(state)
+        return time.perf_counter() - start
+
+    def run(self, quick=False):
+        """Mesures (secondes par appel) : min, médiane, moyenne, écart-type."""
+        state = self.setup() if self.setup else None
+        target = MIN_MEASURE_S / 10 if quick else MIN_MEASURE_S
+        try:
+            self.func(state)  # premier appel (caches, imports) hors mesure
+            number = 1
+            while True:
+                elapsed = self._time(state, number)
+                if elapsed >= target:
+                    break
+                number *= 10 if elapsed < target / 10 else 2
+            times = [elapsed / number]
+            for _ in range(1 if quick else self.repeat - 1):
+                times.append(self._time(state, number) / number)
+        finally:
+            if self.teardown:
+                self.teardown(state)
+        return {
+            "min": min(times),
+            "median": statistics.median(times),
+            "mean": statistics.fmean(times),
+            "stdev": statistics.stdev(times) if len(times) > 1 else 0.0,
+            "number": number,
+            "repeat": len(times),
+        }
+
+
+def benchmark(name, setup=None, teardown=None, repeat=5, threshold=None):
+    """Décorateur : enregistre la fonction comme benchmark."""
+
+    def register(func):
+        REGISTRY.append(Benchmark(name, func, setup, teardown, repeat, threshold))
+        return func
+
+    return register
+
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def machine_info():
+    """Description de la machine et des versions, jointe aux résultats."""
+    info = {
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor() or None,
+        "cpu_count": os.cpu_count(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "git": git_revision(),
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+    }
+    # pygame.version.ver, numpy.version.version
+    for module, attribute in (("pygame", "ver"), ("numpy", "version")):
+        try:
+            info[module] = getattr(__import__(f"{module}.version").version, attribute)
+        except (ImportError, AttributeError):
+            info[module] = None
+    return info
+
+
+def run_benchmarks(pattern=None, quick=False, progress=None):
+    """Lance les benchmarks (dont le nom contient pattern) et retourne le rapport."""
+    results = {}
+    for bench in REGISTRY:
+        if pattern and pattern not in bench.name:
+            continue
+        results[bench.name] = bench.run(quick)
+        if progress:
+            progress(bench.name, results[bench.name])
+    return {"machine": machine_info(), "results": results}
+
+
+def compare(report, baseline, threshold=DEFAULT_THRESHOLD):
+    """
+    Compare les médianes à celles de la référence. Retourne une ligne par
+    benchmark commun : (nom, référence, actuel, rapport, régression).
+    """
+    thresholds = {bench.name: bench.threshold for bench in REGISTRY}
+    rows = []
+    for name, result in report["results"].items():
+        base = baseline["results"].get(name)
+        if base is None:
+            continue
+        ratio = result["median"] / base["median"] if base["median"] else float("inf")
+        limit = thresholds.get(name) or threshold
+        rows.append((name, base["median"], result["median"], ratio, ratio > 1 + limit))
+    return rows
+
+
+def confirm_regressions(report, baseline, threshold=DEFAULT_THRESHOLD, progress=None):
+    """
+    Remesure les benchmarks en régression : seuls ceux qui le restent à la
+    seconde mesure comptent, pour qu'un ralentissement passager de la
+    machine ne fasse pas échouer la commande. Le rapport garde la meilleure
+    des deux mesures. Retourne les lignes de compare().
+    """
+    suspects = {row[0] for row in compare(report, baseline, threshold) if row[4]}
+    for bench in REGISTRY:
+        if bench.name not in suspects:
+            continue
+        result = bench.run()
+        if progress:
+            progress(bench.name, result)
+        if result["median"] < report["results"][bench.name]["median"]:
+            report["results"][bench.name] = result
+    return compare(report, baseline, threshold)
+
+
+def same_machine(report, baseline):
+    keys = ("machine", "processor", "cpu_count", "python", "implementation")
+    return all(report["machine"].get(k) == baseline["machine"].get(k) for k in keys)
+
+
+def load_report(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_report(report, path):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+        f.write("\n")
+
+
+def format_time(seconds):
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("µs", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3g} {unit}"
+    return f"{seconds / 1e-9:.3g} ns"
+
+
+def print_comparison(rows, out=sys.stderr):
+    for name, base, current, ratio, regressed in rows:
+        flag = "RÉGRESSION" if regressed else ""
+        print(
+            f"{name:<40}{format_time(base):>12}{format_time(current):>12}"
+            f"{ratio:>8.2f}x  {flag}",
+            file=out,
+        )
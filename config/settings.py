@@ -0,0 +1,16 @@
+# ————— Sauvegardes —————
+
+# "full"    : chaque sauvegarde réécrit toute la partie dans saves/<nom>.sav
+#             (format binaire ; le JSON ne sert plus qu'à l'export)
+# "journal" : la première sauvegarde crée un journal ; ensuite chaque action
+#             y est ajoutée et « Sauver » ne fait que forcer l'écriture disque
+SAVE_MODE = "full"
+
+# Nombre d'événements entre deux instantanés complets du journal
+JOURNAL_SNAPSHOT_INTERVAL = 50
+
+# ————— Profilage —————
+
+# Mesure du temps de chaque phase des images dès le démarrage
+# (sinon F3 en jeu ; F4 démarre / arrête une trace dans cache/)
+PROFILE_FRAMES = False
@@ -0,0 +1,218 @@
+import time
+
+from models.cards import HabitantCard
+from models.combo_index import default_index
+from models.dice import NUM_DICE
+from models.probabilities import (
+    HELD,
+    OPTIMAL_HOLD,
+    OUTCOMES,
+    SUBSETS,
+    default_probabilities,
+)
+
+# Nombre de dés gardés pour chaque code d'histogramme
+HELD_SIZE = {code: NUM_DICE - reroll for code, reroll in HELD}
+FACE_WEIGHTS = [7**i for i in range(6)]
+
+
+class _Timeout(Exception):
+    pass
+
+
+class AIPlayer:
+    """
+    Joueur ordinateur : expectimax à profondeur limitée.
+
+    Les nœuds de décision choisissent entre valider et garder une partie
+    des dés ; les nœuds de hasard moyennent sur les résultats des dés
+    relancés. Aux feuilles, la validation est évaluée en moyennant sur les
+    cartes encore dans les pioches (habitant de remplacement, pénalité) et
+    sur la rangée laissée au joueur suivant.
+
+    La recherche est faite en approfondissement itératif (1 relance, puis
+    2, …) dans un budget de temps ; les nœuds déjà évalués sont gardés dans
+    une table de transposition indexée par l'état de la partie.
+    """
+
+    name = "expectimax"
+
+    def __init__(
+        self,
+        time_budget=0.008,
+        opponent_weight=0.5,
+        index=default_index,
+        probabilities=None,
+        max_entries=200_000,
+    ):
+        self.time_budget = time_budget
+        self.opponent_weight = opponent_weight
+        self.index = index
+        self.probabilities = probabilities or default_probabilities()
+        self.max_entries = max_entries
+        self.table = {}  # table de transposition
+        self._state = None
+        self._leaf = None
+        self._penalty_value = 0.0
+        self._deadline = None
+        self.last_depth = 0
+
+    # ————— Interface des politiques (cf. controller.simulation) —————
+
+    def decide(self, game, dice_values, rolls_remaining):
+        """Retourne None pour valider, sinon les indices des dés à garder."""
+        code = self._code(dice_values)
+        if code is None or rolls_remaining <= 0:
+            return None
+        self._prepare(game)
+
+        best_hold = self._greedy_hold(code)
+        self.last_depth = 0
+        self._deadline = (
+            time.perf_counter() + self.time_budget if self.time_budget else None
+        )
+        for depth in range(1, rolls_remaining + 1):
+            try:
+                _, best_hold = self._decision(code, rolls_remaining, depth)
+            except _Timeout:
+                break
+            self.last_depth = depth
+        self._deadline = None
+
+        if best_hold is None:
+            return None
+        return self._hold_indices(dice_values, best_hold)
+
+    # ————— Préparation de l'état —————
+
+    def state_key(self, game):
+        """Empreinte compacte de l'état de la partie utile à la recherche."""
+        bits = tuple(
+            self.index.card_bit(c) if isinstance(c, HabitantCard) else -1
+            for c in game.visible_habitants
+        )
+        pens = tuple(
+            sorted(c.penalty_points for c in game.pen_deck.iter_draw_pile())
+        )
+        habs = tuple(
+            sorted(map(self.index.card_bit, game.hab_deck.iter_draw_pile()))
+        )
+        return hash((game.current_player, game.num_players, bits, pens, habs))
+
+    def _prepare(self, game):
+        state = self.state_key(game)
+        if state == self._state:
+            return
+        if len(self.table) > self.max_entries:
+            self.table.clear()
+        self._state = state
+        values = self._outcome_values(game)
+
+        # Valeur de la validation pour chacun des 462 lancers complets
+        row = game.visible_habitants
+        row_bits = [
+            (i, self.index.card_bit(c))
+            for i, c in enumerate(row)
+            if isinstance(c, HabitantCard)
+        ]
+        self._leaf = {}
+        for code in SUBSETS:
+            mask = self.index.code_mask(code)
+            match = next((i for i, bit in row_bits if mask >> bit & 1), None)
+            self._leaf[code] = values[match]
+        self._penalty_value = values[None]
+
+    def _outcome_values(self, game):
+        """
+        Gain espéré d'une validation selon la carte recrutée
+        (index dans la rangée, ou None pour une pénalité).
+        """
+        row = list(game.visible_habitants)
+        pens = [c.penalty_points for c in game.pen_deck.iter_draw_pile()]
+        expected_penalty = sum(pens) / len(pens) if pens else 0.0
+        draws = list(game.hab_deck.iter_draw_pile()) or [None]
+        last_turn = game.hab_deck.remaining() <= 1
+
+        def opponent(rows):
+            if last_turn:
+                return 0.0
+            return sum(self._row_value(r, expected_penalty) for r in rows) / len(rows)
+
+        values = {}
+        for i, card in enumerate(row):
+            if isinstance(card, HabitantCard):
+                after = [row[:i] + [new] + row[i + 1 :] for new in draws]
+                values[i] = 1.0 - self.opponent_weight * opponent(after)
+        after = [[new] + row[:-1] for new in draws]
+        values[None] = -expected_penalty - self.opponent_weight * opponent(after)
+        return values
+
+    def _row_value(self, row, expected_penalty):
+        """Gain espéré du joueur suivant face à une rangée (approximation)."""
+        miss = 1.0
+        for card in row:
+            if isinstance(card, HabitantCard):
+                miss *= 1.0 - self.probabilities.met_probability(card, OPTIMAL_HOLD)
+        return (1.0 - miss) - miss * expected_penalty
+
+    # ————— Recherche —————
+
+    def _decision(self, code, rolls_remaining, depth):
+        """Nœud de décision : (valeur, dés gardés ou None pour valider)."""
+        key = (self._state, 0, code, rolls_remaining, depth)
+        entry = self.table.get(key)
+        if entry is not None:
+            return entry
+        best, best_hold = self._leaf[code], None
+        if rolls_remaining > 0 and depth > 0:
+            for held in SUBSETS[code]:
+                if held == code:
+                    continue
+                value = self._chance(held, rolls_remaining - 1, depth - 1)
+                if value > best:
+                    best, best_hold = value, held
+        entry = self.table[key] = (best, best_hold)
+        return entry
+
+    def _chance(self, held, rolls_remaining, depth):
+        """Nœud de hasard : espérance après relance des dés non gardés."""
+        key = (self._state, 1, held, rolls_remaining, depth)
+        value = self.table.get(key)
+        if value is not None:
+            return value
+        if self._deadline is not None and time.perf_counter() > self._deadline:
+            raise _Timeout()
+        outcomes = OUTCOMES[NUM_DICE - HELD_SIZE[held]]
+        if depth == 0 or rolls_remaining == 0:
+            # Plus de relance explorée : on valide le lancer obtenu
+            leaf = self._leaf
+            value = sum(p * leaf[held + outcome] for outcome, p in outcomes)
+        else:
+            value = 0.0
+            for outcome, p in outcomes:
+                value += p * self._decision(held + outcome, rolls_remaining, depth)[0]
+        self.table[key] = value
+        return value
+
+    def _greedy_hold(self, code):
+        """Repli sans recherche : valider si une carte est satisfaite."""
+        return None if self._leaf[code] > self._penalty_value else 0
+
+    # ————— Conversions —————
+
+    @staticmethod
+    def _code(dice_values):
+        if len(dice_values) != NUM_DICE or not all(1 <= v <= 6 for v in dice_values):
+            return None
+        return sum(FACE_WEIGHTS[v - 1] for v in dice_values)
+
+    @staticmethod
+    def _hold_indices(dice_values, held):
+        """Indices des dés correspondant à l'histogramme gardé."""
+        counts = [held // FACE_WEIGHTS[i] % 7 for i in range(6)]
+        keep = []
+        for i, value in enumerate(dice_values):
+            if counts[value - 1]:
+                counts[value - 1] -= 1
+                keep.append(i)
+        return tuple(keep)
@@ -1,13 +1,94 @@
+import copy
+import os
+import random
+from itertools import repeat
+from math import floor
+
 from models.cards import (
     Deck,
     all_habitants,
     all_lieux,
     all_penalites,
-    HabitantCard,
 )
+from config import settings
+from models.combo_index import default_index
+from models.dice import FACES, NUM_DICE
+from models.kingdom_index import KingdomIndex, card_points
+from models.save_journal import SaveJournal
 from models.save_manager import SaveManager
 
 
+def new_seed():
+    """Graine aléatoire d'une nouvelle partie."""
+    return random.SystemRandom().getrandbits(64)
+
+
+class GameRandom(random.Random):
+    """
+    random.Random qui compte les mots de 32 bits tirés depuis sa graine.
+    Les sauvegardes gardent ce compteur plutôt que getstate() (2,5 Ko) :
+    GameRandom(graine, draws) reprend exactement au même point.
+
+    Chaque méthode de tirage passe par getrandbits() ou random() (deux
+    mots), comptés ici. shuffle() (decks) et choices() sans poids (dés)
+    sont réécrits, à l'identique, pour rester aussi rapides que ceux de
+    random.Random.
+    """
+
+    def __init__(self, seed=None, draws=0):
+        super().__init__(seed)
+        self.skip(draws)
+
+    def seed(self, a=None, version=2):
+        super().seed(a, version)
+        self.draws = 0
+
+    def getrandbits(self, k):
+        self.draws += (k + 31) // 32
+        return super().getrandbits(k)
+
+    def random(self):
+        self.draws += 2
+        return super().random()
+
+    def choices(self, population, weights=None, *, cum_weights=None, k=1):
+        if weights is not None or cum_weights is not None:
+            return super().choices(population, weights, cum_weights=cum_weights, k=k)
+        # Même tirage que random.Random.choices : un random() par élément
+        self.draws += 2 * k
+        random_ = super().random
+        n = len(population) + 0.0
+        return [population[floor(random_() * n)] for _ in repeat(None, k)]
+
+    def shuffle(self, x):
+        # Même mélange que random.Random.shuffle, sans passer par
+        # getrandbits() ci-dessus à chaque carte
+        getrandbits = super().getrandbits
+        draws = 0
+        for i in reversed(range(1, len(x))):
+            n = i + 1
+            k = n.bit_length()
+            j = getrandbits(k)
+            draws += 1
+            while j >= n:
+                j = getrandbits(k)
+                draws += 1
+            x[i], x[j] = x[j], x[i]
+        self.draws += draws
+
+    def skip(self, draws):
+        """Avance de draws mots de 32 bits, en un seul appel."""
+        if draws:
+            self.getrandbits(32 * draws)
+
+    def getstate(self):
+        return super().getstate(), self.draws
+
+    def setstate(self, state):
+        state, self.draws = state
+        super().setstate(state)
+
+
 class GameController:
     """
     Gère :
@@ -18,33 +99,184 @@ class GameController:
       - fin de partie + calcul de scores/gagnants
     """
 
-    def __init__(self, num_players):
+    def __init__(self, num_players, seed=None):
+        """
+        seed : graine de la partie (tirée au hasard si None). Elle fixe
+        l'ordre des decks et les lancers de dés : avec la liste des actions
+        (self.actions), elle suffit à rejouer la partie (controller.replay).
+        """
         self.num_players = num_players
+        self.seed = new_seed() if seed is None else seed
+        # Un générateur par partie : rien ne passe par le module random global
+        self.rng = GameRandom(self.seed)
+        self.dice_rng = GameRandom(f"{self.seed}:dice")
+        # Actions jouées : ("roll", dés), ("validate", dés), ("next",)
+        self.actions = []
         self.current_player = 1
+        self.turn = 1
         self.kingdoms = {i: [] for i in range(1, num_players + 1)}
+        # Scores et composition des royaumes, mis à jour à chaque carte
+        self.kingdom_index = KingdomIndex(self.kingdoms)
 
         # Crée des decks INDEPENDANTS pour chaque partie
-        self.hab_deck = Deck(list(all_habitants))
-        self.lieu_deck = Deck(list(all_lieux))
-        self.pen_deck = Deck(list(all_penalites))
-        self.hab_deck.shuffle()
-        self.lieu_deck.shuffle()
-        self.pen_deck.shuffle()
+        self.hab_deck = Deck(all_habitants)
+        self.lieu_deck = Deck(all_lieux)
+        self.pen_deck = Deck(all_penalites)
+        self.hab_deck.shuffle(self.rng)
+        self.lieu_deck.shuffle(self.rng)
+        self.pen_deck.shuffle(self.rng)
 
         # Cartes habitants visibles (4) et lieux visibles (4)
         self.visible_habitants = [self.hab_deck.draw() for _ in range(4)]
         self.visible_lieux = [self.lieu_deck.draw() for _ in range(4)]
 
+        # Journal de sauvegarde (mode "journal"), créé à la première sauvegarde
+        self.journal = None
+        # Thread d'écriture des sauvegardes (None = écriture immédiate)
+        self.save_worker = None
+
+    @classmethod
+    def restore(
+        cls,
+        num_players,
+        current_player,
+        turn,
+        kingdoms,
+        visible_habitants,
+        visible_lieux,
+        hab_deck,
+        lieu_deck,
+        pen_deck,
+        seed=None,
+        actions=(),
+        draws=(None, None),
+    ):
+        """
+        Partie reconstruite à partir d'un état sauvegardé, sans créer ni
+        mélanger de decks comme __init__. seed None : partie sans historique
+        (ancienne sauvegarde), pas de replay possible.
+        draws : (tirages de rng, tirages de dice_rng), cf. rng_draws().
+        """
+        game = cls.__new__(cls)
+        game.num_players = num_players
+        game.seed = seed
+        game.actions = list(actions)
+        game.current_player = current_player
+        game.turn = turn
+        game.kingdoms = {p: list(kingdoms.get(p, ())) for p in range(1, num_players + 1)}
+        game.rebuild_kingdom_index()
+        game.hab_deck = hab_deck
+        game.lieu_deck = lieu_deck
+        game.pen_deck = pen_deck
+        game.visible_habitants = list(visible_habitants)
+        game.visible_lieux = list(visible_lieux)
+        game.rng, game.dice_rng = game.restore_rngs(*draws)
+        game.journal = None
+        game.save_worker = None
+        return game
+
+    def restore_rngs(self, rng_draws, dice_draws):
+        """
+        (rng, dice_rng) replacés après le nombre de tirages sauvegardé.
+        Sauvegarde sans compteur (None) : on refait les tirages connus.
+        """
+        if self.seed is None:
+            return GameRandom(), GameRandom()
+        if rng_draws is None:
+            # Seul le mélange initial a tiré
+            rng = GameRandom(self.seed)
+            for cards in (all_habitants, all_lieux, all_penalites):
+                Deck(cards).shuffle(rng)
+        else:
+            rng = GameRandom(self.seed, rng_draws)
+        if dice_draws is None:
+            # Chaque lancer enregistré a tiré tous les dés (cf. GameSession.roll)
+            dice_rng = GameRandom(f"{self.seed}:dice")
+            for action in self.actions:
+                if action[0] == "roll":
+                    for _ in range(NUM_DICE):
+                        dice_rng.randint(1, len(FACES))
+        else:
+            dice_rng = GameRandom(f"{self.seed}:dice", dice_draws)
+        return rng, dice_rng
+
+    def rng_draws(self):
+        """(tirages de rng, tirages de dice_rng) à sauvegarder ; None sans graine."""
+        if self.seed is None:
+            return None, None
+        return self.rng.draws, self.dice_rng.draws
+
+    def set_dice_draws(self, draws):
+        """Replace les dés après draws tirages depuis la graine (journal)."""
+        if self.seed is not None and draws != self.dice_rng.draws:
+            self.dice_rng = GameRandom(f"{self.seed}:dice", draws)
+
+    def snapshot(self):
+        """
+        Copie légère et indépendante de l'état de la partie (listes et
+        decks copiés, cartes partagées), pour sauvegarder en arrière-plan.
+        """
+        clone = GameController.__new__(GameController)
+        clone.num_players = self.num_players
+        clone.seed = self.seed
+        clone.rng = copy.copy(self.rng)
+        clone.dice_rng = copy.copy(self.dice_rng)
+        clone.actions = list(self.actions)
+        clone.current_player = self.current_player
+        clone.turn = self.turn
+        clone.kingdoms = {p: list(cards) for p, cards in self.kingdoms.items()}
+        clone.kingdom_index = self.kingdom_index.copy()
+        clone.hab_deck = self.hab_deck.copy()
+        clone.lieu_deck = self.lieu_deck.copy()
+        clone.pen_deck = self.pen_deck.copy()
+        clone.visible_habitants = list(self.visible_habitants)
+        clone.visible_lieux = list(self.visible_lieux)
+        clone.journal = None
+        clone.save_worker = None
+        return clone
+
+    def rebuild_kingdom_index(self):
+        """Recalcule l'index des royaumes (après avoir remplacé self.kingdoms)."""
+        self.kingdom_index = KingdomIndex.build(self.kingdoms)
+
+    def add_to_kingdom(self, player, card):
+        """Ajoute une carte au royaume d'un joueur et met l'index à jour."""
+        self.kingdoms[player].append(card)
+        self.kingdom_index.add(player, card)
+
+    def attach_save_worker(self, worker):
+        """Confie les écritures de sauvegarde à un SaveWorker."""
+        self.save_worker = worker
+        if self.journal:
+            self.journal.worker = worker
+
     def next_player(self):
         """Passe au joueur suivant (1→2→…→N→1)."""
         self.current_player = (self.current_player % self.num_players) + 1
+        self.turn += 1
+        self.actions.append(("next",))
+        if self.journal:
+            # Fin de tour : l'autosauvegarde est un simple ajout + fsync
+            self.journal.append("next", sync=True)
+
+    def record_roll(self, dice_values):
+        """Note un lancer de dés (actions, et journal de sauvegarde s'il existe)."""
+        self.actions.append(("roll", tuple(dice_values)))
+        if self.journal:
+            # Tirages des dés : la partie rechargée reprend les mêmes lancers
+            self.journal.append(
+                "roll", dice=list(dice_values), draws=self.rng_draws()[1]
+            )
+
+    def record_validate(self, dice_values):
+        """Note une validation (actions, et journal de sauvegarde s'il existe)."""
+        self.actions.append(("validate", tuple(dice_values)))
+        if self.journal:
+            self.journal.append("validate", dice=list(dice_values))
 
     def apply_roll(self, dice_values):
         """Retourne la première HabitantCard satisfaite, ou None."""
-        for card in self.visible_habitants:
-            if isinstance(card, HabitantCard) and card.is_combo_met(dice_values):
-                return card
-        return None
+        return default_index.first_match(dice_values, self.visible_habitants)[1]
 
     def recruit_or_penalize(self, dice_values):
         """
@@ -52,12 +284,12 @@ class GameController:
         Met à jour kingdoms, visible_habitants et visible_lieux.
         """
         player = self.current_player
-        card = self.apply_roll(dice_values)
+        idx, card = default_index.first_match(dice_values, self.visible_habitants)
+        self.record_validate(dice_values)
 
         if card:
             # Recruter l’habitant
-            self.kingdoms[player].append(card)
-            idx = self.visible_habitants.index(card)
+            self.add_to_kingdom(player, card)
             self.visible_habitants[idx] = self.hab_deck.draw()
             # Si couleur match un lieu visible, on pourrait gérer bonus ici
             return card, False
@@ -65,7 +297,7 @@ class GameController:
             # Pénalité
             pen = self.pen_deck.draw()
             if pen:
-                self.kingdoms[player].append(pen)
+                self.add_to_kingdom(player, pen)
             # Remplace la dernière habitant
             discarded = self.visible_habitants.pop(-1)
             if discarded:
@@ -84,25 +316,31 @@ class GameController:
 
     def is_game_over(self):
         """Vrai quand on ne peut plus réapprovisionner les habitants."""
-        return len(self.hab_deck.draw_pile) == 0
+        return self.hab_deck.remaining() == 0
 
     def calculate_scores(self):
         """
-        Score = #habitants +3×#lieux – pénalités.
+        Score = #habitants +3×#lieux – pénalités, tenu à jour par l'index
+        des royaumes.
         """
+        return dict(self.kingdom_index.scores)
+
+    def recompute_scores(self):
+        """Scores recalculés en parcourant toutes les cartes des royaumes."""
         scores = {i: 0 for i in range(1, self.num_players + 1)}
         for player, cards in self.kingdoms.items():
             for c in cards:
-                if c is None:
-                    continue
-                if c.card_type == "habitant":
-                    scores[player] += 1
-                elif c.card_type == "lieu":
-                    scores[player] += 3
-                elif c.card_type == "penalite":
-                    scores[player] -= c.penalty_points
+                if c is not None:
+                    scores[player] += card_points(c)
         return scores
 
+    def check_kingdom_index(self):
+        """Vérifie l'index des royaumes contre un recalcul complet."""
+        if self.kingdom_index != KingdomIndex.build(self.kingdoms):
+            raise AssertionError("index des royaumes désynchronisé")
+        if self.calculate_scores() != self.recompute_scores():
+            raise AssertionError("scores incrémentaux différents du recalcul")
+
     def get_winner(self):
         scores = self.calculate_scores()
         if not scores:
@@ -112,7 +350,24 @@ class GameController:
         return winners, max_score
 
     def save_game(self, save_name=None):
-        """Sauvegarde l'état actuel de la partie"""
+        """
+        Sauvegarde l'état actuel de la partie. Avec un save_worker, seule
+        une copie légère est faite ici ; l'écriture se fait en arrière-plan.
+        """
+        if self.journal:
+            return self.journal.checkpoint(notify=True)
+        if settings.SAVE_MODE == "journal":
+            self.journal = SaveJournal.create(self, save_name, self.save_worker)
+            return self.journal.snapshot_path
+        if settings.SAVE_MODE != "full":
+            raise ValueError(f"SAVE_MODE inconnu : {settings.SAVE_MODE!r}")
+        if self.save_worker:
+            save_name = save_name or SaveManager.new_save_name()
+            clone = self.snapshot()
+            self.save_worker.submit(
+                ("save", save_name), lambda: SaveManager.save_game(clone, save_name)
+            )
+            return os.path.join(SaveManager.SAVES_DIR, save_name + SaveManager.BINARY_EXT)
         return SaveManager.save_game(self, save_name)
 
     @classmethod
@@ -0,0 +1,148 @@
+from controller.game_controller import GameController
+from models.cards import registry
+from models.dice import ROLLS_PER_TURN, Dice, DicePool
+
+
+def default_dice_pool(rng=None):
+    """Les six dés du jeu : deux rouges, deux bleus, deux verts."""
+    return DicePool(
+        [
+            Dice(6, "rouge"),
+            Dice(6, "rouge"),
+            Dice(6, "bleu"),
+            Dice(6, "bleu"),
+            Dice(6, "vert"),
+            Dice(6, "vert"),
+        ],
+        rng,
+    )
+
+
+def card_id(card):
+    return None if card is None else registry.intern(card).card_id
+
+
+def card_at(card_id):
+    return None if card_id is None else registry[card_id]
+
+
+class GameSession:
+    """
+    Déroulement d'un tour autour d'un GameController : lancers restants,
+    dés, validation, résultat et fin de partie.
+
+    C'est l'interface utilisée par l'écran de jeu ; le serveur réseau en
+    héberge une par table et RemoteGameSession (network.client) l'imite
+    côté client.
+    """
+
+    def __init__(self, controller, dice_pool=None):
+        self.controller = controller
+        # Par défaut, les dés suivent le générateur de la partie (graine)
+        self.dice_pool = dice_pool or default_dice_pool(controller.dice_rng)
+        self.game_over = False
+        self.winners = []
+        self.winning_score = None
+        self.reset_turn()
+
+    @classmethod
+    def new(cls, num_players, dice_pool=None, seed=None):
+        return cls(GameController(num_players, seed), dice_pool)
+
+    def reset_turn(self):
+        self.rolls_remaining = ROLLS_PER_TURN
+        self.dice_values = [0] * len(self.dice_pool.dice)
+        self.validated = False
+        self.result_card = None
+        self.is_penalty = False
+
+    # ————— État de la partie —————
+
+    @property
+    def num_players(self):
+        return self.controller.num_players
+
+    @property
+    def current_player(self):
+        return self.controller.current_player
+
+    @property
+    def visible_habitants(self):
+        return self.controller.visible_habitants
+
+    @property
+    def visible_lieux(self):
+        return self.controller.visible_lieux
+
+    def scores(self):
+        return self.controller.calculate_scores()
+
+    # ————— Actions —————
+
+    def roll(self, keep=()):
+        """Lance les dés non gardés (indices de keep). Faux si impossible."""
+        if self.rolls_remaining <= 0 or self.validated or self.game_over:
+            return False
+        new_values = self.dice_pool.roll()
+        self.dice_values = [
+            self.dice_values[i] if i in keep else new_values[i]
+            for i in range(len(new_values))
+        ]
+        self.rolls_remaining -= 1
+        self.controller.record_roll(self.dice_values)
+        return True
+
+    def validate(self):
+        """Recrute ou prend une pénalité avec les dés actuels."""
+        if self.validated or self.game_over:
+            return False
+        self.result_card, self.is_penalty = self.controller.recruit_or_penalize(
+            self.dice_values
+        )
+        self.validated = True
+        if self.controller.is_game_over():
+            self.game_over = True
+            self.winners, self.winning_score = self.controller.get_winner()
+        return True
+
+    def next_turn(self):
+        """Passe au joueur suivant. Faux si la partie est finie."""
+        if self.game_over:
+            return False
+        self.controller.next_player()
+        self.reset_turn()
+        return True
+
+    def save(self, save_name=None):
+        """Chemin de la sauvegarde écrite (None si la partie est finie)."""
+        if not self.game_over:
+            return self.controller.save_game(save_name)
+        return None
+
+    def update(self):
+        """Rien à recevoir pour une partie locale (cf. RemoteGameSession)."""
+        return None
+
+    def is_waiting(self):
+        return False
+
+    # ————— Échange réseau —————
+
+    def state(self):
+        """État affichable de la partie, en types JSON (cartes par identifiant)."""
+        return {
+            "players": self.num_players,
+            "current_player": self.current_player,
+            "turn": self.controller.turn,
+            "scores": list(self.scores().values()),
+            "habitants": [card_id(c) for c in self.visible_habitants],
+            "lieux": [card_id(c) for c in self.visible_lieux],
+            "rolls_remaining": self.rolls_remaining,
+            "dice": list(self.dice_values),
+            "validated": self.validated,
+            "result": card_id(self.result_card),
+            "penalty": self.is_penalty,
+            "game_over": self.game_over,
+            "winners": list(self.winners),
+            "winning_score": self.winning_score,
+        }
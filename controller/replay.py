@@ -0,0 +1,189 @@
+import argparse
+import bisect
+import json
+
+from controller.game_controller import GameController
+from models.save_codec import decode_game, is_binary
+
+
+# Un instantané toutes les KEYFRAME_TURNS : revenir en arrière ne rejoue
+# que quelques tours depuis l'instantané le plus proche
+KEYFRAME_TURNS = 4
+
+RECORD_VERSION = 1
+
+
+def action_from_json(action):
+    """["roll", [dés]] / ["validate", [dés]] / ["next"] -> tuple d'action."""
+    if len(action) == 1:
+        return (action[0],)
+    return action[0], tuple(action[1])
+
+
+class GameRecord:
+    """
+    Journal minimal d'une partie : graine, nombre de joueurs et actions.
+    La graine redonne les decks mélangés ; les actions, tout le reste.
+    """
+
+    def __init__(self, seed, num_players, actions=()):
+        self.seed = seed
+        self.num_players = num_players
+        self.actions = list(actions)
+
+    @classmethod
+    def from_game(cls, game):
+        if game.seed is None:
+            raise ValueError("partie sans graine (sauvegarde antérieure) : pas de replay")
+        return cls(game.seed, game.num_players, game.actions)
+
+    def to_dict(self):
+        return {
+            "version": RECORD_VERSION,
+            "seed": self.seed,
+            "num_players": self.num_players,
+            "actions": self.actions,  # tuples -> listes JSON
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        """Journal (to_dict) ou sauvegarde JSON contenant seed et actions."""
+        if data.get("seed") is None or "actions" not in data:
+            raise ValueError("pas de graine ni d'actions : partie non rejouable")
+        return cls(
+            data["seed"],
+            data["num_players"],
+            [action_from_json(a) for a in data["actions"]],
+        )
+
+    def save(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, separators=(",", ":"))
+
+    @classmethod
+    def load(cls, path):
+        """Journal JSON, ou sauvegarde (binaire ou JSON)."""
+        with open(path, "rb") as f:
+            raw = f.read()
+        if is_binary(raw):
+            return cls.from_game(decode_game(raw)[0])
+        return cls.from_dict(json.loads(raw.decode("utf-8")))
+
+    def turns(self):
+        """Nombre de tours enregistrés."""
+        return 1 + sum(1 for a in self.actions if a[0] == "next")
+
+
+class Replay:
+    """
+    Rejoue un GameRecord sans affichage, en avance rapide jusqu'à n'importe
+    quel tour.
+
+    Seules les validations et les changements de joueur modifient la
+    partie : les lancers sont sautés. Des instantanés (GameController.
+    snapshot) sont gardés en chemin pour revenir en arrière sans tout
+    rejouer depuis le début.
+    """
+
+    def __init__(self, record):
+        self.record = record
+        self.game = GameController(record.num_players, seed=record.seed)
+        self.position = 0  # index de la prochaine action
+        self._keyframes = [(1, 0, self.game.snapshot())]  # (tour, position, partie)
+
+    @property
+    def turn(self):
+        return self.game.turn
+
+    def at_end(self):
+        return self.position >= len(self.record.actions)
+
+    def step(self):
+        """Applique l'action suivante. Faux s'il n'y en a plus."""
+        actions = self.record.actions
+        if self.position >= len(actions):
+            return False
+        action = actions[self.position]
+        self.position += 1
+        game = self.game
+        if action[0] == "validate":
+            game.recruit_or_penalize(action[1])
+        elif action[0] == "next":
+            game.next_player()
+            if game.turn % KEYFRAME_TURNS == 0 and game.turn > self._keyframes[-1][0]:
+                self._keyframes.append((game.turn, self.position, game.snapshot()))
+        else:
+            game.actions.append(action)  # "roll" : informatif
+        return True
+
+    def seek(self, turn):
+        """
+        Place la partie au début du tour demandé (ou à la fin de la partie
+        si elle est plus courte) et la retourne.
+        """
+        if turn < self.game.turn:
+            i = bisect.bisect_right([k[0] for k in self._keyframes], turn) - 1
+            _, self.position, snapshot = self._keyframes[i]
+            self.game = snapshot.snapshot()
+        while self.game.turn < turn and self.step():
+            pass
+        # Les lancers du début de tour sont inclus, jusqu'à la validation
+        actions = self.record.actions
+        while self.position < len(actions) and actions[self.position][0] == "roll":
+            self.step()
+        return self.game
+
+    def run(self):
+        """Rejoue toute la partie et la retourne."""
+        while self.step():
+            pass
+        return self.game
+
+    def bisect(self, predicate):
+        """
+        Premier tour où predicate(partie) devient vrai (en supposant qu'il
+        le reste ensuite), ou None. Quelques seek() au lieu d'un tour par tour.
+        """
+        low, high = 1, self.record.turns()
+        if not predicate(self.seek(high)):
+            return None
+        while low < high:
+            middle = (low + high) // 2
+            if predicate(self.seek(middle)):
+                high = middle
+            else:
+                low = middle + 1
+        self.seek(low)
+        return low
+
+
+def replay(record, turn=None):
+    """Partie rejouée jusqu'au tour donné (None : jusqu'à la fin)."""
+    engine = Replay(record)
+    return engine.run() if turn is None else engine.seek(turn)
+
+
+def describe(game):
+    return {
+        "turn": game.turn,
+        "current_player": game.current_player,
+        "scores": game.calculate_scores(),
+        "kingdoms": {p: [c.name for c in cards if c] for p, cards in game.kingdoms.items()},
+        "visible_habitants": [c.name if c else None for c in game.visible_habitants],
+        "visible_lieux": [c.name if c else None for c in game.visible_lieux],
+        "game_over": game.is_game_over(),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rejoue une partie enregistrée.")
+    parser.add_argument("record", help="journal (GameRecord) ou fichier de sauvegarde")
+    parser.add_argument("-t", "--turn", type=int, help="s'arrête au début de ce tour")
+    args = parser.parse_args(argv)
+
+    game = replay(GameRecord.load(args.record), args.turn)
+    print(json.dumps(describe(game), ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
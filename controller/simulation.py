@@ -0,0 +1,315 @@
+import random
+from collections import Counter
+from multiprocessing import Pool
+
+from controller.ai_player import AIPlayer
+from controller.game_controller import GameController
+from models.dice import FACES, NUM_DICE, ROLLS_PER_TURN
+
+
+# ————— Politiques de joueur —————
+
+
+class Policy:
+    """
+    Politique de joueur pour les parties sans affichage.
+
+    decide() reçoit la partie, les dés courants et le nombre de relances
+    restantes. Elle retourne None pour valider, sinon le tuple des indices
+    de dés à garder (tuple vide = tout relancer).
+    """
+
+    name = "base"
+
+    def decide(self, game, dice_values, rolls_remaining):
+        return None
+
+
+class ValidateFirstPolicy(Policy):
+    """Valide toujours le premier lancer."""
+
+    name = "first"
+
+
+class GreedyPolicy(Policy):
+    """Valide dès qu'un habitant visible est satisfait, sinon relance tout."""
+
+    name = "greedy"
+
+    def decide(self, game, dice_values, rolls_remaining):
+        if game.apply_roll(dice_values) is not None:
+            return None
+        return ()
+
+
+class HoldPolicy(Policy):
+    """
+    Heuristique fixe : valide dès qu'un habitant est satisfait, sinon garde
+    les dés de la face la plus fréquente (la plus haute en cas d'égalité).
+    """
+
+    name = "hold"
+
+    def decide(self, game, dice_values, rolls_remaining):
+        if game.apply_roll(dice_values) is not None:
+            return None
+        counts = Counter(dice_values)
+        face = max(counts, key=lambda f: (counts[f], f))
+        return tuple(i for i, v in enumerate(dice_values) if v == face)
+
+
+class RandomPolicy(Policy):
+    """Valide ou relance au hasard (utile comme adversaire de référence)."""
+
+    name = "random"
+
+    def __init__(self, rng=None):
+        self.rng = rng or random.Random()
+
+    def decide(self, game, dice_values, rolls_remaining):
+        if self.rng.random() < 0.5:
+            return None
+        return tuple(i for i in range(len(dice_values)) if self.rng.random() < 0.5)
+
+
+POLICIES = {
+    ValidateFirstPolicy.name: ValidateFirstPolicy,
+    GreedyPolicy.name: GreedyPolicy,
+    HoldPolicy.name: HoldPolicy,
+    RandomPolicy.name: RandomPolicy,
+    AIPlayer.name: AIPlayer,
+}
+
+
+def make_policy(name, rng=None):
+    """Instancie une politique à partir de son nom."""
+    if name not in POLICIES:
+        raise ValueError(f"Politique inconnue : {name}")
+    policy_cls = POLICIES[name]
+    if policy_cls is RandomPolicy:
+        return policy_cls(rng)
+    if policy_cls is AIPlayer:
+        # Sans affichage : recherche complète, donc résultats reproductibles
+        return policy_cls(time_budget=None)
+    return policy_cls()
+
+
+# ————— Déroulement d'une partie —————
+
+
+class SimulatedGame(GameController):
+    """
+    Partie sans affichage ni sauvegarde : ni historique des actions, ni
+    index des royaumes (les scores sont comptés une fois, à la fin). Mêmes
+    règles et même hasard qu'un GameController de même graine.
+    """
+
+    def add_to_kingdom(self, player, card):
+        self.kingdoms[player].append(card)
+
+    def record_roll(self, dice_values):
+        pass
+
+    def record_validate(self, dice_values):
+        pass
+
+    def next_player(self):
+        self.current_player = (self.current_player % self.num_players) + 1
+        self.turn += 1
+
+    def calculate_scores(self):
+        return self.recompute_scores()
+
+
+def play_turn(game, policy):
+    """
+    Joue le tour du joueur courant : lancers, validation.
+    Retourne (carte, pénalité) comme recruit_or_penalize.
+
+    Les dés viennent de game.dice_rng, comme dans GameSession : la partie
+    se rejoue à partir de sa graine.
+    """
+    roll = game.dice_rng.choices
+    dice_values = roll(FACES, k=NUM_DICE)
+    game.record_roll(dice_values)
+    rolls_remaining = ROLLS_PER_TURN - 1
+    while rolls_remaining > 0:
+        keep = policy.decide(game, dice_values, rolls_remaining)
+        if keep is None:
+            break
+        if keep:
+            fresh = iter(roll(FACES, k=NUM_DICE - len(keep)))
+            dice_values = [
+                dice_values[i] if i in keep else next(fresh) for i in range(NUM_DICE)
+            ]
+        else:
+            dice_values = roll(FACES, k=NUM_DICE)
+        game.record_roll(dice_values)
+        rolls_remaining -= 1
+    return game.recruit_or_penalize(dice_values)
+
+
+def play_game(num_players, policies, seed, stats=None):
+    """
+    Joue une partie complète sans affichage et retourne ses statistiques.
+
+    policies : une politique par joueur (index 0 = joueur 1).
+    seed     : graine de la partie (decks et dés).
+    Si stats est fourni, les résultats y sont ajoutés directement.
+    """
+    game = SimulatedGame(num_players, seed=seed)
+    if stats is None:
+        stats = SimulationStats()
+
+    turns = 0
+    recruits = Counter()
+    appearances = Counter()
+    while not game.is_game_over():
+        for card in game.visible_habitants:
+            if card is not None:
+                appearances[card.name] += 1
+        card, is_penalty = play_turn(game, policies[game.current_player - 1])
+        if card is not None and not is_penalty:
+            recruits[card.name] += 1
+        turns += 1
+        game.next_player()
+
+    stats.add_game(game.calculate_scores(), turns, recruits, appearances)
+    return stats
+
+
+# ————— Agrégation des résultats —————
+
+
+class SimulationStats:
+    """
+    Résultats agrégés d'un lot de parties.
+    Ne contient que des compteurs : peu coûteux à renvoyer entre processus.
+    """
+
+    def __init__(self):
+        self.games = 0
+        self.total_turns = 0
+        self.score_counts = Counter()  # score -> nombre d'occurrences
+        self.seat_scores = Counter()  # joueur -> somme des scores
+        self.seat_wins = Counter()  # joueur -> victoires (égalités comprises)
+        self.length_counts = Counter()  # nombre de tours -> parties
+        self.recruits = Counter()  # habitant -> recrutements
+        self.appearances = Counter()  # habitant -> tours passés visible
+
+    def add_game(self, scores, turns, recruits, appearances):
+        self.games += 1
+        self.total_turns += turns
+        self.length_counts[turns] += 1
+        best = max(scores.values())
+        for player, score in scores.items():
+            self.score_counts[score] += 1
+            self.seat_scores[player] += score
+            if score == best:
+                self.seat_wins[player] += 1
+        self.recruits.update(recruits)
+        self.appearances.update(appearances)
+
+    def merge(self, other):
+        """Ajoute les résultats d'un autre lot."""
+        self.games += other.games
+        self.total_turns += other.total_turns
+        self.score_counts.update(other.score_counts)
+        self.seat_scores.update(other.seat_scores)
+        self.seat_wins.update(other.seat_wins)
+        self.length_counts.update(other.length_counts)
+        self.recruits.update(other.recruits)
+        self.appearances.update(other.appearances)
+        return self
+
+    def recruit_rates(self):
+        """habitant -> probabilité d'être recruté pendant un tour où il est visible."""
+        return {
+            name: self.recruits[name] / seen
+            for name, seen in sorted(self.appearances.items())
+            if seen
+        }
+
+    def to_dict(self):
+        games = self.games or 1
+        return {
+            "games": self.games,
+            "mean_turns": self.total_turns / games,
+            "length_counts": dict(sorted(self.length_counts.items())),
+            "score_counts": dict(sorted(self.score_counts.items())),
+            "mean_score_by_player": {
+                p: s / games for p, s in sorted(self.seat_scores.items())
+            },
+            "win_rate_by_player": {
+                p: w / games for p, w in sorted(self.seat_wins.items())
+            },
+            "recruits_per_game": {
+                name: n / games for name, n in sorted(self.recruits.items())
+            },
+            "recruit_rate": self.recruit_rates(),
+        }
+
+
+# ————— Répartition sur plusieurs processus —————
+
+
+def shard_seed(seed, shard):
+    """Graine indépendante et reproductible pour un lot donné."""
+    return random.Random(f"{seed}:{shard}").getrandbits(64)
+
+
+def run_shard(args):
+    """Point d'entrée d'un processus : joue un lot de parties."""
+    num_games, num_players, policy_names, seed = args
+    rng = random.Random(seed ^ 0x5DEECE66D)
+    # Hasard des politiques re-semé pour chaque partie : une partie se
+    # rejoue à partir de sa seule graine
+    policy_rng = random.Random()
+    policies = [make_policy(name, policy_rng) for name in policy_names]
+    stats = SimulationStats()
+    for _ in range(num_games):
+        game_seed = rng.getrandbits(64)
+        policy_rng.seed(game_seed)
+        play_game(num_players, policies, game_seed, stats)
+    return stats
+
+
+def split_games(num_games, num_shards):
+    """Répartit num_games en num_shards lots de tailles quasi égales."""
+    base, extra = divmod(num_games, num_shards)
+    return [base + (1 if i < extra else 0) for i in range(num_shards)]
+
+
+def run_simulation(
+    num_games, num_players=2, policy_names=None, workers=1, seed=0, shard_size=2000
+):
+    """
+    Simule num_games parties et retourne un SimulationStats agrégé.
+
+    policy_names : une politique par joueur (ou une seule pour tous).
+    workers      : nombre de processus ; 1 = dans le processus courant.
+    """
+    policy_names = list(policy_names or [GreedyPolicy.name])
+    if len(policy_names) == 1:
+        policy_names *= num_players
+    if len(policy_names) != num_players:
+        raise ValueError("Il faut une politique par joueur")
+    for name in policy_names:
+        make_policy(name)
+
+    num_shards = max(workers, -(-num_games // shard_size))
+    jobs = [
+        (n, num_players, policy_names, shard_seed(seed, i))
+        for i, n in enumerate(split_games(num_games, num_shards))
+        if n
+    ]
+
+    total = SimulationStats()
+    if workers <= 1:
+        for job in jobs:
+            total.merge(run_shard(job))
+    else:
+        with Pool(workers) as pool:
+            for stats in pool.imap_unordered(run_shard, jobs):
+                total.merge(stats)
+    return total
@@ -0,0 +1,433 @@
+import itertools
+import json
+import math
+import os
+import random
+from collections import Counter
+from multiprocessing import Pool
+
+from controller.simulation import SimulatedGame, make_policy, play_turn
+
+
+ROUND_ROBIN = "round-robin"
+SWISS = "swiss"
+
+ELO_BASE = 1500
+ELO_SCALE = 400 / math.log(10)  # écart de log-force -> points Elo
+Z_95 = 1.959964
+
+
+# ————— Parties —————
+
+
+def play_table(job):
+    """
+    Point d'entrée d'un processus : joue les parties d'une table.
+
+    Chaque partie est reproductible à partir de sa graine et de la table :
+    la graine fixe les decks, les dés (dice_rng) et le hasard des politiques.
+    Retourne (clé du job, [(graine, scores, tours), ...]).
+    """
+    key, _, table, num_games, seed = job
+    rng = random.Random(seed)
+    policy_rng = random.Random()
+    policies = [make_policy(name, policy_rng) for name in table]
+    results = []
+    for _ in range(num_games):
+        game_seed = rng.getrandbits(64)
+        policy_rng.seed(game_seed)
+        game = SimulatedGame(len(table), seed=game_seed)
+        turns = 0
+        while not game.is_game_over():
+            play_turn(game, policies[game.current_player - 1])
+            game.next_player()
+            turns += 1
+        results.append((game_seed, list(game.calculate_scores().values()), turns))
+    return key, results
+
+
+# ————— Classement —————
+
+
+class Ratings:
+    """
+    Classement des politiques à partir des résultats de parties.
+
+    Chaque partie à k joueurs compte comme k(k-1)/2 duels (meilleur score
+    gagne, égalité = demi-victoire). Les forces sont estimées par un modèle
+    de Bradley-Terry (maximum de vraisemblance, algorithme MM) exprimé en
+    points Elo ; l'intervalle de confiance à 95 % vient de la matrice
+    d'information de Fisher (les duels d'une même partie y sont supposés
+    indépendants : aux tables de 3-4 joueurs, il est un peu optimiste).
+    """
+
+    def __init__(self, names):
+        self.names = list(names)
+        self.total = 0  # parties
+        self.wins = Counter()  # (a, b) -> victoires de a contre b
+        self.duels = Counter()  # paire triée -> nombre de duels
+        self.games = Counter()
+        self.first = Counter()  # parties gagnées (égalités comprises)
+        self.score_sums = Counter()
+
+    def add_game(self, table, scores):
+        self.total += 1
+        best = max(scores)
+        for name, score in zip(table, scores):
+            self.games[name] += 1
+            self.score_sums[name] += score
+            if score == best:
+                self.first[name] += 1
+        for (a, sa), (b, sb) in itertools.combinations(zip(table, scores), 2):
+            if a == b:
+                continue
+            self.duels[tuple(sorted((a, b)))] += 1
+            if sa > sb:
+                self.wins[a, b] += 1
+            elif sb > sa:
+                self.wins[b, a] += 1
+            else:
+                self.wins[a, b] += 0.5
+                self.wins[b, a] += 0.5
+
+    def _pairs(self):
+        """(i, j, victoires de i, victoires de j, duels), avec un demi-nul fictif."""
+        index = {name: i for i, name in enumerate(self.names)}
+        pairs = []
+        for (a, b), n in self.duels.items():
+            # Une partie nulle fictive par paire : forces finies même à 100 %
+            pairs.append(
+                (index[a], index[b], self.wins[a, b] + 0.5, self.wins[b, a] + 0.5, n + 1)
+            )
+        return pairs
+
+    def fit(self, iterations=1000, tolerance=1e-10):
+        """Log-forces centrées (une par politique), par l'algorithme MM."""
+        count = len(self.names)
+        pairs = self._pairs()
+        total_wins = [0.0] * count
+        for i, j, wi, wj, _ in pairs:
+            total_wins[i] += wi
+            total_wins[j] += wj
+        strength = [1.0] * count
+        for _ in range(iterations):
+            denominators = [0.0] * count
+            for i, j, _, _, n in pairs:
+                d = n / (strength[i] + strength[j])
+                denominators[i] += d
+                denominators[j] += d
+            new = [
+                total_wins[i] / denominators[i] if denominators[i] else strength[i]
+                for i in range(count)
+            ]
+            norm = math.exp(sum(math.log(s) for s in new) / count)
+            new = [s / norm for s in new]
+            change = max(abs(a - b) for a, b in zip(new, strength))
+            strength = new
+            if change < tolerance:
+                break
+        return [math.log(s) for s in strength], pairs
+
+    def standard_errors(self, thetas, pairs):
+        """Écarts-types des log-forces (pseudo-inverse de l'information)."""
+        count = len(thetas)
+        strength = [math.exp(t) for t in thetas]
+        info = [[0.0] * count for _ in range(count)]
+        for i, j, _, _, n in pairs:
+            w = n * strength[i] * strength[j] / (strength[i] + strength[j]) ** 2
+            info[i][j] -= w
+            info[j][i] -= w
+            info[i][i] += w
+            info[j][j] += w
+        # Laplacien pondéré : L+ = (L + J/n)^-1 - J/n (jauge : somme nulle)
+        shifted = [[v + 1 / count for v in row] for row in info]
+        inverse = invert(shifted)
+        if inverse is None:
+            return [math.inf] * count
+        return [math.sqrt(max(inverse[i][i] - 1 / count, 0.0)) for i in range(count)]
+
+    def table(self):
+        """Classement : une entrée par politique, de la meilleure à la moins bonne."""
+        thetas, pairs = self.fit()
+        errors = self.standard_errors(thetas, pairs)
+        rows = []
+        for name, theta, se in zip(self.names, thetas, errors):
+            elo = ELO_BASE + ELO_SCALE * theta
+            margin = Z_95 * ELO_SCALE * se
+            games = self.games[name]
+            rows.append(
+                {
+                    "policy": name,
+                    "elo": round(elo, 1),
+                    "ci95": [round(elo - margin, 1), round(elo + margin, 1)],
+                    "games": games,
+                    "win_rate": self.first[name] / games if games else None,
+                    "mean_score": self.score_sums[name] / games if games else None,
+                }
+            )
+        rows.sort(key=lambda row: row["elo"], reverse=True)
+        return rows
+
+    def order(self):
+        """Noms triés par force estimée (pour les appariements suisses)."""
+        return [row["policy"] for row in self.table()]
+
+
+def invert(matrix):
+    """Inverse d'une petite matrice (Gauss-Jordan), ou None si singulière."""
+    size = len(matrix)
+    rows = [list(row) + [float(i == j) for j in range(size)] for i, row in enumerate(matrix)]
+    for col in range(size):
+        pivot = max(range(col, size), key=lambda r: abs(rows[r][col]))
+        if abs(rows[pivot][col]) < 1e-12:
+            return None
+        rows[col], rows[pivot] = rows[pivot], rows[col]
+        factor = rows[col][col]
+        rows[col] = [v / factor for v in rows[col]]
+        for r in range(size):
+            if r != col and rows[r][col]:
+                f = rows[r][col]
+                rows[r] = [a - f * b for a, b in zip(rows[r], rows[col])]
+    return [row[size:] for row in rows]
+
+
+# ————— Appariements —————
+
+
+def tables_for(names, size):
+    """
+    Tables de size joueurs : combinaisons de politiques distinctes, ou avec
+    répétition s'il y a moins de politiques que de places.
+    """
+    if len(names) >= size:
+        return list(itertools.combinations(names, size))
+    return [
+        combo
+        for combo in itertools.combinations_with_replacement(names, size)
+        if len(set(combo)) > 1
+    ]
+
+
+def rotations(table):
+    """Les k rotations d'une table : chaque politique joue à chaque place."""
+    return [table[r:] + table[:r] for r in range(len(table))]
+
+
+def job_seed(seed, key):
+    return random.Random(f"{seed}:{key}").getrandbits(64)
+
+
+def split_jobs(prefix, round_number, tables, num_games, chunk_size, seed):
+    """
+    Répartit num_games sur les tables (et leurs rotations), en jobs d'au
+    plus chunk_size parties : (clé, manche, table, parties, graine).
+    """
+    seats = [t for table in tables for t in rotations(table)]
+    if not seats:
+        return []
+    base, extra = divmod(num_games, len(seats))
+    jobs = []
+    for t, table in enumerate(seats):
+        games = base + (1 if t < extra else 0)
+        for c, start in enumerate(range(0, games, chunk_size)):
+            key = f"{prefix}:{t}:{c}"
+            jobs.append(
+                (key, round_number, table, min(chunk_size, games - start), job_seed(seed, key))
+            )
+    return jobs
+
+
+def round_robin_jobs(names, table_sizes, num_games, chunk_size, seed):
+    """Toutes les tables possibles, parties réparties par taille de table."""
+    jobs = []
+    for size, games in zip(table_sizes, split_evenly(num_games, len(table_sizes))):
+        jobs += split_jobs(f"rr{size}", 0, tables_for(names, size), games, chunk_size, seed)
+    return jobs
+
+
+def swiss_jobs(order, round_number, table_sizes, num_games, chunk_size, seed):
+    """
+    Une manche suisse : politiques rangées par classement, tables formées
+    de voisins (la dernière reprend les derniers classés si besoin).
+    """
+    jobs = []
+    for size, games in zip(table_sizes, split_evenly(num_games, len(table_sizes))):
+        if len(order) >= size:
+            tables = [tuple(order[i : i + size]) for i in range(0, len(order), size)]
+            if len(tables[-1]) < size:
+                tables[-1] = tuple(order[-size:])
+        else:
+            tables = tables_for(order, size)
+        prefix = f"s{round_number}:{size}"
+        jobs += split_jobs(prefix, round_number, tables, games, chunk_size, seed)
+    return jobs
+
+
+def split_evenly(total, parts):
+    base, extra = divmod(total, parts)
+    return [base + (1 if i < extra else 0) for i in range(parts)]
+
+
+# ————— Fichier de résultats (JSONL) —————
+
+
+class ResultsLog:
+    """
+    Résultats partie par partie, une ligne JSON chacune, écrits dès qu'un
+    job se termine. La première ligne décrit le tournoi. À la reprise, les
+    jobs incomplets (interruption pendant l'écriture) sont retirés du
+    fichier puis rejoués.
+    """
+
+    def __init__(self, path, config, resume=False):
+        self.path = path
+        self.config = config
+        self.done = {}  # clé du job -> nombre de parties
+        self.games = []  # (manche, table, scores) des parties enregistrées
+        if resume and os.path.exists(path):
+            self._load()
+        else:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(json.dumps({"tournament": config}) + "\n")
+        self.file = open(path, "a", encoding="utf-8")
+
+    def _load(self):
+        header, entries, damaged = None, [], False
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    damaged = True  # dernière ligne tronquée
+                    continue
+                if header is None:
+                    header = entry.get("tournament")
+                    if header != self.config:
+                        raise ValueError(
+                            f"{self.path} : autre tournoi (paramètres différents)"
+                        )
+                else:
+                    entries.append(entry)
+        counts = Counter(entry["job"] for entry in entries)
+        complete = [e for e in entries if counts[e["job"]] == e["of"]]
+        if damaged or len(complete) != len(entries):
+            # Réécrit le fichier sans les jobs incomplets
+            tmp_path = self.path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(json.dumps({"tournament": self.config}) + "\n")
+                for entry in complete:
+                    f.write(json.dumps(entry) + "\n")
+            os.replace(tmp_path, self.path)
+        for entry in complete:
+            self.done[entry["job"]] = entry["of"]
+            self.games.append((entry["round"], entry["table"], entry["scores"]))
+
+    def write(self, job, results):
+        key, round_number, table, num_games, _ = job
+        lines = [
+            json.dumps(
+                {
+                    "job": key,
+                    "of": num_games,
+                    "round": round_number,
+                    "table": list(table),
+                    "seed": seed,
+                    "scores": scores,
+                    "turns": turns,
+                }
+            )
+            for seed, scores, turns in results
+        ]
+        self.file.write("\n".join(lines) + "\n")
+        self.file.flush()
+        self.done[key] = num_games
+        for _, scores, _ in results:
+            self.games.append((round_number, list(table), scores))
+
+    def ratings(self, names, before_round=None):
+        """Classement des parties enregistrées (des manches < before_round)."""
+        ratings = Ratings(names)
+        for round_number, table, scores in self.games:
+            if before_round is None or round_number < before_round:
+                ratings.add_game(table, scores)
+        return ratings
+
+    def close(self):
+        self.file.close()
+
+
+# ————— Tournoi —————
+
+
+def run_jobs(jobs, log, pool, progress=None):
+    """Joue les jobs pas encore faits, en enregistrant chaque job terminé."""
+    by_key = {job[0]: job for job in jobs}
+    pending = [job for job in jobs if job[0] not in log.done]
+    results = (
+        pool.imap_unordered(play_table, pending)
+        if pool is not None
+        else map(play_table, pending)
+    )
+    for key, games in results:
+        log.write(by_key[key], games)
+        if progress:
+            progress(len(games))
+
+
+def run_tournament(
+    names,
+    output,
+    table_sizes=(2,),
+    num_games=10000,
+    fmt=ROUND_ROBIN,
+    rounds=5,
+    workers=1,
+    seed=0,
+    chunk_size=500,
+    resume=False,
+    progress=None,
+):
+    """
+    Fait jouer les politiques names entre elles et retourne leur classement
+    (Ratings). Les parties sont enregistrées dans output (JSONL) ; avec
+    resume, un tournoi interrompu reprend là où il s'était arrêté.
+    """
+    names = list(dict.fromkeys(names))
+    if len(names) < 2:
+        raise ValueError("Il faut au moins deux politiques")
+    for name in names:
+        make_policy(name)
+    config = {
+        "policies": names,
+        "table_sizes": list(table_sizes),
+        "games": num_games,
+        "format": fmt,
+        "rounds": rounds if fmt == SWISS else 1,
+        "seed": seed,
+        "chunk_size": chunk_size,
+    }
+    log = ResultsLog(output, config, resume)
+    pool = Pool(workers) if workers > 1 else None
+    try:
+        if fmt == ROUND_ROBIN:
+            jobs = round_robin_jobs(names, table_sizes, num_games, chunk_size, seed)
+            run_jobs(jobs, log, pool, progress)
+        elif fmt == SWISS:
+            for round_number, games in enumerate(split_evenly(num_games, rounds)):
+                # Classement des manches précédentes seulement : les mêmes
+                # appariements sont retrouvés à la reprise
+                order = log.ratings(names, round_number).order() if round_number else names
+                jobs = swiss_jobs(order, round_number, table_sizes, games, chunk_size, seed)
+                run_jobs(jobs, log, pool, progress)
+        else:
+            raise ValueError(f"Format inconnu : {fmt}")
+    finally:
+        # Comme `with Pool()` : tous les résultats utiles sont déjà lus ; après
+        # une interruption, les jobs terminés sont déjà sur disque
+        if pool is not None:
+            pool.terminate()
+        log.close()
+    return log.ratings(names)
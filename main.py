@@ -1,35 +1,69 @@
+import argparse
 import pygame
 from view.screen_manager import ScreenManager
-from view.menu_screen import menu_loop
-from view.chose_number_of_player import chose_number_of_player
-from view.local_game_screen import local_game_loop
-from view.load_game_screen import load_game_loop
+from view.menu_screen import MenuScreen
+from view.chose_number_of_player import ChoseNumberOfPlayerScreen
+from view.local_game_screen import LocalGameScreen
+from view.load_game_screen import LoadGameScreen
 from controller.game_controller import GameController
+from models.save_worker import save_worker
+from view.assets import preload_default_assets
+from view.profiler import profiler
+from network.client import GameClient, RemoteError
+from network.protocol import parse_address
 
 
-def run_game():
+def connect(address):
+    """Client connecté au serveur "hôte:port", ou None s'il est injoignable."""
+    if not address:
+        return None
+    host, port = parse_address(address)
+    try:
+        return GameClient(host, port)
+    except (RemoteError, OSError) as exc:
+        print(f"Serveur {host}:{port} injoignable ({exc}) : parties locales")
+        return None
+
+
+def run_game(server=None):
+    client = connect(server)
     pygame.init()
     screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
     pygame.display.set_caption("Roi & Compagnie 👑")
 
+    # Images lues en arrière-plan, polices ouvertes une fois pour tous les écrans
+    preload_default_assets()
+
     # Initialize screen manager
     screen_manager = ScreenManager(screen)
 
-    # Register all screens
-    screen_manager.register_screen("menu", menu_loop)
-    screen_manager.register_screen("chose_players", chose_number_of_player)
-    screen_manager.register_screen("local_game", local_game_loop)
-    screen_manager.register_screen("load_game", load_game_loop)
+    # Register all screens (created on first use, then kept alive)
+    screen_manager.register_screen("menu", MenuScreen)
+    screen_manager.register_screen("chose_players", ChoseNumberOfPlayerScreen)
+    screen_manager.register_screen(
+        "local_game", lambda manager: LocalGameScreen(manager, client=client)
+    )
+    screen_manager.register_screen("load_game", LoadGameScreen)
 
-    def handle_load_save(screen, save_name):
+    def handle_load_save(save_name):
         """Charge une partie sauvegardée et lance le jeu"""
-        game = GameController.load_game(save_name)
+        try:
+            game = GameController.load_game(save_name)
+        except (OSError, ValueError) as exc:  # SaveFormatError compris
+            return "load_game", f"Sauvegarde illisible : {exc}"
         if game:
-            return local_game_loop(screen, game)
-        return "menu"
+            return "local_game", game
+        return "menu", None
+
+    def handle_ai_game(num_players):
+        """Partie contre l'ordinateur : le joueur 1 est humain, les autres IA"""
+        screen_manager.switch_screen(
+            "local_game", num_players, ai_players=tuple(range(2, num_players + 1))
+        )
 
     # Register special handlers
-    screen_manager.register_screen("load_save", handle_load_save)
+    screen_manager.register_action("load_save", handle_load_save)
+    screen_manager.register_action("ai_game", handle_ai_game)
 
     # Start with the menu screen
     screen_manager.switch_screen("menu")
@@ -37,6 +71,24 @@ def run_game():
     # Run the game
     screen_manager.run()
 
+    # Make sure pending saves (and thumbnails) reach the disk before
+    # pygame shuts down
+    save_worker.close()
+    if client is not None:
+        client.close()
+
+    # Trace en cours (F4) : écrite avant de quitter
+    if profiler.tracing:
+        profiler.stop_trace()
+
+    pygame.quit()
+
 
 if __name__ == "__main__":
-    run_game()
+    parser = argparse.ArgumentParser(description="Roi & Compagnie")
+    parser.add_argument(
+        "--connect",
+        metavar="HOTE:PORT",
+        help="joue les nouvelles parties sur un serveur (python -m network.server)",
+    )
+    run_game(parser.parse_args().connect)
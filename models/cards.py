@@ -1,8 +1,18 @@
 import random
+from array import array
+from itertools import islice
 
 
 class Card:
-    """Classe de base pour toutes les cartes."""
+    """
+    Classe de base pour toutes les cartes.
+
+    Les cartes sont des poids mouches (__slots__) : une seule instance par
+    définition, partagée par toutes les parties via le registre `registry`,
+    qui lui donne aussi un identifiant entier stable (card_id).
+    """
+
+    __slots__ = ("card_id", "name", "color", "card_type")
 
     def __init__(self, name, color, card_type):
         """
@@ -10,10 +20,15 @@ class Card:
         color     : str ou None, couleur associée
         card_type : str, "habitant", "lieu" ou "penalite"
         """
+        self.card_id = None
         self.name = name
         self.color = color
         self.card_type = card_type
 
+    def definition(self):
+        """Tuple identifiant la carte, utilisé par le registre."""
+        return (self.card_type, self.name, self.color)
+
     def __repr__(self):
         return f"<{self.card_type.title()} {self.name} ({self.color})>"
 
@@ -25,6 +40,8 @@ class Card:
 class HabitantCard(Card):
     """Carte d'habitant, avec condition de combo de dés."""
 
+    __slots__ = ("combo",)
+
     def __init__(self, name, color, combo):
         """
         combo : dict {face: min_count, …}
@@ -42,6 +59,9 @@ class HabitantCard(Card):
                 return False
         return True
 
+    def definition(self):
+        return super().definition() + (tuple(sorted(self.combo.items())),)
+
     def to_dict(self):
         data = super().to_dict()
         data["combo"] = self.combo
@@ -49,12 +69,16 @@ class HabitantCard(Card):
 
     @classmethod
     def from_dict(cls, data):
-        return cls(data["name"], data["color"], data["combo"])
+        # JSON transforme les faces en chaînes : on les remet en int
+        combo = {int(face): needed for face, needed in data["combo"].items()}
+        return registry.intern(cls(data["name"], data["color"], combo))
 
 
 class LieuCard(Card):
     """Carte de lieu, éventuellement liée à un habitant préalable."""
 
+    __slots__ = ("prereq_habitant",)
+
     def __init__(self, name, color, prereq_habitant=None):
         """
         prereq_habitant : str ou None, nom d'habitant requis pour bonus.
@@ -62,6 +86,9 @@ class LieuCard(Card):
         super().__init__(name, color, "lieu")
         self.prereq_habitant = prereq_habitant
 
+    def definition(self):
+        return super().definition() + (self.prereq_habitant,)
+
     def to_dict(self):
         data = super().to_dict()
         data["prereq_habitant"] = self.prereq_habitant
@@ -69,12 +96,16 @@ class LieuCard(Card):
 
     @classmethod
     def from_dict(cls, data):
-        return cls(data["name"], data["color"], data.get("prereq_habitant"))
+        return registry.intern(
+            cls(data["name"], data["color"], data.get("prereq_habitant"))
+        )
 
 
 class PenaliteCard(Card):
     """Carte de pénalité (malus)."""
 
+    __slots__ = ("penalty_points",)
+
     def __init__(self, name, penalty_points):
         """
         penalty_points : int, nombre de points négatifs.
@@ -82,6 +113,9 @@ class PenaliteCard(Card):
         super().__init__(name, None, "penalite")
         self.penalty_points = penalty_points
 
+    def definition(self):
+        return super().definition() + (self.penalty_points,)
+
     def to_dict(self):
         data = super().to_dict()
         data["penalty_points"] = self.penalty_points
@@ -89,35 +123,182 @@ class PenaliteCard(Card):
 
     @classmethod
     def from_dict(cls, data):
-        return cls(data["name"], data["penalty_points"])
+        return registry.intern(cls(data["name"], data["penalty_points"]))
+
+
+CARD_CLASSES = {
+    "habitant": HabitantCard,
+    "lieu": LieuCard,
+    "penalite": PenaliteCard,
+}
+
+
+def card_from_dict(card_dict):
+    """Retrouve la carte (instance partagée) décrite par un dictionnaire sauvegardé."""
+    if card_dict is None:
+        return None
+    card_cls = CARD_CLASSES.get(card_dict["card_type"])
+    if card_cls is None:
+        return None
+    return card_cls.from_dict(card_dict)
+
+
+class CardRegistry:
+    """
+    Registre des cartes : chaque définition de carte a une seule instance
+    et un identifiant entier stable (ordre d'enregistrement).
+    """
+
+    def __init__(self):
+        self.cards = []  # card_id -> carte
+        self._by_definition = {}
+
+    def __len__(self):
+        return len(self.cards)
+
+    def __getitem__(self, card_id):
+        return self.cards[card_id]
+
+    def intern(self, card):
+        """
+        Retourne l'instance partagée équivalente à card, en enregistrant
+        card si sa définition est nouvelle.
+        """
+        if card.card_id is not None:
+            return card
+        definition = card.definition()
+        existing = self._by_definition.get(definition)
+        if existing is not None:
+            return existing
+        card.card_id = len(self.cards)
+        self.cards.append(card)
+        self._by_definition[definition] = card
+        return card
+
+    def ids(self, cards):
+        """Identifiants d'une liste de cartes (None reste None)."""
+        return [None if c is None else self.intern(c).card_id for c in cards]
+
+
+registry = CardRegistry()
 
 
 class Deck:
-    """Gère une pioche + défausse de cartes."""
+    """
+    Gère une pioche + défausse de cartes.
+
+    Les cartes ne sont jamais copiées : le deck ne manipule que leurs
+    identifiants (card_id du registre), dans des array d'entiers. La pioche
+    est l'ordre self._order lu à partir du curseur : piocher est en O(1),
+    et un instantané n'est qu'une copie de quelques octets.
+    """
 
     def __init__(self, cards):
         """
         cards : liste d'instances de Card.
         """
-        self.draw_pile = cards[:]  # copie
-        self.discard = []
-
-    def shuffle(self):
-        """Mélange la pioche."""
-        random.shuffle(self.draw_pile)
+        self.cards = registry.cards
+        self._order = array(
+            "H", [registry.intern(card).card_id for card in cards if card is not None]
+        )
+        self._cursor = 0
+        self._discard = array("H")
+
+    @property
+    def draw_pile(self):
+        """
+        Cartes restantes dans la pioche, du dessus vers le dessous (nouvelle
+        liste à chaque appel : iter_draw_pile() dans les boucles).
+        """
+        cards = self.cards
+        return [cards[i] for i in self._order[self._cursor :]]
+
+    def iter_draw_pile(self):
+        """Cartes de la pioche lues à partir du curseur, sans copie."""
+        return map(self.cards.__getitem__, islice(self._order, self._cursor, None))
+
+    @property
+    def discard(self):
+        """Cartes de la défausse, dans l'ordre où elles ont été défaussées."""
+        cards = self.cards
+        return [cards[i] for i in self._discard]
+
+    def remaining(self):
+        """Nombre de cartes dans la pioche."""
+        return len(self._order) - self._cursor
+
+    def _compact(self):
+        """Oublie les cartes déjà piochées (le curseur revient à 0)."""
+        if self._cursor:
+            del self._order[: self._cursor]
+            self._cursor = 0
+
+    def shuffle(self, rng=None):
+        """Mélange la pioche (avec rng, un random.Random, si fourni)."""
+        self._compact()
+        (rng or random).shuffle(self._order)
 
     def draw(self):
         """
-        Pioche la carte du dessus (index 0).
+        Pioche la carte du dessus.
         Retourne None si la pioche est vide.
         """
-        if not self.draw_pile:
+        if self._cursor >= len(self._order):
             return None
-        return self.draw_pile.pop(0)
+        card = self.cards[self._order[self._cursor]]
+        self._cursor += 1
+        return card
 
     def discard_card(self, card):
         """Ajoute une carte à la défausse."""
-        self.discard.append(card)
+        self._discard.append(registry.intern(card).card_id)
+
+    def reshuffle_discard(self, rng=None):
+        """Mélange la défausse et la place sous la pioche."""
+        self._compact()
+        order = self._order
+        start = len(order)
+        order.extend(self._discard)
+        del self._discard[:]
+        # Fisher-Yates sur la partie ajoutée seulement
+        randint = (rng or random).randint
+        for i in range(len(order) - 1, start, -1):
+            j = randint(start, i)
+            order[i], order[j] = order[j], order[i]
+
+    def copy(self):
+        """Copie indépendante du deck (les cartes restent partagées)."""
+        deck = Deck.__new__(Deck)
+        deck.cards = self.cards
+        deck._cursor = self._cursor
+        deck._order = self._order[:]
+        deck._discard = self._discard[:]
+        return deck
+
+    def snapshot(self):
+        """Instantané de l'état du deck (entiers uniquement)."""
+        return self._cursor, self._order[:], self._discard[:]
+
+    def restore(self, snapshot):
+        """Revient à un instantané pris par snapshot()."""
+        cursor, order, discard = snapshot
+        self._cursor = cursor
+        self._order = order[:]
+        self._discard = discard[:]
+
+    def ids(self):
+        """(pioche, défausse) sous forme d'identifiants, pour la sauvegarde binaire"""
+        return self._order[self._cursor :], self._discard[:]
+
+    @classmethod
+    def from_ids(cls, draw_ids, discard_ids=()):
+        """Deck reconstruit directement à partir d'identifiants (cf. ids)"""
+        deck = cls.__new__(cls)
+        deck.cards = registry.cards
+        deck._order = array("H", draw_ids)
+        deck._cursor = 0
+        deck._discard = array("H", discard_ids)
+        return deck
 
     def to_dict(self):
         """Convertit le deck en dictionnaire pour la sauvegarde"""
@@ -129,23 +310,12 @@ class Deck:
     @classmethod
     def from_dict(cls, data):
         """Crée un deck à partir d'un dictionnaire sauvegardé"""
-        from models.cards import HabitantCard, LieuCard, PenaliteCard
-
-        def create_card(card_dict):
-            if card_dict is None:
-                return None
-            card_type = card_dict["card_type"]
-            if card_type == "habitant":
-                return HabitantCard.from_dict(card_dict)
-            elif card_type == "lieu":
-                return LieuCard.from_dict(card_dict)
-            elif card_type == "penalite":
-                return PenaliteCard.from_dict(card_dict)
-            return None
-
-        deck = cls([])
-        deck.draw_pile = [create_card(card_dict) for card_dict in data["draw_pile"]]
-        deck.discard = [create_card(card_dict) for card_dict in data["discard"]]
+        draw_pile = [card_from_dict(card_dict) for card_dict in data["draw_pile"]]
+        discard = [card_from_dict(card_dict) for card_dict in data["discard"]]
+        deck = cls(draw_pile)
+        for card in discard:
+            if card is not None:
+                deck.discard_card(card)
         return deck
 
 
@@ -196,12 +366,9 @@ all_penalites = [
     PenaliteCard("Raid Barbare", 2),
 ]
 
-# ————— Création et mélange des decks pour chaque partie —————
-
-habitant_deck = Deck(all_habitants)
-lieu_deck = Deck(all_lieux)
-penalite_deck = Deck(all_penalites)
+# Identifiants stables : habitants, puis lieux, puis pénalités
+for card in all_habitants + all_lieux + all_penalites:
+    registry.intern(card)
 
-habitant_deck.shuffle()
-lieu_deck.shuffle()
-penalite_deck.shuffle()
+# Cartes du jeu de base ; au-delà, cartes inconnues lues dans d'anciennes sauvegardes
+CATALOG_SIZE = len(registry)
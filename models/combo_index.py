@@ -0,0 +1,154 @@
+from models.cards import HabitantCard, all_habitants
+from models.dice import FACES, NUM_DICE
+
+
+# Code d'un histogramme : sum(count[f] * 7**(f-1)), unique car count <= 6.
+FACE_WEIGHTS = {face: 7 ** (face - 1) for face in FACES}
+
+
+def all_histograms(num_dice=NUM_DICE):
+    """
+    Toutes les combinaisons (multi-ensembles) de num_dice dés à 6 faces,
+    sous forme de tuples (nb de 1, nb de 2, …, nb de 6).
+    462 pour 6 dés.
+    """
+
+    def rec(face, remaining):
+        if face == len(FACES) - 1:
+            yield (remaining,)
+            return
+        for n in range(remaining, -1, -1):
+            for rest in rec(face + 1, remaining - n):
+                yield (n,) + rest
+
+    return list(rec(0, num_dice))
+
+
+def histogram_code(histogram):
+    """Code entier d'un histogramme (tuple de 6 compteurs)."""
+    return sum(n * 7**i for i, n in enumerate(histogram))
+
+
+def combo_key(combo):
+    """Forme canonique d'un combo {face: min_count} (clés JSON acceptées)."""
+    return tuple(sorted((int(face), needed) for face, needed in combo.items()))
+
+
+class ComboIndex:
+    """
+    Table précalculée « lancer -> habitants satisfaits ».
+
+    Chaque combo distinct reçoit un bit. Pour chaque combo on garde le
+    bitset des 462 combinaisons de dés qui le satisfont, et pour chaque
+    combinaison le masque des combos satisfaits : tester une rangée de
+    cartes revient à une recherche dans une table puis un ET binaire.
+    """
+
+    def __init__(self, cards=()):
+        self.histograms = all_histograms()
+        self._position = {histogram_code(h): i for i, h in enumerate(self.histograms)}
+        self.combos = []  # bit -> combo canonique
+        self.combo_masks = []  # bit -> bitset des combinaisons satisfaisantes
+        self._bit_by_key = {}
+        self._bit_by_card = {}
+        self._roll_masks = [0] * len(self.histograms)  # combinaison -> bits
+        self._mask_by_code = dict.fromkeys(self._position, 0)
+        self._card_masks = {}  # carte -> 1 << bit de son combo (0 hors habitants)
+        for card in cards:
+            self.card_bit(card)
+
+    def __len__(self):
+        return len(self.combos)
+
+    def _add_combo(self, key):
+        bit = len(self.combos)
+        multisets = 0
+        for pos, histogram in enumerate(self.histograms):
+            if all(
+                1 <= face <= 6 and histogram[face - 1] >= needed
+                for face, needed in key
+            ):
+                multisets |= 1 << pos
+                self._roll_masks[pos] |= 1 << bit
+        self.combos.append(key)
+        self.combo_masks.append(multisets)
+        self._bit_by_key[key] = bit
+        self._mask_by_code = {
+            code: self._roll_masks[pos] for code, pos in self._position.items()
+        }
+        return bit
+
+    def card_bit(self, card):
+        """Bit du combo de la carte (ajouté à la table si nouveau)."""
+        bit = self._bit_by_card.get(card)
+        if bit is None:
+            key = combo_key(card.combo)
+            bit = self._bit_by_key.get(key)
+            if bit is None:
+                bit = self._add_combo(key)
+            self._bit_by_card[card] = bit
+        return bit
+
+    def card_mask(self, card):
+        """Bitset (sur les 462 combinaisons) des lancers satisfaisant la carte."""
+        return self.combo_masks[self.card_bit(card)]
+
+    def roll_mask(self, dice_values):
+        """
+        Masque des combos satisfaits par un lancer complet de 6 dés.
+        Retourne None si le lancer n'est pas complet (dés à 0, etc.).
+        """
+        if len(dice_values) != NUM_DICE:
+            return None
+        code = 0
+        try:
+            for value in dice_values:
+                code += FACE_WEIGHTS[value]
+        except KeyError:
+            return None
+        return self._mask_by_code[code]
+
+    def code_mask(self, code):
+        """Masque des combos satisfaits pour un code d'histogramme."""
+        return self._mask_by_code.get(code)
+
+    def histogram_mask(self, histogram):
+        """Masque des combos satisfaits par un histogramme de 6 dés."""
+        return self._mask_by_code.get(histogram_code(histogram))
+
+    def _card_mask(self, card):
+        mask = self._card_masks.get(card)
+        if mask is None:
+            mask = 1 << self.card_bit(card) if isinstance(card, HabitantCard) else 0
+            self._card_masks[card] = mask
+        return mask
+
+    def first_match(self, dice_values, cards, mask=None):
+        """
+        Retourne (index, carte) de la première carte de la rangée satisfaite
+        par le lancer, ou (None, None). mask peut être un masque déjà calculé
+        (roll_mask / histogram_mask) : chaque carte est testée par un ET
+        entre ce masque et le bit précalculé de son combo.
+        """
+        if mask is None:
+            mask = self.roll_mask(dice_values)
+        if mask is None:
+            # Lancer incomplet : vérification directe, carte par carte
+            for i, card in enumerate(cards):
+                if isinstance(card, HabitantCard) and card.is_combo_met(dice_values):
+                    return i, card
+            return None, None
+        card_masks = self._card_masks
+        for i, card in enumerate(cards):
+            card_mask = card_masks.get(card)
+            if card_mask is None:
+                # Carte encore inconnue : son combo n'est peut-être pas dans mask
+                if self._card_mask(card) and card.is_combo_met(dice_values):
+                    return i, card
+            elif mask & card_mask:
+                return i, card
+        return None, None
+
+
+# Index partagé, construit une seule fois pour le jeu de cartes standard
+default_index = ComboIndex(all_habitants)
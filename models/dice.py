@@ -1,5 +1,16 @@
 import random
 
+try:
+    import numpy as np
+except ImportError:  # NumPy est optionnel : repli en pur Python
+    np = None
+
+
+# Règles des dés, partagées par tout le jeu : six dés à six faces, jusqu'à
+# trois lancers par tour
+FACES = (1, 2, 3, 4, 5, 6)
+NUM_DICE = 6
+ROLLS_PER_TURN = 3
 
 class Dice:
     def __init__(self, sides, color):
@@ -12,5 +23,74 @@ class Dice:
     def get_sides(self):
         return self.sides
 
+    def roll(self, rng=None):
+        return (rng or random).randint(1, self.sides)
+
+
+class DicePool:
+    """
+    Ensemble de dés lancés ensemble.
+
+    roll_many(n) lance n fois tout le groupe d'un coup : un tableau NumPy
+    (n, nb_dés) si NumPy est disponible, sinon une liste de listes.
+    rng peut être une graine (int), un numpy.random.Generator ou un
+    random.Random (ce dernier force le mode pur Python).
+    """
+
+    def __init__(self, dice, rng=None, use_numpy=None):
+        self.dice = list(dice)
+        self.sides = max(d.get_sides() for d in self.dice)
+        self._sides = [d.get_sides() for d in self.dice]
+        if use_numpy is None:
+            use_numpy = np is not None and not isinstance(rng, random.Random)
+        if use_numpy and np is None:
+            raise ImportError("NumPy n'est pas installé")
+        self.use_numpy = use_numpy
+        self.seed(rng)
+
+    def __len__(self):
+        return len(self.dice)
+
+    def seed(self, rng=None):
+        """Réinitialise le générateur (graine, Generator ou Random)."""
+        if self.use_numpy:
+            self.rng = np.random.default_rng(rng)
+            self._high = np.array(self._sides) + 1
+        elif isinstance(rng, random.Random):
+            self.rng = rng
+        else:
+            self.rng = random.Random(rng)
+
     def roll(self):
-        return random.randint(1, self.sides)
+        """Un seul lancer de tout le groupe, sous forme de liste d'int."""
+        if self.use_numpy:
+            return self.rng.integers(1, self._high).tolist()
+        return [self.rng.randint(1, sides) for sides in self._sides]
+
+    def roll_many(self, n):
+        """n lancers de tout le groupe : tableau/liste de forme (n, nb_dés)."""
+        if self.use_numpy:
+            return self.rng.integers(1, self._high, size=(n, len(self.dice)), dtype=np.int8)
+        if len(set(self._sides)) == 1:
+            faces = range(1, self.sides + 1)
+            choices = self.rng.choices
+            k = len(self.dice)
+            return [choices(faces, k=k) for _ in range(n)]
+        return [self.roll() for _ in range(n)]
+
+    def histograms(self, rolls):
+        """
+        Histogrammes de faces de plusieurs lancers : forme (n, faces),
+        colonne 0 = nombre de 1, colonne 1 = nombre de 2, etc.
+        """
+        if self.use_numpy:
+            rolls = np.asarray(rolls)
+            faces = np.arange(1, self.sides + 1, dtype=rolls.dtype)
+            return (rolls[:, :, None] == faces).sum(axis=1, dtype=np.int8)
+        result = []
+        for throw in rolls:
+            counts = [0] * self.sides
+            for value in throw:
+                counts[value - 1] += 1
+            result.append(counts)
+        return result
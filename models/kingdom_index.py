@@ -0,0 +1,80 @@
+def card_points(card):
+    """Points d'une carte : habitant +1, lieu +3, pénalité –penalty_points."""
+    if card.card_type == "habitant":
+        return 1
+    if card.card_type == "lieu":
+        return 3
+    if card.card_type == "penalite":
+        return -card.penalty_points
+    return 0
+
+
+class KingdomIndex:
+    """
+    Scores et composition des royaumes, tenus à jour carte par carte.
+
+    Pour chaque joueur : score courant, nombre de cartes par type, par
+    couleur et par nom d'habitant, et ensemble des habitants possédés (pour
+    les prérequis des lieux). add() est en O(1) ; build() refait tout à
+    partir des royaumes (chargement, vérification).
+    """
+
+    __slots__ = ("scores", "types", "colors", "habitants", "owned_habitants")
+
+    def __init__(self, players):
+        # Simples dict {clé: nombre} : bien moins coûteux à créer que des Counter
+        self.scores = {p: 0 for p in players}
+        self.types = {p: {} for p in players}
+        self.colors = {p: {} for p in players}
+        self.habitants = {p: {} for p in players}
+        self.owned_habitants = {p: set() for p in players}
+
+    @classmethod
+    def build(cls, kingdoms):
+        """Index complet des royaumes {joueur: [cartes]}."""
+        index = cls(kingdoms)
+        for player, cards in kingdoms.items():
+            for card in cards:
+                index.add(player, card)
+        return index
+
+    def add(self, player, card):
+        """Ajoute une carte au royaume d'un joueur."""
+        if card is None:
+            return
+        card_type = card.card_type
+        self.scores[player] += card_points(card)
+        types = self.types[player]
+        types[card_type] = types.get(card_type, 0) + 1
+        if card.color is not None:
+            colors = self.colors[player]
+            colors[card.color] = colors.get(card.color, 0) + 1
+        if card_type == "habitant":
+            habitants = self.habitants[player]
+            habitants[card.name] = habitants.get(card.name, 0) + 1
+            self.owned_habitants[player].add(card.name)
+
+    def owns_habitant(self, player, name):
+        return name in self.owned_habitants[player]
+
+    def meets_prereq(self, player, lieu):
+        """Vrai si le joueur possède l'habitant requis par le lieu (ou s'il n'y en a pas)."""
+        return lieu.prereq_habitant is None or self.owns_habitant(
+            player, lieu.prereq_habitant
+        )
+
+    def copy(self):
+        clone = KingdomIndex.__new__(KingdomIndex)
+        clone.scores = dict(self.scores)
+        clone.types = {p: dict(c) for p, c in self.types.items()}
+        clone.colors = {p: dict(c) for p, c in self.colors.items()}
+        clone.habitants = {p: dict(c) for p, c in self.habitants.items()}
+        clone.owned_habitants = {p: set(s) for p, s in self.owned_habitants.items()}
+        return clone
+
+    def __eq__(self, other):
+        if not isinstance(other, KingdomIndex):
+            return NotImplemented
+        return all(
+            getattr(self, name) == getattr(other, name) for name in self.__slots__
+        )
@@ -0,0 +1,216 @@
+import atexit
+import hashlib
+import json
+import os
+from itertools import product
+from math import factorial
+
+from models.cards import HabitantCard, all_habitants
+from models.combo_index import ComboIndex, all_histograms, histogram_code
+from models.dice import NUM_DICE, ROLLS_PER_TURN
+
+REROLL_ALL = "reroll_all"
+OPTIMAL_HOLD = "optimal_hold"
+
+
+# ————— Tables de combinatoire (partagées entre toutes les cibles) —————
+
+
+def _outcomes(num_dice):
+    """[(code, probabilité)] des résultats d'un lancer de num_dice dés."""
+    total = 6**num_dice
+    result = []
+    for histogram in all_histograms(num_dice):
+        ways = factorial(num_dice)
+        for n in histogram:
+            ways //= factorial(n)
+        result.append((histogram_code(histogram), ways / total))
+    return result
+
+
+OUTCOMES = [_outcomes(m) for m in range(NUM_DICE + 1)]
+FULL_CODES = [code for code, _ in OUTCOMES[NUM_DICE]]
+# Dés gardés possibles : (code, nombre de dés à relancer)
+HELD = [
+    (histogram_code(h), NUM_DICE - size)
+    for size in range(NUM_DICE + 1)
+    for h in all_histograms(size)
+]
+# Sous-ensembles (dés que l'on peut garder) de chaque lancer complet
+SUBSETS = {
+    histogram_code(h): [
+        histogram_code(kept) for kept in product(*(range(n + 1) for n in h))
+    ]
+    for h in all_histograms(NUM_DICE)
+}
+
+
+def success_probability(target_codes, rolls=ROLLS_PER_TURN, policy=OPTIMAL_HOLD):
+    """
+    Probabilité d'obtenir un lancer de target_codes en `rolls` lancers.
+
+    REROLL_ALL   : on relance les 6 dés tant que la cible n'est pas atteinte.
+    OPTIMAL_HOLD : après chaque lancer on garde le sous-ensemble de dés qui
+                   maximise la probabilité finale (programmation dynamique
+                   sur les 462 combinaisons).
+    """
+    single = sum(p for code, p in OUTCOMES[NUM_DICE] if code in target_codes)
+    if policy == REROLL_ALL:
+        return 1.0 - (1.0 - single) ** rolls
+    if policy != OPTIMAL_HOLD:
+        raise ValueError(f"Politique inconnue : {policy}")
+
+    # value[c] : probabilité de réussite en voyant le lancer complet c,
+    # avec k relances restantes (k = 0 au départ).
+    value = {c: 1.0 if c in target_codes else 0.0 for c in FULL_CODES}
+    for _ in range(rolls - 1):
+        held_value = {
+            held: sum(p * value[held + code] for code, p in OUTCOMES[reroll])
+            for held, reroll in HELD
+        }
+        value = {
+            c: 1.0 if c in target_codes else max(held_value[h] for h in SUBSETS[c])
+            for c in FULL_CODES
+        }
+    return sum(p * value[code] for code, p in OUTCOMES[NUM_DICE])
+
+
+# ————— Cache par jeu de cartes —————
+
+
+class ComboProbabilities:
+    """
+    Probabilités exactes de réussite des combos d'un jeu de cartes.
+
+    Le premier calcul est sauvegardé sur disque (clé = définitions des
+    cartes) ; ensuite chaque réponse est une simple lecture de dictionnaire.
+    Les rangées calculées en cours de route marquent seulement le cache
+    comme modifié : il est écrit par save() / flush() (à la sortie pour
+    l'instance partagée), jamais pendant une décision.
+    """
+
+    CACHE_DIR = "cache"
+
+    def __init__(self, cards=all_habitants, rolls=ROLLS_PER_TURN, index=None):
+        self.cards = [c for c in cards if isinstance(c, HabitantCard)]
+        self.rolls = rolls
+        self.index = index or ComboIndex(self.cards)
+        self._codes = [histogram_code(h) for h in self.index.histograms]
+        self.cache_path = os.path.join(
+            self.CACHE_DIR, f"combo_probabilities_{self.cache_key()}.json"
+        )
+        self._combos = {}  # combo canonique -> {politique: probabilité}
+        self._rows = {}  # combos de la rangée -> {politique: probabilité}
+        self.dirty = False  # rangées pas encore écrites sur disque
+        if not self._load():
+            for card in self.cards:
+                self._combo_entry(card)
+            self.save()
+
+    def cache_key(self):
+        """Empreinte des définitions de cartes et du nombre de lancers."""
+        definition = sorted(
+            (c.name, c.color, self.index.combos[self.index.card_bit(c)])
+            for c in self.cards
+        )
+        raw = json.dumps([self.rolls, definition], ensure_ascii=False)
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()[:16]
+
+    def _target(self, mask):
+        return frozenset(
+            code for pos, code in enumerate(self._codes) if mask >> pos & 1
+        )
+
+    def _solve(self, mask):
+        target = self._target(mask)
+        return {
+            policy: success_probability(target, self.rolls, policy)
+            for policy in (REROLL_ALL, OPTIMAL_HOLD)
+        }
+
+    def _combo_entry(self, card):
+        key = self.index.combos[self.index.card_bit(card)]
+        entry = self._combos.get(key)
+        if entry is None:
+            entry = self._combos[key] = self._solve(self.index.card_mask(card))
+        return entry
+
+    def met_probability(self, card, policy=OPTIMAL_HOLD):
+        """Probabilité de satisfaire le combo de la carte dans le tour."""
+        return self._combo_entry(card)[policy]
+
+    def penalty_rate(self, row, policy=OPTIMAL_HOLD):
+        """
+        Probabilité de finir le tour sans satisfaire aucune carte de la
+        rangée visible (donc de prendre une pénalité).
+        """
+        cards = [c for c in row if isinstance(c, HabitantCard)]
+        key = tuple(sorted({self.index.combos[self.index.card_bit(c)] for c in cards}))
+        entry = self._rows.get(key)
+        if entry is None:
+            mask = 0
+            for card in cards:
+                mask |= self.index.card_mask(card)
+            entry = self._rows[key] = self._solve(mask)
+            self.dirty = True
+        return 1.0 - entry[policy]
+
+    def table(self):
+        """{nom de carte: {politique: probabilité}} pour tout le jeu."""
+        return {card.name: dict(self._combo_entry(card)) for card in self.cards}
+
+    # Sauvegarde : les combos sont des tuples, stockés en chaîne JSON
+    def save(self):
+        os.makedirs(self.CACHE_DIR, exist_ok=True)
+        data = {
+            "rolls": self.rolls,
+            "combos": [[list(map(list, k)), v] for k, v in self._combos.items()],
+            "rows": [
+                [[list(map(list, c)) for c in k], v] for k, v in self._rows.items()
+            ],
+        }
+        tmp_path = self.cache_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.cache_path)
+        self.dirty = False
+
+    def flush(self):
+        """Écrit le cache s'il a été modifié depuis la dernière sauvegarde."""
+        if self.dirty:
+            self.save()
+
+    def _load(self):
+        if not os.path.exists(self.cache_path):
+            return False
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return False
+
+        def as_key(combo):
+            return tuple(tuple(pair) for pair in combo)
+
+        self._combos = {as_key(k): v for k, v in data["combos"]}
+        self._rows = {tuple(as_key(c) for c in k): v for k, v in data["rows"]}
+        return True
+
+
+_default = None
+
+
+def default_probabilities():
+    """Instance partagée pour le jeu de cartes standard."""
+    global _default
+    if _default is None:
+        _default = ComboProbabilities()
+        atexit.register(_default.flush)
+    return _default
+
+
+if __name__ == "__main__":
+    probabilities = default_probabilities()
+    print(f"{'Habitant':<14}{'tout relancer':>15}{'garde optimale':>16}")
+    for name, entry in sorted(probabilities.table().items()):
+        print(f"{name:<14}{entry[REROLL_ALL]:>15.4f}{entry[OPTIMAL_HOLD]:>16.4f}")
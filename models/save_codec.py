@@ -0,0 +1,431 @@
+import argparse
+import json
+import struct
+import zlib
+from itertools import accumulate
+
+from models.cards import CATALOG_SIZE, Deck, card_from_dict, registry
+from models.kingdom_index import card_points
+
+
+MAGIC = b"RCSV"
+# v2 : définitions du jeu de base jointes ; v3 : position des générateurs ;
+# v4 : définitions rangées à part, une fois par dossier (catalog)
+VERSION = 4
+FLAG_ZLIB = 1
+
+# magic, version, options, crc32 du contenu tel qu'il est stocké
+HEADER = struct.Struct("<4sBBI")
+# Début du contenu : taille et empreinte du jeu de cartes, joueurs, joueur
+# courant, tour, numéro d'événement du journal
+GAME_HEADER = struct.Struct("<HIBBII")
+
+ACTION_CODES = {"roll": 0, "validate": 1, "next": 2}
+ACTION_NAMES = {code: name for name, code in ACTION_CODES.items()}
+MAX_ACTION_DICE = 63
+NEXT_CODE = ACTION_CODES["next"]
+NEXT = ("next",)
+DICE_COUNTS = bytes(head >> 2 for head in range(256))  # octet d'action -> nombre de dés
+
+# Les identifiants de cartes n'ont de sens qu'avec le même jeu de base : une
+# sauvegarde n'en garde que l'empreinte, les définitions étant écrites une
+# fois à côté (SaveManager.store_catalog). Si le jeu a changé depuis
+# (équilibrage…), les cartes sont retrouvées par définition.
+CATALOG_FINGERPRINT = zlib.crc32(
+    repr([registry[i].definition() for i in range(CATALOG_SIZE)]).encode("utf-8")
+)
+CATALOG_JSON = json.dumps(
+    [registry[i].to_dict() for i in range(CATALOG_SIZE)],
+    ensure_ascii=False,
+    separators=(",", ":"),
+).encode("utf-8")
+CATALOG_IDS = list(range(CATALOG_SIZE))
+
+
+class SaveFormatError(ValueError):
+    """Données qui ne sont pas une sauvegarde binaire lisible par cette version."""
+
+
+def is_binary(data):
+    return data[: len(MAGIC)] == MAGIC
+
+
+# ————— Écriture —————
+
+
+def write_varint(out, value):
+    """Entier positif sur 7 bits par octet (bit de poids fort : octet suivant)."""
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def write_bytes(out, raw):
+    """Bloc d'octets précédé de sa taille."""
+    write_varint(out, len(raw))
+    out += raw
+
+
+def zigzag(n):
+    """Entier signé -> positif : 0, -1, 1, -2… -> 0, 1, 2, 3…"""
+    return 2 * n if n >= 0 else -2 * n - 1
+
+
+def unzigzag(z):
+    return z >> 1 if z % 2 == 0 else -((z + 1) >> 1)
+
+
+class CardCodes:
+    """
+    Code d'une carte dans le fichier : 0 pour None, card_id + 1 pour le jeu
+    de base, au-delà pour les cartes « extra » décrites dans le fichier.
+    """
+
+    def __init__(self):
+        self.extras = []  # cartes hors jeu de base, dans l'ordre des codes
+        self._extra_codes = {}  # card_id -> code
+
+    def code(self, card_id):
+        if card_id < CATALOG_SIZE:
+            return card_id + 1
+        code = self._extra_codes.get(card_id)
+        if code is None:
+            self.extras.append(registry[card_id])
+            code = self._extra_codes[card_id] = CATALOG_SIZE + len(self.extras)
+        return code
+
+    def card_code(self, card):
+        return 0 if card is None else self.code(registry.intern(card).card_id)
+
+
+def write_piles(out, piles):
+    """Tailles des piles puis tous leurs codes, à la suite (varint)."""
+    for pile in piles:
+        write_varint(out, len(pile))
+    for pile in piles:
+        if not pile or max(pile) < 0x80:
+            out += bytes(pile)
+        else:
+            for code in pile:
+                write_varint(out, code)
+
+
+def encode_game(game, seq=0, compress=True):
+    """
+    Sauvegarde binaire d'une partie : identifiants de cartes en varint, par
+    pile, puis les actions. seq : numéro d'événement du journal (instantané).
+    Compressée par zlib si compress et si c'est plus petit.
+    """
+    codes = CardCodes()
+    piles = [
+        [codes.card_code(c) for c in game.visible_habitants],
+        [codes.card_code(c) for c in game.visible_lieux],
+    ]
+    for deck in (game.hab_deck, game.lieu_deck, game.pen_deck):
+        for ids in deck.ids():
+            piles.append([codes.code(i) for i in ids])
+    for player in range(1, game.num_players + 1):
+        piles.append([codes.card_code(c) for c in game.kingdoms.get(player, ())])
+
+    out = bytearray(
+        GAME_HEADER.pack(
+            CATALOG_SIZE,
+            CATALOG_FINGERPRINT,
+            game.num_players,
+            game.current_player,
+            game.turn,
+            seq,
+        )
+    )
+    # Graine : 0 si absente, sinon zigzag (graines négatives acceptées) + 1
+    write_varint(out, 0 if game.seed is None else zigzag(game.seed) + 1)
+    # Tirages de rng et dice_rng depuis la graine : 0 si inconnus, sinon + 1
+    for draws in game.rng_draws():
+        write_varint(out, 0 if draws is None else draws + 1)
+
+    write_varint(out, len(codes.extras))
+    for card in codes.extras:
+        write_bytes(out, json.dumps(card.to_dict(), ensure_ascii=False).encode("utf-8"))
+
+    write_piles(out, piles)
+
+    # Actions : un octet chacune (code + nombre de dés << 2), puis tous les dés
+    write_varint(out, len(game.actions))
+    dice = bytearray()
+    for action in game.actions:
+        values = action[1] if len(action) > 1 else ()
+        if len(values) > MAX_ACTION_DICE:
+            raise ValueError(f"trop de dés dans une action : {len(values)}")
+        out.append(ACTION_CODES[action[0]] | len(values) << 2)
+        dice += bytes(values)
+    out += dice
+
+    flags = 0
+    payload = bytes(out)
+    if compress:
+        packed = zlib.compress(payload, 6)
+        if len(packed) < len(payload):
+            payload, flags = packed, FLAG_ZLIB
+    return HEADER.pack(MAGIC, VERSION, flags, zlib.crc32(payload)) + payload
+
+
+# ————— Lecture —————
+
+
+class Reader:
+    __slots__ = ("data", "pos")
+
+    def __init__(self, data):
+        self.data = data
+        self.pos = 0
+
+    def varint(self):
+        data, pos = self.data, self.pos
+        result = shift = 0
+        while True:
+            byte = data[pos]
+            pos += 1
+            result |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                break
+            shift += 7
+        self.pos = pos
+        return result
+
+    def take(self, size):
+        start = self.pos
+        self.pos += size
+        if self.pos > len(self.data):
+            raise IndexError("données tronquées")
+        return self.data[start : self.pos]
+
+    def varints(self, count):
+        chunk = self.data[self.pos : self.pos + count]
+        if len(chunk) == count and (not count or max(chunk) < 0x80):
+            # Cas courant : des valeurs < 128, un octet chacune
+            self.pos += count
+            return chunk
+        return [self.varint() for _ in range(count)]
+
+    def piles(self, count):
+        """Les codes de count piles écrites par write_piles()."""
+        sizes = self.varints(count)
+        codes = self.varints(sum(sizes))
+        piles = []
+        start = 0
+        for size in sizes:
+            piles.append(codes[start : start + size])
+            start += size
+        return piles
+
+
+def unpack(data):
+    """
+    (version, contenu décompressé) d'une sauvegarde binaire, après
+    vérification.
+    """
+    if len(data) < HEADER.size or not is_binary(data):
+        raise SaveFormatError("pas une sauvegarde binaire")
+    _, version, flags, crc = HEADER.unpack_from(data)
+    if not 1 <= version <= VERSION:
+        raise SaveFormatError(f"version de sauvegarde inconnue : {version}")
+    payload = memoryview(data)[HEADER.size :]
+    if zlib.crc32(payload) != crc:
+        raise SaveFormatError("sauvegarde corrompue (crc)")
+    if flags & FLAG_ZLIB:
+        try:
+            return version, zlib.decompress(payload)
+        except zlib.error as exc:
+            raise SaveFormatError(f"sauvegarde illisible ({exc})") from exc
+    return version, bytes(payload)
+
+
+_catalog_ids = {}  # définitions d'un ancien jeu de base -> card_id actuels
+
+
+def catalog_ids(raw):
+    """
+    card_id actuel de chaque carte d'un jeu de base sauvegardé (définitions
+    JSON). Une carte modifiée depuis est retrouvée telle qu'elle était
+    (carte « extra » du registre) : la partie reprend à l'identique.
+    """
+    ids = _catalog_ids.get(raw)
+    if ids is None:
+        try:
+            definitions = json.loads(raw.decode("utf-8"))
+        except ValueError as exc:
+            raise SaveFormatError(f"jeu de cartes illisible ({exc})") from exc
+        cards = [card_from_dict(card_dict) for card_dict in definitions]
+        ids = _catalog_ids[raw] = [None if c is None else c.card_id for c in cards]
+    return ids
+
+
+def read_header(payload, version=VERSION, catalogs=None):
+    """
+    (Reader placé après l'en-tête de partie, champs de GAME_HEADER,
+    card_id des cartes du jeu de base du fichier).
+
+    catalogs(taille, empreinte) -> définitions JSON d'un autre jeu de base
+    (cf. SaveManager.read_catalog), ou None si elles sont introuvables.
+    """
+    header = GAME_HEADER.unpack_from(payload)
+    same_catalog = header[0] == CATALOG_SIZE and header[1] == CATALOG_FINGERPRINT
+    reader = Reader(payload)
+    reader.pos = GAME_HEADER.size
+    if 2 <= version <= 3:
+        # Définitions jointes à la sauvegarde
+        raw = reader.take(reader.varint())
+        base = CATALOG_IDS if same_catalog else catalog_ids(raw)
+    elif same_catalog:
+        base = CATALOG_IDS
+    else:
+        raw = catalogs(header[0], header[1]) if catalogs else None
+        if raw is None:
+            raise SaveFormatError("sauvegarde écrite avec un autre jeu de cartes")
+        base = catalog_ids(raw)
+    return reader, header, base
+
+
+def read_cards(reader, base=CATALOG_IDS):
+    """
+    Cartes « extra » du fichier. Retourne les tables code -> card_id et
+    code -> carte (code 0 : pas de carte).
+    """
+    ids = [None, *base]
+    for _ in range(reader.varint()):
+        card_dict = json.loads(reader.take(reader.varint()).decode("utf-8"))
+        card = card_from_dict(card_dict)
+        ids.append(None if card is None else card.card_id)
+    cards = registry.cards
+    return ids, [None if i is None else cards[i] for i in ids]
+
+
+def decode_game(data, catalogs=None):
+    """
+    Partie lue depuis encode_game(). Retourne (partie, seq).
+    catalogs : cf. read_header.
+    """
+    from controller.game_controller import GameController
+
+    version, payload = unpack(data)
+    try:
+        reader, header, base = read_header(payload, version, catalogs)
+        _, _, num_players, current_player, turn, seq = header
+        seed = reader.varint()
+        seed = None if seed == 0 else unzigzag(seed - 1)
+        draws = (None, None)
+        if version >= 3:
+            draws = tuple(
+                None if d == 0 else d - 1 for d in (reader.varint(), reader.varint())
+            )
+        ids, table = read_cards(reader, base)
+
+        piles = reader.piles(8 + num_players)
+        visible_habitants = [table[c] for c in piles[0]]
+        visible_lieux = [table[c] for c in piles[1]]
+        hab_deck, lieu_deck, pen_deck = (
+            Deck.from_ids([ids[c] for c in piles[i]], [ids[c] for c in piles[i + 1]])
+            for i in (2, 4, 6)
+        )
+        kingdoms = {p: [table[c] for c in piles[7 + p]] for p in range(1, num_players + 1)}
+
+        heads = reader.take(reader.varint())
+        offsets = list(accumulate(heads.translate(DICE_COUNTS), initial=0))
+        dice = reader.take(offsets[-1])
+        names = ACTION_NAMES
+        actions = [
+            NEXT if head == NEXT_CODE else (names[head & 3], tuple(dice[start:end]))
+            for head, start, end in zip(heads, offsets, offsets[1:])
+        ]
+    except (IndexError, KeyError, TypeError, struct.error) as exc:
+        raise SaveFormatError(f"sauvegarde illisible ({exc!r})") from exc
+
+    game = GameController.restore(
+        num_players=num_players,
+        current_player=current_player,
+        turn=turn,
+        kingdoms=kingdoms,
+        visible_habitants=visible_habitants,
+        visible_lieux=visible_lieux,
+        hab_deck=hab_deck,
+        lieu_deck=lieu_deck,
+        pen_deck=pen_deck,
+        seed=seed,
+        actions=actions,
+        draws=draws,
+    )
+    return game, seq
+
+
+def read_info(data, catalogs=None):
+    """
+    Résumé d'une sauvegarde binaire (cf. SaveManager.save_info) sans
+    reconstruire la partie, pour remplir l'index des sauvegardes.
+    """
+    version, payload = unpack(data)
+    try:
+        reader, header, base = read_header(payload, version, catalogs)
+        _, _, num_players, current_player, turn, _ = header
+        for _ in range(3 if version >= 3 else 1):
+            reader.varint()  # graine, tirages des générateurs
+        _, table = read_cards(reader, base)
+        piles = reader.piles(8 + num_players)
+    except (IndexError, KeyError, TypeError, struct.error) as exc:
+        raise SaveFormatError(f"sauvegarde illisible ({exc!r})") from exc
+    points = [0 if card is None else card_points(card) for card in table]
+    return {
+        "num_players": num_players,
+        "current_player": current_player,
+        "scores": {
+            p: sum(points[c] for c in piles[7 + p]) for p in range(1, num_players + 1)
+        },
+        "turn": turn,
+    }
+
+
+# ————— Conversion des anciennes sauvegardes —————
+
+
+def main(argv=None):
+    from models.save_manager import SaveManager
+
+    parser = argparse.ArgumentParser(description="Sauvegardes binaires : conversion et export.")
+    parser.add_argument("--dir", default=SaveManager.SAVES_DIR, help="dossier des sauvegardes")
+    commands = parser.add_subparsers(dest="command", required=True)
+    convert = commands.add_parser("convert", help="convertit les sauvegardes JSON en binaire")
+    convert.add_argument("names", nargs="*", help="sauvegardes (défaut : toutes)")
+    convert.add_argument("--keep-json", action="store_true", help="garde les fichiers .json")
+    export = commands.add_parser("export", help="exporte une sauvegarde en JSON")
+    export.add_argument("name")
+    export.add_argument("-o", "--output", help="fichier JSON (défaut : NOM.json)")
+    args = parser.parse_args(argv)
+    SaveManager.SAVES_DIR = args.dir
+
+    if args.command == "export":
+        output = args.output or args.name + SaveManager.JSON_EXT
+        if not SaveManager.export_json(args.name, output):
+            parser.error(f"sauvegarde introuvable : {args.name}")
+        print(output)
+        return
+
+    names = args.names or [save["name"] for save in SaveManager.get_save_files()]
+    before = after = converted = 0
+    for name in names:
+        try:
+            sizes = SaveManager.convert_save(name, keep_json=args.keep_json)
+        except (OSError, ValueError, KeyError, TypeError) as exc:
+            print(f"{name} : erreur ({exc})")
+            continue
+        if sizes is None:
+            continue
+        converted += 1
+        before += sizes[0]
+        after += sizes[1]
+        print(f"{name} : {sizes[0]} -> {sizes[1]} octets")
+    ratio = f", {before / after:.1f}x plus petit" if after else ""
+    print(f"{converted} sauvegarde(s) convertie(s) sur {len(names)}{ratio}")
+
+
+if __name__ == "__main__":
+    main()
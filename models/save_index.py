@@ -0,0 +1,199 @@
+import json
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+
+
+class SaveIndex:
+    """
+    Index persistant des sauvegardes (SQLite).
+
+    Il est mis à jour à chaque sauvegarde / suppression et garde, pour chaque
+    partie, les informations affichées par l'écran de chargement. Le dossier
+    n'est relu que si sa date de modification a changé (fichier ajouté,
+    supprimé ou renommé par un autre programme) ou si une écriture a été
+    signalée par changed() ; seuls les fichiers dont la date a changé sont
+    alors relus. Un fichier réécrit sur place par un autre programme n'est
+    donc vu qu'au prochain changement du dossier.
+
+    La base est rangée dans un sous-dossier pour que ses propres écritures
+    ne modifient pas la date du dossier des sauvegardes.
+    """
+
+    INDEX_DIR = ".index"
+    FILENAME = "saves.sqlite3"
+    ORDERS = {"mtime": "mtime", "name": "name", "turn": "turn"}
+
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, saves_dir):
+        self.saves_dir = saves_dir
+        index_dir = os.path.join(saves_dir, self.INDEX_DIR)
+        os.makedirs(index_dir, exist_ok=True)
+        self.path = os.path.join(index_dir, self.FILENAME)
+        # Utilisé aussi par le thread de sauvegarde : accès protégé par un verrou
+        self._lock = threading.RLock()
+        self._changed = False  # écriture signalée depuis le dernier passage
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS saves (
+                name TEXT PRIMARY KEY,
+                path TEXT NOT NULL,
+                mtime REAL NOT NULL,
+                num_players INTEGER,
+                current_player INTEGER,
+                scores TEXT,
+                turn INTEGER
+            );
+            DROP INDEX IF EXISTS saves_mtime;
+            CREATE INDEX IF NOT EXISTS saves_mtime_name ON saves (mtime, name);
+            CREATE INDEX IF NOT EXISTS saves_turn_name ON saves (turn, name);
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value);
+            """
+        )
+        self._db.commit()
+
+    @classmethod
+    def for_dir(cls, saves_dir):
+        """Index partagé d'un dossier de sauvegardes."""
+        key = os.path.abspath(saves_dir)
+        with cls._instances_lock:
+            index = cls._instances.get(key)
+            if index is None:
+                index = cls._instances[key] = cls(saves_dir)
+            return index
+
+    # ————— Date du dossier —————
+
+    def _dir_mtime(self):
+        return os.stat(self.saves_dir).st_mtime_ns
+
+    def _stored_dir_mtime(self):
+        row = self._db.execute("SELECT value FROM meta WHERE key='dir_mtime'").fetchone()
+        return row[0] if row else None
+
+    def _store_dir_mtime(self, value):
+        self._db.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES ('dir_mtime', ?)", (value,)
+        )
+
+    def is_fresh(self):
+        """Vrai si le dossier n'a pas changé depuis la dernière mise à jour."""
+        with self._lock:
+            return not self._changed and self._stored_dir_mtime() == self._dir_mtime()
+
+    def changed(self):
+        """Signale une écriture dont l'index n'a pas été informé (relecture au prochain refresh)."""
+        with self._lock:
+            self._changed = True
+
+    @contextmanager
+    def writing(self):
+        """
+        À utiliser autour d'une écriture de sauvegarde par le jeu : si l'index
+        était à jour avant, il le reste après (pas de relecture du dossier).
+        """
+        with self._lock:
+            fresh = self.is_fresh()
+            yield
+            if fresh:
+                self._store_dir_mtime(self._dir_mtime())
+                self._db.commit()
+
+    # ————— Mise à jour —————
+
+    @staticmethod
+    def _row(name, path, mtime, info):
+        return (
+            name,
+            path,
+            mtime,
+            info["num_players"],
+            info["current_player"],
+            json.dumps(info["scores"]),
+            info["turn"],
+        )
+
+    def update(self, name, path, mtime, info):
+        """Ajoute ou met à jour une sauvegarde. info : cf. SaveManager.save_info."""
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO saves VALUES (?, ?, ?, ?, ?, ?, ?)",
+                self._row(name, path, mtime, info),
+            )
+            self._db.commit()
+
+    def remove(self, name):
+        with self._lock:
+            self._db.execute("DELETE FROM saves WHERE name = ?", (name,))
+            self._db.commit()
+
+    def refresh(self, scan, read_info, force=False):
+        """
+        Remet l'index en accord avec le dossier si celui-ci a changé ou si
+        une écriture a été signalée (force : toujours). Toute la mise à jour
+        est faite en une seule transaction. Vrai si le dossier a été parcouru.
+
+        scan()                 -> {nom: (chemin, mtime)} des sauvegardes présentes
+        read_info(nom, chemin) -> informations de la sauvegarde, ou None si illisible
+        """
+        with self._lock:
+            dir_mtime = self._dir_mtime()
+            if not force and not self._changed and self._stored_dir_mtime() == dir_mtime:
+                return False
+            self._changed = False
+            known = dict(self._db.execute("SELECT name, mtime FROM saves"))
+            present = scan()
+            removed = [(name,) for name in known.keys() - present.keys()]
+            rows = []
+            for name, (path, mtime) in present.items():
+                if known.get(name) == mtime:
+                    continue
+                info = read_info(name, path)
+                if info is None:
+                    removed.append((name,))
+                else:
+                    rows.append(self._row(name, path, mtime, info))
+            with self._db:
+                self._db.executemany("DELETE FROM saves WHERE name = ?", removed)
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO saves VALUES (?, ?, ?, ?, ?, ?, ?)", rows
+                )
+                self._store_dir_mtime(dir_mtime)
+            return True
+
+    # ————— Requêtes —————
+
+    def count(self):
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM saves").fetchone()[0]
+
+    def query(self, offset=0, limit=None, order="mtime", descending=True):
+        """Sauvegardes triées, éventuellement par page (offset, limit)."""
+        column = self.ORDERS[order]
+        direction = "DESC" if descending else "ASC"
+        with self._lock:
+            rows = self._db.execute(
+                f"SELECT name, path, mtime, num_players, current_player, scores, turn "
+                f"FROM saves ORDER BY {column} {direction}, name {direction} LIMIT ? OFFSET ?",
+                (-1 if limit is None else limit, offset),
+            ).fetchall()
+        return [
+            {
+                "name": name,
+                "date": datetime.fromtimestamp(mtime).strftime("%Y-%m-%d %H:%M:%S"),
+                "path": path,
+                "mtime": mtime,
+                "num_players": num_players,
+                "current_player": current_player,
+                "scores": {int(p): s for p, s in json.loads(scores).items()},
+                "turn": turn,
+            }
+            for name, path, mtime, num_players, current_player, scores, turn in rows
+        ]
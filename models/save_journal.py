@@ -0,0 +1,242 @@
+import json
+import os
+from functools import partial
+
+from config import settings
+from models.save_codec import encode_game
+from models.save_manager import SaveManager
+
+
+def fsync_directory(path):
+    """Rend durable un renommage dans le dossier (sans effet sous Windows)."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def write_atomic(path, data):
+    """Écrit un fichier en entier : fichier temporaire, fsync puis renommage."""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    fsync_directory(os.path.dirname(path) or ".")
+
+
+class SaveJournal:
+    """
+    Sauvegarde par journal d'événements.
+
+    Chaque lancer, validation et changement de tour est ajouté en fin de
+    fichier <nom>.journal (une ligne JSON numérotée). Tous les
+    SNAPSHOT_INTERVAL événements, l'état complet est écrit de façon atomique
+    dans <nom>.snapshot (format binaire, models.save_codec) ; le chargement
+    repart de cet instantané et rejoue les événements suivants.
+
+    Avec un SaveWorker (worker), toutes les écritures disque sont faites,
+    dans l'ordre, par le thread de sauvegarde : le thread principal ne fait
+    que préparer les lignes et des copies légères de la partie.
+    """
+
+    JOURNAL_EXT = ".journal"
+    SNAPSHOT_EXT = ".snapshot"
+
+    def __init__(self, game, save_name, seq=0, snapshot_seq=0, worker=None):
+        self.game = game
+        self.worker = worker
+        self.save_name = save_name
+        self.seq = seq  # numéro du dernier événement écrit
+        self.snapshot_seq = snapshot_seq  # dernier événement inclus dans l'instantané
+        self.snapshot_interval = settings.JOURNAL_SNAPSHOT_INTERVAL
+        self.journal_path, self.snapshot_path = SaveJournal.paths(save_name)
+        self._file = open(self.journal_path, "a", encoding="utf-8")
+        self._index = SaveManager.index()
+
+    @staticmethod
+    def paths(save_name):
+        base = os.path.join(SaveManager.SAVES_DIR, save_name)
+        return base + SaveJournal.JOURNAL_EXT, base + SaveJournal.SNAPSHOT_EXT
+
+    @staticmethod
+    def mtime(save_name):
+        """Date de la dernière écriture (instantané ou journal)"""
+        return max(
+            os.path.getmtime(path)
+            for path in SaveJournal.paths(save_name)
+            if os.path.exists(path)
+        )
+
+    @staticmethod
+    def exists(save_name):
+        return os.path.exists(SaveJournal.paths(save_name)[1])
+
+    @classmethod
+    def create(cls, game, save_name=None, worker=None):
+        """
+        Démarre le journal d'une partie : instantané initial + journal vide.
+        FileExistsError si une sauvegarde journalisée porte déjà ce nom.
+        """
+        SaveManager.ensure_saves_directory()
+        if save_name is None:
+            save_name = SaveManager.new_save_name()
+        journal_path, snapshot_path = cls.paths(save_name)
+        if os.path.exists(snapshot_path):
+            raise FileExistsError(f"sauvegarde déjà existante : {save_name}")
+        with SaveManager.index().writing():
+            open(journal_path, "x").close()  # jamais celui d'une autre partie
+            journal = cls(game, save_name, worker=worker)
+            journal.write_snapshot(notify=True)
+        return journal
+
+    # ————— Écriture (thread principal) —————
+
+    def _io(self, job, key=None, notify=False):
+        """Exécute une écriture disque, directement ou via le thread de sauvegarde."""
+        if self.worker is None:
+            job()
+        elif key is None:
+            self.worker.run(job, notify)
+        else:
+            self.worker.submit(key, job, notify)
+
+    def append(self, event_type, sync=False, **data):
+        """Ajoute un événement au journal (fsync si sync=True)."""
+        self.seq += 1
+        event = {"seq": self.seq, "type": event_type, **data}
+        self._io(partial(self._write_line, json.dumps(event, separators=(",", ":"))))
+        if self.seq - self.snapshot_seq >= self.snapshot_interval:
+            self.write_snapshot()
+        elif sync:
+            self.checkpoint()
+
+    def checkpoint(self, notify=False):
+        """Force l'écriture disque du journal et met à jour l'index."""
+        key = ("save" if notify else "autosave", self.save_name)
+        self._io(partial(self._checkpoint, self.game.snapshot()), key, notify)
+        return self.snapshot_path
+
+    def write_snapshot(self, notify=False):
+        """
+        Écrit l'état complet (atomique) puis vide le journal. Si l'on
+        s'arrête entre les deux, les événements déjà inclus dans
+        l'instantané sont ignorés au chargement grâce à leur numéro.
+        """
+        self.snapshot_seq = self.seq
+        job = partial(self._write_snapshot, self.game.snapshot(), self.seq)
+        self._io(job, notify=notify)
+
+    def close(self):
+        self._io(self._close)
+
+    # ————— Écriture (thread de sauvegarde) —————
+
+    def _write_line(self, line):
+        self._file.write(line + "\n")
+        self._file.flush()
+        # Le journal change de date sans que le dossier change : l'index le relira
+        self._index.changed()
+
+    def sync(self):
+        """Force l'écriture sur disque des événements déjà ajoutés."""
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        return self.snapshot_path
+
+    def _checkpoint(self, game):
+        self.sync()
+        SaveManager.index_save(
+            self.save_name,
+            self.snapshot_path,
+            game,
+            mtime=SaveJournal.mtime(self.save_name),
+        )
+
+    def _write_snapshot(self, game, seq):
+        self.sync()
+        data = encode_game(game, seq)
+        with SaveManager.index().writing():
+            SaveManager.store_catalog()
+            write_atomic(self.snapshot_path, data)
+            self._file.seek(0)
+            self._file.truncate()
+            self._checkpoint(game)
+
+    def _close(self):
+        if not self._file.closed:
+            self.sync()
+            self._file.close()
+
+    # ————— Lecture —————
+
+    @staticmethod
+    def read_events(journal_path, after_seq):
+        """Événements du journal postérieurs à after_seq."""
+        events = []
+        if not os.path.exists(journal_path):
+            return events
+        with open(journal_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    break  # dernière ligne tronquée par un arrêt brutal
+                if event["seq"] > after_seq:
+                    events.append(event)
+        return events
+
+    @staticmethod
+    def replay(game, events):
+        """Rejoue des événements sur une partie (sans les journaliser)."""
+        dice_draws = None
+        for event in events:
+            if event["type"] == "validate":
+                game.recruit_or_penalize(event["dice"])
+            elif event["type"] == "next":
+                game.next_player()
+            elif event["type"] == "roll":
+                # L'état de la partie ne change qu'à la validation ; seuls les
+                # dés en sont à ce lancer
+                game.actions.append(("roll", tuple(event["dice"])))
+                dice_draws = event.get("draws", dice_draws)
+        if dice_draws is not None:
+            game.set_dice_draws(dice_draws)
+
+    @classmethod
+    def read(cls, save_name):
+        """
+        Reconstruit la partie sans reprendre le journal.
+        Retourne (partie, événements rejoués, numéro de l'instantané).
+        """
+        journal_path, snapshot_path = cls.paths(save_name)
+        # Instantané binaire, ou JSON s'il a été écrit par une version antérieure
+        game, snapshot_seq = SaveManager.read_file(snapshot_path)
+
+        events = cls.read_events(journal_path, snapshot_seq)
+        cls.replay(game, events)
+        return game, events, snapshot_seq
+
+    @classmethod
+    def load(cls, save_name):
+        """Recharge une partie et reprend son journal."""
+        game, events, snapshot_seq = cls.read(save_name)
+        seq = events[-1]["seq"] if events else snapshot_seq
+
+        # Réécrit le journal sans une éventuelle ligne tronquée
+        journal_path = cls.paths(save_name)[0]
+        lines = "".join(
+            json.dumps(event, separators=(",", ":")) + "\n" for event in events
+        )
+        with SaveManager.index().writing():
+            write_atomic(journal_path, lines.encode("utf-8"))
+            game.journal = cls(game, save_name, seq=seq, snapshot_seq=snapshot_seq)
+            game.journal.checkpoint()
+        return game
@@ -1,10 +1,28 @@
 import json
 import os
+import threading
 from datetime import datetime
 
+from models.save_codec import (
+    CATALOG_FINGERPRINT,
+    CATALOG_JSON,
+    CATALOG_SIZE,
+    decode_game,
+    encode_game,
+    is_binary,
+    read_info,
+)
+from models.save_index import SaveIndex
+
 
 class SaveManager:
     SAVES_DIR = "saves"
+    BINARY_EXT = ".sav"  # format binaire (models.save_codec)
+    JSON_EXT = ".json"  # ancien format, gardé pour l'export
+    CATALOGS_DIR = ".catalogs"  # définitions des jeux de base des sauvegardes
+
+    _catalogs_stored = set()
+    _catalogs_lock = threading.Lock()
 
     @staticmethod
     def ensure_saves_directory():
@@ -12,16 +30,79 @@ class SaveManager:
             os.makedirs(SaveManager.SAVES_DIR)
 
     @staticmethod
-    def save_game(game_controller, save_name=None):
-        """Sauvegarde l'état du jeu dans un fichier JSON"""
+    def index():
+        """Index des sauvegardes du dossier courant"""
         SaveManager.ensure_saves_directory()
+        return SaveIndex.for_dir(SaveManager.SAVES_DIR)
 
-        if save_name is None:
-            save_name = f"save_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    @staticmethod
+    def save_info(game_controller):
+        """Résumé d'une partie affiché dans la liste des sauvegardes"""
+        return {
+            "num_players": game_controller.num_players,
+            "current_player": game_controller.current_player,
+            "scores": game_controller.calculate_scores(),
+            "turn": game_controller.turn,
+        }
+
+    @staticmethod
+    def index_save(save_name, file_path, game_controller, mtime=None):
+        """Met à jour l'index après l'écriture d'une sauvegarde"""
+        if mtime is None:
+            mtime = os.path.getmtime(file_path)
+        SaveManager.index().update(
+            save_name, file_path, mtime, SaveManager.save_info(game_controller)
+        )
+
+    @staticmethod
+    def thumbnail_path(save_name):
+        """Miniature PNG du plateau, écrite à côté de la sauvegarde (view.thumbnails)"""
+        return os.path.join(SaveManager.SAVES_DIR, f"{save_name}.png")
+
+    @staticmethod
+    def catalog_path(size, fingerprint):
+        return os.path.join(
+            SaveManager.SAVES_DIR, SaveManager.CATALOGS_DIR, f"{size}_{fingerprint:08x}.json"
+        )
+
+    @staticmethod
+    def store_catalog():
+        """
+        Écrit, une fois par dossier, les définitions du jeu de base actuel :
+        les sauvegardes n'en gardent que l'empreinte (models.save_codec).
+        """
+        path = SaveManager.catalog_path(CATALOG_SIZE, CATALOG_FINGERPRINT)
+        if path in SaveManager._catalogs_stored:
+            return
+        from models.save_journal import write_atomic
 
-        save_data = {
+        # Appelé aussi par le thread de sauvegarde
+        with SaveManager._catalogs_lock:
+            if not os.path.exists(path):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                write_atomic(path, CATALOG_JSON)
+            SaveManager._catalogs_stored.add(path)
+
+    @staticmethod
+    def read_catalog(size, fingerprint):
+        """Définitions d'un jeu de base écrites par store_catalog(), ou None."""
+        try:
+            with open(SaveManager.catalog_path(size, fingerprint), "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    @staticmethod
+    def new_save_name():
+        return f"save_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+
+    @staticmethod
+    def game_to_dict(game_controller):
+        """État complet de la partie sous forme de dictionnaire sérialisable"""
+        return {
             "num_players": game_controller.num_players,
             "current_player": game_controller.current_player,
+            "turn": game_controller.turn,
             "kingdoms": {
                 player: [card.to_dict() if card else None for card in cards]
                 for player, cards in game_controller.kingdoms.items()
@@ -37,79 +118,214 @@ class SaveManager:
             "hab_deck": game_controller.hab_deck.to_dict(),
             "lieu_deck": game_controller.lieu_deck.to_dict(),
             "pen_deck": game_controller.pen_deck.to_dict(),
+            # Graine + actions : de quoi rejouer la partie (controller.replay)
+            "seed": game_controller.seed,
+            "actions": game_controller.actions,
+            # Position des générateurs (tirages depuis la graine)
+            "draws": list(game_controller.rng_draws()),
         }
 
-        file_path = os.path.join(SaveManager.SAVES_DIR, f"{save_name}.json")
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(save_data, f, ensure_ascii=False, indent=2)
+    @staticmethod
+    def save_game(game_controller, save_name=None):
+        """
+        Sauvegarde l'état du jeu dans un fichier binaire (.sav), de façon
+        atomique : un arrêt en pleine écriture laisse l'ancienne sauvegarde.
+        """
+        from models.save_journal import write_atomic
+
+        SaveManager.ensure_saves_directory()
+
+        if save_name is None:
+            save_name = SaveManager.new_save_name()
+
+        data = encode_game(game_controller)
+
+        file_path = os.path.join(SaveManager.SAVES_DIR, save_name + SaveManager.BINARY_EXT)
+        with SaveManager.index().writing():
+            SaveManager.store_catalog()
+            write_atomic(file_path, data)
+            SaveManager.index_save(save_name, file_path, game_controller)
 
         return file_path
 
+    @staticmethod
+    def read_file(file_path):
+        """
+        Partie lue depuis un fichier de sauvegarde, binaire ou JSON.
+        Retourne (partie, seq), seq étant le numéro d'événement d'un
+        instantané de journal (0 sinon).
+        """
+        with open(file_path, "rb") as f:
+            raw = f.read()
+        if is_binary(raw):
+            return decode_game(raw, SaveManager.read_catalog)
+        save_data = json.loads(raw.decode("utf-8"))
+        return SaveManager.game_from_dict(save_data), save_data.get("seq", 0)
+
     @staticmethod
     def load_game(save_name):
         """Charge une partie sauvegardée"""
-        from controller.game_controller import GameController
-        from models.cards import HabitantCard, LieuCard, PenaliteCard, Deck
+        from models.save_journal import SaveJournal
 
-        file_path = os.path.join(SaveManager.SAVES_DIR, f"{save_name}.json")
-        if not os.path.exists(file_path):
-            return None
+        if SaveJournal.exists(save_name):
+            return SaveJournal.load(save_name)
+
+        for ext in (SaveManager.BINARY_EXT, SaveManager.JSON_EXT):
+            file_path = os.path.join(SaveManager.SAVES_DIR, save_name + ext)
+            if os.path.exists(file_path):
+                return SaveManager.read_file(file_path)[0]
+        return None
 
-        with open(file_path, "r", encoding="utf-8") as f:
-            save_data = json.load(f)
+    @staticmethod
+    def export_json(save_name, file_path):
+        """Exporte une sauvegarde au format JSON lisible. Faux si elle n'existe pas."""
+        from models.save_journal import SaveJournal
 
-        # Crée une nouvelle instance de jeu
-        game = GameController(save_data["num_players"])
-        game.current_player = save_data["current_player"]
+        if SaveJournal.exists(save_name):
+            game = SaveJournal.read(save_name)[0]  # sans reprendre le journal
+        else:
+            game = SaveManager.load_game(save_name)
+        if game is None:
+            return False
+        with open(file_path, "w", encoding="utf-8") as f:
+            json.dump(SaveManager.game_to_dict(game), f, ensure_ascii=False, indent=2)
+        return True
 
-        # Restaure les decks
-        game.hab_deck = Deck.from_dict(save_data["hab_deck"])
-        game.lieu_deck = Deck.from_dict(save_data["lieu_deck"])
-        game.pen_deck = Deck.from_dict(save_data["pen_deck"])
+    @staticmethod
+    def convert_save(save_name, keep_json=False):
+        """
+        Réécrit au format binaire une sauvegarde JSON (fichier .json ou
+        instantané de journal). Retourne (taille avant, taille après), ou
+        None s'il n'y avait rien à convertir.
+        """
+        from models.save_journal import SaveJournal, write_atomic
 
-        # Restaure les cartes visibles
-        def create_card(card_dict):
-            if card_dict is None:
+        if SaveJournal.exists(save_name):
+            old_path = new_path = SaveJournal.paths(save_name)[1]
+        else:
+            old_path = os.path.join(SaveManager.SAVES_DIR, save_name + SaveManager.JSON_EXT)
+            new_path = os.path.join(SaveManager.SAVES_DIR, save_name + SaveManager.BINARY_EXT)
+            if not os.path.exists(old_path):
                 return None
-            card_type = card_dict["card_type"]
-            if card_type == "habitant":
-                return HabitantCard.from_dict(card_dict)
-            elif card_type == "lieu":
-                return LieuCard.from_dict(card_dict)
-            elif card_type == "penalite":
-                return PenaliteCard.from_dict(card_dict)
+        with open(old_path, "rb") as f:
+            raw = f.read()
+        if is_binary(raw):
             return None
+        game, seq = SaveManager.read_file(old_path)
+        data = encode_game(game, seq)
 
-        game.visible_habitants = [
-            create_card(card_dict) for card_dict in save_data["visible_habitants"]
-        ]
-        game.visible_lieux = [
-            create_card(card_dict) for card_dict in save_data["visible_lieux"]
+        with SaveManager.index().writing():
+            SaveManager.store_catalog()
+            write_atomic(new_path, data)
+            if new_path == old_path:
+                SaveManager.index_save(
+                    save_name, new_path, game, mtime=SaveJournal.mtime(save_name)
+                )
+            else:
+                SaveManager.index_save(save_name, new_path, game)
+                if not keep_json:
+                    os.remove(old_path)
+        return len(raw), len(data)
+
+    @staticmethod
+    def game_from_dict(save_data):
+        """Reconstruit une partie à partir de game_to_dict()"""
+        from controller.game_controller import GameController
+        from controller.replay import action_from_json
+        from models.cards import Deck, card_from_dict
+
+        # Sauvegarde sans historique : pas de replay possible
+        has_actions = "actions" in save_data
+        return GameController.restore(
+            num_players=save_data["num_players"],
+            current_player=save_data["current_player"],
+            turn=save_data.get("turn", 1),
+            # Cartes : instances partagées du registre
+            kingdoms={
+                int(player): [card_from_dict(card_dict) for card_dict in cards]
+                for player, cards in save_data["kingdoms"].items()
+            },
+            visible_habitants=[
+                card_from_dict(card_dict) for card_dict in save_data["visible_habitants"]
+            ],
+            visible_lieux=[
+                card_from_dict(card_dict) for card_dict in save_data["visible_lieux"]
+            ],
+            hab_deck=Deck.from_dict(save_data["hab_deck"]),
+            lieu_deck=Deck.from_dict(save_data["lieu_deck"]),
+            pen_deck=Deck.from_dict(save_data["pen_deck"]),
+            seed=save_data.get("seed") if has_actions else None,
+            actions=[action_from_json(a) for a in save_data.get("actions", ())],
+            draws=save_data.get("draws", (None, None)),
+        )
+
+    @staticmethod
+    def delete_save(save_name):
+        """Supprime une sauvegarde (binaire, JSON ou journal), sa miniature et son entrée d'index"""
+        from models.save_journal import SaveJournal
+
+        paths = [
+            os.path.join(SaveManager.SAVES_DIR, save_name + ext)
+            for ext in (SaveManager.BINARY_EXT, SaveManager.JSON_EXT)
         ]
+        paths += SaveJournal.paths(save_name)
+        paths.append(SaveManager.thumbnail_path(save_name))
+        index = SaveManager.index()
+        with index.writing():
+            for path in paths:
+                if os.path.exists(path):
+                    os.remove(path)
+            index.remove(save_name)
 
-        # Restaure les royaumes
-        game.kingdoms = {
-            int(player): [create_card(card_dict) for card_dict in cards]
-            for player, cards in save_data["kingdoms"].items()
-        }
+    @staticmethod
+    def _scan_saves():
+        """{nom: (chemin, mtime)} des sauvegardes présentes dans le dossier"""
+        from models.save_journal import SaveJournal
 
-        return game
+        found = {}
+        with os.scandir(SaveManager.SAVES_DIR) as entries:
+            for entry in entries:
+                name, ext = os.path.splitext(entry.name)
+                if ext == SaveManager.BINARY_EXT:
+                    found[name] = (entry.path, entry.stat().st_mtime)
+                elif ext == SaveManager.JSON_EXT:
+                    # Une sauvegarde convertie (ou exportée) : le .sav prime
+                    found.setdefault(name, (entry.path, entry.stat().st_mtime))
+                elif ext == SaveJournal.SNAPSHOT_EXT:
+                    found[name] = (entry.path, SaveJournal.mtime(name))
+        return found
 
     @staticmethod
-    def get_save_files():
-        """Retourne la liste des sauvegardes disponibles"""
-        SaveManager.ensure_saves_directory()
-        saves = []
-        for file in os.listdir(SaveManager.SAVES_DIR):
-            if file.endswith(".json"):
-                name = file[:-5]  # Enlève l'extension .json
-                path = os.path.join(SaveManager.SAVES_DIR, file)
-                modified = datetime.fromtimestamp(os.path.getmtime(path))
-                saves.append(
-                    {
-                        "name": name,
-                        "date": modified.strftime("%Y-%m-%d %H:%M:%S"),
-                        "path": path,
-                    }
-                )
-        return sorted(saves, key=lambda x: x["date"], reverse=True)
+    def _read_save_info(save_name, file_path):
+        """Relit le résumé d'une sauvegarde modifiée hors du jeu"""
+        from models.save_journal import SaveJournal
+
+        try:
+            if file_path.endswith(SaveJournal.SNAPSHOT_EXT):
+                game = SaveJournal.read(save_name)[0]
+            elif file_path.endswith(SaveManager.BINARY_EXT):
+                # Résumé lu directement, sans reconstruire la partie
+                with open(file_path, "rb") as f:
+                    return read_info(f.read(), SaveManager.read_catalog)
+            else:
+                game = SaveManager.read_file(file_path)[0]
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        return SaveManager.save_info(game)
+
+    @staticmethod
+    def get_save_files(offset=0, limit=None, order="mtime", descending=True):
+        """
+        Retourne la liste des sauvegardes disponibles (plus récentes d'abord),
+        éventuellement par page, à partir de l'index des sauvegardes
+        """
+        index = SaveManager.index()
+        index.refresh(SaveManager._scan_saves, SaveManager._read_save_info)
+        return index.query(offset, limit, order, descending)
+
+    @staticmethod
+    def count_saves():
+        """Nombre de sauvegardes disponibles"""
+        index = SaveManager.index()
+        index.refresh(SaveManager._scan_saves, SaveManager._read_save_info)
+        return index.count()
@@ -0,0 +1,102 @@
+import threading
+from collections import deque
+
+
+class SaveWorker:
+    """
+    Thread d'écriture des sauvegardes.
+
+    Le thread principal prépare les données (copie légère de la partie) et
+    confie l'encodage et les écritures disque au thread de sauvegarde :
+      - run(job)           : tâche exécutée dans l'ordre d'arrivée ;
+      - submit(key, job)   : tâche regroupée, une tâche encore en attente
+                             avec la même clé est remplacée par la nouvelle.
+    Les résultats (clé, erreur ou None) sont récupérés par poll(), à
+    chaque image, pour afficher un message.
+    """
+
+    def __init__(self):
+        self._queue = deque()  # (clé, tâche, notifier)
+        self._cond = threading.Condition()
+        self._results = deque()
+        self._busy = False
+        self._closed = False
+        self._thread = None
+
+    def _start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run, name="save-worker", daemon=True
+            )
+            self._thread.start()
+
+    def run(self, job, notify=False):
+        """Ajoute une tâche ordonnée (jamais regroupée)."""
+        self._put(None, job, notify)
+
+    def submit(self, key, job, notify=True):
+        """Ajoute une tâche, en remplaçant celle de même clé encore en attente."""
+        self._put(key, job, notify)
+
+    def _put(self, key, job, notify):
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("SaveWorker fermé")
+            if key is not None:
+                for pending in list(self._queue):
+                    if pending[0] == key:
+                        self._queue.remove(pending)
+            self._queue.append((key, job, notify))
+            self._start()
+            self._cond.notify_all()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._queue and not self._closed:
+                    self._cond.wait()
+                if not self._queue:
+                    return
+                key, job, notify = self._queue.popleft()
+                self._busy = True
+            error = None
+            try:
+                job()
+            except Exception as exc:  # affiché à l'écran, le jeu continue
+                error = exc
+            with self._cond:
+                self._busy = False
+                if notify or error is not None:
+                    self._results.append((key, error))
+                self._cond.notify_all()
+
+    def pending(self):
+        """Nombre de tâches en attente ou en cours."""
+        with self._cond:
+            return len(self._queue) + (1 if self._busy else 0)
+
+    def poll(self):
+        """Résultats terminés depuis le dernier appel : [(clé, erreur)]."""
+        results = []
+        while self._results:
+            results.append(self._results.popleft())
+        return results
+
+    def flush(self, timeout=None):
+        """Attend la fin de toutes les tâches. Retourne False si timeout."""
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: not self._queue and not self._busy, timeout
+            )
+
+    def close(self, timeout=None):
+        """Termine les écritures en attente puis arrête le thread."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+
+# Instance partagée par le jeu
+save_worker = SaveWorker()
@@ -0,0 +1,213 @@
+import collections
+import itertools
+import socket
+import threading
+
+from controller.game_session import card_at, default_dice_pool
+from network.protocol import (
+    DEFAULT_HOST,
+    DEFAULT_PORT,
+    MAX_LINE,
+    PROTOCOL_VERSION,
+    ProtocolError,
+    decode,
+    encode,
+)
+
+
+class RemoteError(Exception):
+    """Le serveur a refusé une requête, ou la connexion est perdue."""
+
+
+class GameClient:
+    """
+    Connexion à un serveur de parties (network.server).
+
+    Un thread lit les messages du serveur et les range dans inbox ; la
+    boucle de jeu les récupère sans jamais attendre le réseau. call()
+    attend la réponse : à réserver aux échanges ponctuels (création de
+    partie, hello).
+    """
+
+    def __init__(self, host=DEFAULT_HOST, port=DEFAULT_PORT, timeout=5.0):
+        self.timeout = timeout
+        self.sock = socket.create_connection((host, port), timeout=timeout)
+        self.sock.settimeout(None)
+        self.file = self.sock.makefile("rb")
+        self.inbox = collections.deque()
+        self.closed = False
+        self._ids = itertools.count(1)
+        self._send_lock = threading.Lock()
+        self._waiting = {}  # id -> (Event, [réponse])
+        self._reader = threading.Thread(
+            target=self._read_loop, name="game-client", daemon=True
+        )
+        self._reader.start()
+        hello = self.call("hello")
+        if hello.get("version") != PROTOCOL_VERSION:
+            self.close()
+            raise RemoteError(f"protocole {hello.get('version')} non pris en charge")
+
+    def _read_loop(self):
+        try:
+            while True:
+                line = self.file.readline(MAX_LINE + 1)
+                if not line:
+                    break
+                try:
+                    message = decode(line)
+                except ProtocolError:
+                    continue
+                waiting = self._waiting.pop(message.get("id"), None)
+                if waiting is not None:
+                    event, box = waiting
+                    box.append(message)
+                    event.set()
+                else:
+                    self.inbox.append(message)
+        except (OSError, ValueError):
+            pass
+        finally:
+            self.closed = True
+            self.inbox.append({"event": "closed"})
+            for event, _ in list(self._waiting.values()):
+                event.set()
+
+    def send(self, op, **fields):
+        """Envoie une requête sans attendre ; retourne son identifiant."""
+        if self.closed:
+            raise RemoteError("connexion au serveur perdue")
+        request_id = next(self._ids)
+        data = encode({"id": request_id, "op": op, **fields})
+        try:
+            with self._send_lock:
+                self.sock.sendall(data)
+        except OSError as exc:
+            self.closed = True
+            raise RemoteError(f"connexion au serveur perdue : {exc}") from None
+        return request_id
+
+    def call(self, op, **fields):
+        """Envoie une requête et attend la réponse (RemoteError si refusée)."""
+        if self.closed:
+            raise RemoteError("connexion au serveur perdue")
+        event, box = threading.Event(), []
+        request_id = next(self._ids)
+        self._waiting[request_id] = (event, box)
+        data = encode({"id": request_id, "op": op, **fields})
+        try:
+            with self._send_lock:
+                self.sock.sendall(data)
+        except OSError as exc:
+            self._waiting.pop(request_id, None)
+            raise RemoteError(f"connexion au serveur perdue : {exc}") from None
+        if not event.wait(self.timeout) or not box:
+            self._waiting.pop(request_id, None)
+            raise RemoteError("pas de réponse du serveur")
+        response = box[0]
+        if not response.get("ok"):
+            raise RemoteError(response.get("error", "requête refusée"))
+        return response
+
+    def close(self):
+        if self.closed and self.sock.fileno() == -1:
+            return
+        self.closed = True
+        try:
+            self.sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self.sock.close()
+
+
+class RemoteGameSession:
+    """
+    Partie hébergée par le serveur, vue comme une GameSession par l'écran
+    de jeu. Les actions partent sans attendre ; l'état affiché est celui
+    de la dernière réponse (ou diffusion) reçue, appliqué dans update().
+    """
+
+    controller = None  # les règles sont appliquées par le serveur
+
+    def __init__(self, client, session_id, state):
+        self.client = client
+        self.session_id = session_id
+        self.dice_pool = default_dice_pool()  # pour les couleurs des dés
+        self.pending = 0
+        self.error = None
+        self.apply_state(state)
+
+    @classmethod
+    def create(cls, client, num_players):
+        response = client.call("new", players=num_players)
+        return cls(client, response["session"], response["state"])
+
+    def apply_state(self, state):
+        self.num_players = state["players"]
+        self.current_player = state["current_player"]
+        self.turn = state["turn"]
+        self._scores = {i + 1: s for i, s in enumerate(state["scores"])}
+        self.visible_habitants = [card_at(c) for c in state["habitants"]]
+        self.visible_lieux = [card_at(c) for c in state["lieux"]]
+        self.rolls_remaining = state["rolls_remaining"]
+        self.dice_values = state["dice"]
+        self.validated = state["validated"]
+        self.result_card = card_at(state["result"])
+        self.is_penalty = state["penalty"]
+        self.game_over = state["game_over"]
+        self.winners = state["winners"]
+        self.winning_score = state["winning_score"]
+
+    def scores(self):
+        return self._scores
+
+    def _send(self, op, **fields):
+        try:
+            self.client.send(op, session=self.session_id, **fields)
+        except RemoteError as exc:
+            self.error = str(exc)
+            return False
+        self.pending += 1
+        return True
+
+    # ————— Actions (mêmes vérifications que GameSession, côté client) —————
+
+    def roll(self, keep=()):
+        if self.rolls_remaining <= 0 or self.validated or self.game_over:
+            return False
+        return self._send("roll", keep=sorted(keep))
+
+    def validate(self):
+        if self.validated or self.game_over:
+            return False
+        return self._send("validate")
+
+    def next_turn(self):
+        if self.game_over:
+            return False
+        return self._send("next")
+
+    def save(self):
+        if not self.game_over:
+            self._send("save")
+
+    def update(self):
+        """Applique les messages reçus depuis la dernière image."""
+        inbox = self.client.inbox
+        while inbox:
+            message = inbox.popleft()
+            if message.get("event") == "closed":
+                self.error = "connexion au serveur perdue"
+                self.pending = 0
+                continue
+            if message.get("session", self.session_id) != self.session_id:
+                continue
+            if "id" in message and message["id"] is not None:
+                self.pending = max(0, self.pending - 1)
+            if "state" in message:
+                self.apply_state(message["state"])
+            elif not message.get("ok", True):
+                self.error = message.get("error")
+
+    def is_waiting(self):
+        return self.pending > 0
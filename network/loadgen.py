@@ -0,0 +1,146 @@
+import argparse
+import asyncio
+import itertools
+import json
+import random
+import subprocess
+import sys
+import time
+
+from models.dice import ROLLS_PER_TURN
+from network.protocol import DEFAULT_HOST, DEFAULT_PORT, MAX_LINE, decode, encode
+
+
+def percentile(values, p):
+    if not values:
+        return None
+    index = min(len(values) - 1, int(round(p / 100 * (len(values) - 1))))
+    return values[index]
+
+
+class LoadClient:
+    """Un joueur simulé : une connexion, des parties jouées au hasard."""
+
+    def __init__(self, host, port, rng, latencies):
+        self.host, self.port = host, port
+        self.rng = rng
+        self.latencies = latencies
+        self.errors = 0
+        self._ids = itertools.count(1)
+
+    async def call(self, op, **fields):
+        request_id = next(self._ids)
+        start = time.perf_counter()
+        self.writer.write(encode({"id": request_id, "op": op, **fields}))
+        await self.writer.drain()
+        # Les événements diffusés (sans id) sont ignorés
+        while True:
+            line = await self.reader.readline()
+            if not line:
+                raise ConnectionError("connexion fermée par le serveur")
+            message = decode(line)
+            if message.get("id") == request_id:
+                break
+        self.latencies.append(time.perf_counter() - start)
+        if not message.get("ok"):
+            self.errors += 1
+        return message
+
+    async def play(self, games, players):
+        self.reader, self.writer = await asyncio.open_connection(
+            self.host, self.port, limit=MAX_LINE
+        )
+        try:
+            for _ in range(games):
+                response = await self.call("new", players=players)
+                session, state = response["session"], response["state"]
+                while not state["game_over"]:
+                    if state["validated"]:
+                        op, fields = "next", {}
+                    elif state["rolls_remaining"] == ROLLS_PER_TURN or (
+                        state["rolls_remaining"] and self.rng.random() < 0.5
+                    ):
+                        keep = [i for i in range(len(state["dice"])) if self.rng.random() < 0.5]
+                        op, fields = "roll", {"keep": keep}
+                    else:
+                        op, fields = "validate", {}
+                    response = await self.call(op, session=session, **fields)
+                    if not response.get("ok"):
+                        break
+                    state = response["state"]
+                await self.call("leave", session=session)
+        finally:
+            self.writer.close()
+
+
+async def run_load(host, port, clients, games, players, seed):
+    latencies = []
+    load_clients = [
+        LoadClient(host, port, random.Random(seed + i), latencies) for i in range(clients)
+    ]
+    start = time.perf_counter()
+    results = await asyncio.gather(
+        *(c.play(games, players) for c in load_clients), return_exceptions=True
+    )
+    elapsed = time.perf_counter() - start
+    failures = [r for r in results if isinstance(r, Exception)]
+    latencies.sort()
+    ms = lambda s: None if s is None else round(s * 1000, 3)
+    return {
+        "clients": clients,
+        "games_per_client": games,
+        "players": players,
+        "requests": len(latencies),
+        "errors": sum(c.errors for c in load_clients),
+        "failed_clients": len(failures),
+        "elapsed_s": round(elapsed, 3),
+        "throughput_rps": round(len(latencies) / elapsed, 1) if elapsed else None,
+        "latency_ms": {
+            "p50": ms(percentile(latencies, 50)),
+            "p95": ms(percentile(latencies, 95)),
+            "p99": ms(percentile(latencies, 99)),
+            "max": ms(latencies[-1] if latencies else None),
+        },
+    }
+
+
+def spawn_server(host, port):
+    """Lance python -m network.server et attend qu'il écoute."""
+    process = subprocess.Popen(
+        [sys.executable, "-m", "network.server", "--host", host, "--port", str(port)],
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    process.stdout.readline()  # "Serveur de parties sur ..."
+    return process
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Charge un serveur de parties avec des joueurs simulés"
+    )
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--clients", type=int, default=100)
+    parser.add_argument("--games", type=int, default=1, help="parties par client")
+    parser.add_argument("--players", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--spawn", action="store_true", help="démarre le serveur le temps du test"
+    )
+    args = parser.parse_args()
+
+    process = spawn_server(args.host, args.port) if args.spawn else None
+    try:
+        report = asyncio.run(
+            run_load(args.host, args.port, args.clients, args.games, args.players, args.seed)
+        )
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+import json
+
+
+# Une ligne JSON par message (UTF-8, terminée par "\n")
+#   requête : {"id": 1, "op": "roll", "session": 7, "keep": [0, 3]}
+#   réponse : {"id": 1, "ok": true, "state": {...}}
+#             {"id": 1, "ok": false, "error": "..."}
+#   événement (sans id) : {"event": "state", "session": 7, "state": {...}}
+
+PROTOCOL_VERSION = 1
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+MAX_LINE = 64 * 1024
+
+
+class ProtocolError(ValueError):
+    """Message illisible ou incomplet."""
+
+
+def encode(message):
+    return json.dumps(message, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+def decode(line):
+    if len(line) > MAX_LINE:
+        raise ProtocolError("message trop long")
+    try:
+        message = json.loads(line)
+    except ValueError as exc:
+        raise ProtocolError(f"JSON invalide : {exc}") from None
+    if not isinstance(message, dict):
+        raise ProtocolError("un message doit être un objet JSON")
+    return message
+
+
+def reply(request, **fields):
+    return {"id": request.get("id"), "ok": True, **fields}
+
+
+def error(request, message):
+    return {"id": request.get("id"), "ok": False, "error": message}
+
+
+def parse_address(text, default_port=DEFAULT_PORT):
+    """"hôte:port" (ou "hôte") -> (hôte, port)."""
+    host, _, port = text.rpartition(":")
+    if not host:
+        return port or DEFAULT_HOST, default_port
+    return host, int(port)
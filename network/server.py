@@ -0,0 +1,309 @@
+import argparse
+import asyncio
+import itertools
+import uuid
+
+from controller.game_session import GameSession
+from models.save_manager import SaveManager
+from models.save_worker import save_worker
+from network.protocol import (
+    DEFAULT_HOST,
+    DEFAULT_PORT,
+    MAX_LINE,
+    PROTOCOL_VERSION,
+    ProtocolError,
+    decode,
+    encode,
+    error,
+    reply,
+)
+
+
+MIN_PLAYERS, MAX_PLAYERS = 2, 4
+
+
+class Connection:
+    """
+    Une connexion client : les réponses passent par une file bornée vidée
+    par une tâche d'écriture. Un client qui ne lit plus remplit sa file et
+    est déconnecté, sans jamais bloquer les parties des autres.
+    """
+
+    def __init__(self, reader, writer, outbound_size):
+        self.reader = reader
+        self.writer = writer
+        self.outbound = asyncio.Queue(outbound_size)
+        self.sessions = set()
+        self.closed = False
+        self.task = asyncio.ensure_future(self._write_loop())
+
+    def send(self, message):
+        if self.closed:
+            return False
+        try:
+            self.outbound.put_nowait(message)
+        except asyncio.QueueFull:
+            self.close()  # client trop lent
+            return False
+        return True
+
+    async def _write_loop(self):
+        try:
+            while True:
+                message = await self.outbound.get()
+                if message is None:
+                    break
+                data = [encode(message)]
+                # Regroupe les messages déjà en attente en une seule écriture
+                while not self.outbound.empty():
+                    message = self.outbound.get_nowait()
+                    if message is None:
+                        self.closed = True
+                        break
+                    data.append(encode(message))
+                self.writer.write(b"".join(data))
+                await self.writer.drain()
+                if self.closed:
+                    break
+        except (ConnectionError, OSError):
+            pass
+        finally:
+            self.closed = True
+            self.writer.close()
+
+    def close(self):
+        if not self.closed:
+            self.closed = True
+            try:
+                self.outbound.put_nowait(None)
+            except asyncio.QueueFull:
+                self.task.cancel()
+                self.writer.close()
+
+
+class ServerSession:
+    """Une table : une partie, sa file d'actions et ses clients abonnés."""
+
+    def __init__(self, session_id, game, queue_size):
+        self.id = session_id
+        self.game = game
+        self.queue = asyncio.Queue(queue_size)
+        self.subscribers = set()
+        self.task = None
+        # Nom propre à la table : deux tables qui sauvegardent dans la même
+        # seconde n'écrivent pas dans les mêmes fichiers
+        self.save_name = f"{SaveManager.new_save_name()}_{uuid.uuid4().hex[:8]}"
+
+
+class GameServer:
+    """
+    Serveur de parties : héberge de nombreuses GameSession indépendantes
+    dans un seul processus asyncio.
+
+    Chaque table a sa file d'actions bornée, traitée dans l'ordre par sa
+    propre tâche. Quand elle est pleine, la lecture de la connexion qui
+    envoie s'arrête (await put) : TCP ralentit alors le client lui-même.
+    """
+
+    SESSION_OPS = {"roll", "validate", "next", "state", "save"}
+
+    def __init__(self, max_sessions=10000, queue_size=32, outbound_size=256):
+        self.max_sessions = max_sessions
+        self.queue_size = queue_size
+        self.outbound_size = outbound_size
+        self.sessions = {}
+        self.connections = set()
+        self.actions = 0
+        self._ids = itertools.count(1)
+        self._server = None
+
+    async def start(self, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        self._server = await asyncio.start_server(
+            self.handle_connection, host, port, limit=MAX_LINE
+        )
+        return self._server
+
+    @property
+    def port(self):
+        return self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        server = await self.start(host, port)
+        async with server:
+            await server.serve_forever()
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        for session in list(self.sessions.values()):
+            self.end_session(session)
+        for conn in list(self.connections):
+            conn.close()
+
+    # ————— Connexions —————
+
+    async def handle_connection(self, reader, writer):
+        conn = Connection(reader, writer, self.outbound_size)
+        self.connections.add(conn)
+        try:
+            while not conn.closed:
+                try:
+                    line = await reader.readline()
+                except (ValueError, asyncio.LimitOverrunError):
+                    conn.send(error({}, "message trop long"))
+                    break
+                if not line:
+                    break
+                try:
+                    request = decode(line)
+                except ProtocolError as exc:
+                    conn.send(error({}, str(exc)))
+                    continue
+                await self.dispatch(conn, request)
+        except (ConnectionError, OSError):
+            pass
+        finally:
+            self.connections.discard(conn)
+            for session_id in list(conn.sessions):
+                self.unsubscribe(conn, session_id)
+            conn.close()
+
+    async def dispatch(self, conn, request):
+        op = request.get("op")
+        if op in self.SESSION_OPS:
+            session = self.sessions.get(request.get("session"))
+            if session is None:
+                conn.send(error(request, "partie inconnue"))
+                return
+            # File pleine : on attend, ce qui suspend la lecture de ce client
+            await session.queue.put((conn, request))
+        elif op == "new":
+            self.new_session(conn, request)
+        elif op == "join":
+            session = self.sessions.get(request.get("session"))
+            if session is None:
+                conn.send(error(request, "partie inconnue"))
+                return
+            self.subscribe(conn, session)
+            conn.send(reply(request, session=session.id, state=session.game.state()))
+        elif op == "leave":
+            self.unsubscribe(conn, request.get("session"))
+            conn.send(reply(request))
+        elif op == "hello":
+            conn.send(reply(request, version=PROTOCOL_VERSION))
+        else:
+            conn.send(error(request, f"opération inconnue : {op}"))
+
+    # ————— Parties —————
+
+    def new_session(self, conn, request):
+        players = request.get("players")
+        if not isinstance(players, int) or not MIN_PLAYERS <= players <= MAX_PLAYERS:
+            conn.send(error(request, f"de {MIN_PLAYERS} à {MAX_PLAYERS} joueurs"))
+            return
+        if len(self.sessions) >= self.max_sessions:
+            conn.send(error(request, "serveur complet"))
+            return
+        game = GameSession.new(players)
+        # Les sauvegardes ne bloquent pas la boucle du serveur
+        game.controller.attach_save_worker(save_worker)
+        session = ServerSession(next(self._ids), game, self.queue_size)
+        self.sessions[session.id] = session
+        session.task = asyncio.ensure_future(self.run_session(session))
+        self.subscribe(conn, session)
+        conn.send(reply(request, session=session.id, state=game.state()))
+
+    def subscribe(self, conn, session):
+        session.subscribers.add(conn)
+        conn.sessions.add(session.id)
+
+    def unsubscribe(self, conn, session_id):
+        conn.sessions.discard(session_id)
+        session = self.sessions.get(session_id)
+        if session is None:
+            return
+        session.subscribers.discard(conn)
+        if not session.subscribers:
+            self.end_session(session)
+
+    def end_session(self, session):
+        self.sessions.pop(session.id, None)
+        if session.task is not None:
+            session.task.cancel()
+        journal = session.game.controller.journal
+        if journal is not None:
+            # Après les écritures en attente (thread de sauvegarde)
+            journal.close()
+
+    def apply(self, session, request):
+        """Applique une action. Retourne un message d'erreur ou None."""
+        game = session.game
+        op = request["op"]
+        if op == "roll":
+            keep = request.get("keep", [])
+            if not isinstance(keep, list) or not all(
+                isinstance(i, int) and 0 <= i < len(game.dice_values) for i in keep
+            ):
+                return "keep : liste d'indices de dés"
+            if not game.roll(set(keep)):
+                return "lancer impossible"
+        elif op == "validate":
+            if not game.validate():
+                return "validation impossible"
+        elif op == "next":
+            if not game.next_turn():
+                return "partie terminée"
+        elif op == "save":
+            game.save(session.save_name)
+        return None
+
+    async def run_session(self, session):
+        """Traite les actions d'une table, une à la fois, dans l'ordre."""
+        while True:
+            conn, request = await session.queue.get()
+            try:
+                message = self.apply(session, request)
+            except Exception as exc:
+                # Une requête invalide ne doit pas arrêter la table
+                message = f"action impossible ({exc})"
+            self.actions += 1
+            if message is not None:
+                conn.send(error(request, message))
+                continue
+            state = session.game.state()
+            conn.send(reply(request, state=state))
+            if request["op"] != "state" and len(session.subscribers) > 1:
+                event = {"event": "state", "session": session.id, "state": state}
+                for other in list(session.subscribers):
+                    if other is not conn:
+                        other.send(event)
+
+
+async def main(args):
+    server = GameServer(args.max_sessions, args.queue_size, args.outbound_size)
+    await server.start(args.host, args.port)
+    print(f"Serveur de parties sur {args.host}:{server.port}", flush=True)
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serveur de parties Roi & Compagnie")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--max-sessions", type=int, default=10000)
+    parser.add_argument(
+        "--queue-size", type=int, default=32, help="actions en attente par partie"
+    )
+    parser.add_argument(
+        "--outbound-size", type=int, default=256, help="messages en attente par client"
+    )
+    try:
+        asyncio.run(main(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        save_worker.close()
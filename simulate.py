@@ -0,0 +1,48 @@
+import argparse
+import json
+import os
+import time
+
+from controller.simulation import POLICIES, run_simulation
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Simule des parties complètes sans affichage."
+    )
+    parser.add_argument("-n", "--games", type=int, default=10000)
+    parser.add_argument("-p", "--players", type=int, default=2, choices=(2, 3, 4))
+    parser.add_argument(
+        "--policy",
+        action="append",
+        choices=sorted(POLICIES),
+        help="politique par joueur (répéter l'option) ; greedy par défaut",
+    )
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-o", "--output", help="fichier JSON de résultats")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    stats = run_simulation(
+        args.games,
+        num_players=args.players,
+        policy_names=args.policy,
+        workers=args.workers,
+        seed=args.seed,
+    )
+    elapsed = time.perf_counter() - start
+
+    result = stats.to_dict()
+    result["elapsed_s"] = elapsed
+    result["games_per_s"] = stats.games / elapsed if elapsed else None
+
+    text = json.dumps(result, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text)
+    print(text)
+
+
+if __name__ == "__main__":
+    main()
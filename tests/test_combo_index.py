@@ -0,0 +1,36 @@
+import random
+
+from models.cards import HabitantCard, all_habitants, all_lieux
+from models.combo_index import ComboIndex, default_index
+
+
+def first_met(dice, row):
+    """Référence : première carte de la rangée dont le combo est satisfait."""
+    for i, card in enumerate(row):
+        if isinstance(card, HabitantCard) and card.is_combo_met(dice):
+            return i, card
+    return None, None
+
+
+def test_first_match_against_is_combo_met():
+    rng = random.Random(2)
+    pool = all_habitants + all_lieux[:3] + [None]
+    for _ in range(20000):
+        row = rng.sample(pool, rng.randint(0, 5))
+        dice = [rng.randint(1, 6) for _ in range(6)]
+        assert default_index.first_match(dice, row) == first_met(dice, row)
+
+
+def test_first_match_incomplete_roll():
+    rng = random.Random(3)
+    for _ in range(2000):
+        row = rng.sample(all_habitants, 4)
+        dice = [rng.randint(0, 6) for _ in range(rng.randint(0, 6))]
+        assert default_index.first_match(dice, row) == first_met(dice, row)
+
+
+def test_new_cards_get_a_bit():
+    index = ComboIndex()
+    card = HabitantCard("Test", "rouge", {4: 2})
+    assert index.first_match([4, 4, 1, 2, 3, 5], [None, card]) == (1, card)
+    assert index.first_match([4, 1, 1, 2, 3, 5], [card]) == (None, None)
@@ -0,0 +1,85 @@
+import random
+
+from models.cards import Deck, all_habitants, all_penalites
+
+
+def names(cards):
+    return [card.name for card in cards]
+
+
+def test_draw_order_is_deterministic():
+    first, again = Deck(all_habitants), Deck(all_habitants)
+    first.shuffle(random.Random(3))
+    again.shuffle(random.Random(3))
+    assert first.draw_pile == again.draw_pile
+    expected = first.draw_pile
+    drawn = [first.draw() for _ in range(len(expected))]
+    assert drawn == expected
+    assert first.draw() is None
+    assert first.remaining() == 0
+
+
+def test_reshuffle_puts_discard_under_the_pile():
+    deck = Deck(all_habitants)
+    deck.shuffle(random.Random(1))
+    drawn = [deck.draw() for _ in range(5)]
+    for card in drawn:
+        deck.discard_card(card)
+    rest = deck.draw_pile
+    deck.reshuffle_discard(random.Random(2))
+    pile = deck.draw_pile
+    assert pile[: len(rest)] == rest
+    assert sorted(names(pile[len(rest) :])) == sorted(names(drawn))
+    assert deck.discard == []
+
+    again = Deck(all_habitants)
+    again.shuffle(random.Random(1))
+    for card in [again.draw() for _ in range(5)]:
+        again.discard_card(card)
+    again.reshuffle_discard(random.Random(2))
+    assert again.draw_pile == pile
+
+
+def played_deck():
+    deck = Deck(all_penalites)
+    deck.shuffle(random.Random(7))
+    for _ in range(3):
+        deck.discard_card(deck.draw())
+    deck.draw()
+    return deck
+
+
+def test_snapshot_restore():
+    deck = played_deck()
+    snapshot = deck.snapshot()
+    pile, discard = deck.draw_pile, deck.discard
+    deck.draw()
+    deck.reshuffle_discard(random.Random(4))
+    deck.restore(snapshot)
+    assert (deck.draw_pile, deck.discard) == (pile, discard)
+    # L'instantané reste utilisable après restauration
+    deck.draw()
+    deck.restore(snapshot)
+    assert deck.draw_pile == pile
+
+
+def test_to_dict_from_dict():
+    deck = played_deck()
+    restored = Deck.from_dict(deck.to_dict())
+    assert restored.draw_pile == deck.draw_pile
+    assert restored.discard == deck.discard
+
+
+def test_ids_from_ids():
+    deck = played_deck()
+    restored = Deck.from_ids(*deck.ids())
+    assert restored.draw_pile == deck.draw_pile
+    assert restored.discard == deck.discard
+    assert [restored.draw() for _ in range(restored.remaining())] == deck.draw_pile
+
+
+def test_iter_draw_pile_follows_the_cursor():
+    deck = played_deck()
+    assert list(deck.iter_draw_pile()) == deck.draw_pile
+    deck.draw()
+    assert list(deck.iter_draw_pile()) == deck.draw_pile
@@ -0,0 +1,83 @@
+import random
+
+import pytest
+
+from controller.game_controller import GameController
+from models.save_journal import SaveJournal
+from models.save_manager import SaveManager
+
+SEEDS = (1, 7, 42, 2024)
+
+
+@pytest.fixture(autouse=True)
+def saves_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(SaveManager, "SAVES_DIR", str(tmp_path / "saves"))
+
+
+def play(game, rng, max_turns=200):
+    """Joue une partie avec des lancers au hasard, en vérifiant l'index à chaque carte."""
+    while not game.is_game_over() and game.turn <= max_turns:
+        dice = [rng.randint(1, 6) for _ in range(6)]
+        game.record_roll(dice)
+        game.recruit_or_penalize(dice)
+        game.check_kingdom_index()
+        if game.turn % 10 == 0:
+            game.snapshot().check_kingdom_index()
+        game.next_player()
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+@pytest.mark.parametrize("num_players", (2, 4))
+def test_index_matches_full_recomputation(seed, num_players):
+    game = GameController(num_players, seed=seed)
+    play(game, random.Random(seed))
+    game.check_kingdom_index()
+    assert game.calculate_scores() == game.recompute_scores()
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_snapshot_index_is_independent(seed):
+    game = GameController(3, seed=seed)
+    play(game, random.Random(seed), max_turns=20)
+    clone = game.snapshot()
+    clone.check_kingdom_index()
+    play(game, random.Random(seed + 1), max_turns=40)
+    clone.check_kingdom_index()
+    game.check_kingdom_index()
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_index_after_save_and_load(seed):
+    game = GameController(3, seed=seed)
+    rng = random.Random(seed)
+    play(game, rng, max_turns=30)
+
+    SaveManager.save_game(game, "binary")
+    loaded = SaveManager.load_game("binary")
+    loaded.check_kingdom_index()
+    assert loaded.calculate_scores() == game.calculate_scores()
+
+    restored = SaveManager.game_from_dict(SaveManager.game_to_dict(game))
+    restored.check_kingdom_index()
+    assert restored.calculate_scores() == game.calculate_scores()
+
+    # La partie rechargée continue avec un index juste
+    play(loaded, rng, max_turns=60)
+    loaded.check_kingdom_index()
+
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_index_after_journal_reload(seed):
+    game = GameController(2, seed=seed)
+    rng = random.Random(seed)
+    play(game, rng, max_turns=10)
+    game.journal = SaveJournal.create(game, "journal")
+    play(game, rng, max_turns=30)
+    game.journal.close()
+
+    loaded = SaveManager.load_game("journal")
+    try:
+        loaded.check_kingdom_index()
+        assert loaded.calculate_scores() == game.calculate_scores()
+    finally:
+        loaded.journal.close()
@@ -0,0 +1,95 @@
+import copy
+import random
+
+import pytest
+
+from config import settings
+from controller.game_controller import GameRandom
+from controller.game_session import GameSession
+from models.save_manager import SaveManager
+
+
+@pytest.fixture(autouse=True)
+def saves_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(SaveManager, "SAVES_DIR", str(tmp_path / "saves"))
+
+
+def play(session, turns):
+    for _ in range(turns):
+        session.roll()
+        session.roll({0, 1})
+        session.validate()
+        session.next_turn()
+
+
+def next_rolls(rng, count=3):
+    rng = copy.deepcopy(rng)
+    return [[rng.randint(1, 6) for _ in range(6)] for _ in range(count)]
+
+
+@pytest.mark.parametrize("seed", (3, "7:dice"))
+def test_game_random_counts_draws(seed):
+    reference = random.Random(seed)
+    rng = GameRandom(seed)
+    for _ in range(300):
+        assert rng.choices(range(1, 7), k=6) == reference.choices(range(1, 7), k=6)
+        assert rng.randint(1, 6) == reference.randint(1, 6)
+        cards, expected = list(range(30)), list(range(30))
+        rng.shuffle(cards)
+        reference.shuffle(expected)
+        assert cards == expected
+        assert GameRandom(seed, rng.draws).getstate() == rng.getstate()
+    assert copy.copy(rng).getstate() == rng.getstate()
+
+
+@pytest.mark.parametrize("mode", ("full", "journal"))
+def test_dice_continue_after_reload(mode, monkeypatch):
+    monkeypatch.setattr(settings, "SAVE_MODE", mode)
+    session = GameSession.new(2, seed=11)
+    play(session, 2)
+    session.controller.save_game("game")
+    if session.controller.journal:
+        session.controller.journal.close()
+
+    loaded = GameSession(SaveManager.load_game("game"))
+    expected = next_rolls(session.controller.dice_rng)
+    assert [loaded.dice_pool.roll() for _ in range(3)] == expected
+    assert loaded.controller.rng.getstate() == session.controller.rng.getstate()
+    if loaded.controller.journal:
+        loaded.controller.journal.close()
+
+
+def test_unknown_save_mode(monkeypatch):
+    monkeypatch.setattr(settings, "SAVE_MODE", "journl")
+    with pytest.raises(ValueError):
+        GameSession.new(2, seed=1).controller.save_game("game")
+
+
+def test_journal_events_after_snapshot(monkeypatch):
+    monkeypatch.setattr(settings, "SAVE_MODE", "journal")
+    session = GameSession.new(3, seed=5)
+    session.controller.save_game("journal")
+    play(session, 4)
+    session.roll()
+    session.controller.journal.close()
+
+    loaded = SaveManager.load_game("journal")
+    try:
+        assert next_rolls(loaded.dice_rng) == next_rolls(session.controller.dice_rng)
+    finally:
+        loaded.journal.close()
+
+
+def test_json_roundtrip_and_old_saves():
+    session = GameSession.new(2, seed=11)
+    play(session, 3)
+    game = session.controller
+    data = SaveManager.game_to_dict(game)
+    restored = SaveManager.game_from_dict(data)
+    assert next_rolls(restored.dice_rng) == next_rolls(game.dice_rng)
+
+    # Sauvegarde sans compteur : les lancers enregistrés sont rejoués
+    del data["draws"]
+    restored = SaveManager.game_from_dict(data)
+    assert next_rolls(restored.dice_rng) == next_rolls(game.dice_rng)
+    assert restored.rng.getstate() == game.rng.getstate()
@@ -0,0 +1,132 @@
+import json
+import os
+import shutil
+import zlib
+
+import pytest
+
+from controller.game_session import GameSession
+from models import save_codec, save_manager
+from models.cards import CATALOG_SIZE
+from models.save_codec import SaveFormatError, decode_game, encode_game, read_info
+from models.save_manager import SaveManager
+
+
+@pytest.fixture(autouse=True)
+def saves_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(SaveManager, "SAVES_DIR", str(tmp_path / "saves"))
+
+
+def played_game(seed=11, turns=30):
+    session = GameSession.new(3, seed=seed)
+    for _ in range(turns):
+        session.roll()
+        session.roll({0, 1})
+        session.validate()
+        session.next_turn()
+    return session.controller
+
+
+def save_with_catalog(game, monkeypatch, change, name="old"):
+    """Sauvegarde écrite avec un jeu de base modifié par change(définitions)."""
+    definitions = json.loads(save_codec.CATALOG_JSON)
+    change(definitions)
+    raw = json.dumps(definitions).encode("utf-8")
+    fingerprint = save_codec.CATALOG_FINGERPRINT ^ 1
+    with monkeypatch.context() as patch:
+        for module in (save_codec, save_manager):
+            patch.setattr(module, "CATALOG_JSON", raw)
+            patch.setattr(module, "CATALOG_FINGERPRINT", fingerprint)
+        return SaveManager.save_game(game, name)
+
+
+def as_version_3(data):
+    """La même sauvegarde au format v3, définitions jointes au fichier."""
+    _, payload = save_codec.unpack(data)
+    out = bytearray(payload[: save_codec.GAME_HEADER.size])
+    save_codec.write_bytes(out, save_codec.CATALOG_JSON)
+    out += payload[save_codec.GAME_HEADER.size :]
+    payload = zlib.compress(bytes(out))
+    header = save_codec.HEADER.pack(
+        save_codec.MAGIC, 3, save_codec.FLAG_ZLIB, zlib.crc32(payload)
+    )
+    return header + payload
+
+
+def test_roundtrip():
+    game = played_game()
+    data = encode_game(game)
+    restored, seq = decode_game(data)
+    assert seq == 0
+    assert encode_game(restored) == data
+    assert restored.calculate_scores() == game.calculate_scores()
+    assert read_info(data)["scores"] == game.calculate_scores()
+
+
+def test_save_from_an_older_catalog_still_loads(monkeypatch):
+    game = played_game()
+
+    def retune(definitions):
+        for card in definitions:
+            if card["card_type"] == "penalite":
+                card["penalty_points"] += 1
+
+    save_with_catalog(game, monkeypatch, retune)
+    restored = SaveManager.load_game("old")
+    # Les pénalités sont celles de la sauvegarde, pas celles du jeu actuel
+    penalties = [c for c in restored.pen_deck.draw_pile if c is not None]
+    assert penalties and all(c.card_id >= CATALOG_SIZE for c in penalties)
+    assert [c.name for c in penalties] == [c.name for c in game.pen_deck.draw_pile]
+    restored.check_kingdom_index()
+    assert SaveManager.get_save_files()[0]["turn"] == game.turn
+
+
+def test_same_definitions_map_to_the_same_cards(monkeypatch):
+    game = played_game()
+    save_with_catalog(game, monkeypatch, lambda definitions: None)
+    restored = SaveManager.load_game("old")
+    assert encode_game(restored) == encode_game(game)
+
+
+def test_missing_catalog_is_reported(monkeypatch):
+    game = played_game(turns=3)
+    save_with_catalog(game, monkeypatch, lambda definitions: None)
+    shutil.rmtree(os.path.join(SaveManager.SAVES_DIR, SaveManager.CATALOGS_DIR))
+    with pytest.raises(SaveFormatError):
+        SaveManager.load_game("old")
+
+
+def test_saves_only_carry_the_catalog_fingerprint():
+    game = played_game()
+    data = encode_game(game)
+    assert len(data) < len(save_codec.CATALOG_JSON)
+    # Sauvegardes v3, définitions jointes : toujours lisibles
+    old = as_version_3(data)
+    assert len(old) > len(data)
+    restored, _ = decode_game(old)
+    assert encode_game(restored) == data
+    assert read_info(old) == read_info(data)
+
+
+def test_unreadable_save_is_reported():
+    game = played_game(turns=3)
+    path = SaveManager.save_game(game, "broken")
+    with open(path, "r+b") as f:
+        f.seek(20)
+        f.write(b"\xff\xff")
+    with pytest.raises(SaveFormatError):
+        SaveManager.load_game("broken")
+
+
+def test_interrupted_save_keeps_the_previous_one(monkeypatch):
+    game = played_game(turns=2)
+    SaveManager.save_game(game, "game")
+    expected = game.turn
+
+    def crash(*args):
+        raise OSError("disque plein")
+
+    monkeypatch.setattr(os, "replace", crash)
+    with pytest.raises(OSError):
+        SaveManager.save_game(played_game(turns=5), "game")
+    assert SaveManager.load_game("game").turn == expected
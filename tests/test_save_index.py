@@ -0,0 +1,78 @@
+import os
+
+import pytest
+
+from controller.game_controller import GameController
+from models.save_manager import SaveManager
+
+
+@pytest.fixture(autouse=True)
+def saves_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(SaveManager, "SAVES_DIR", str(tmp_path / "saves"))
+
+
+class CountingScan:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return SaveManager._scan_saves()
+
+
+def test_refresh_only_when_dir_changes_or_write_signalled():
+    GameController(2, seed=1).save_game("a")
+    index = SaveManager.index()
+    scan = CountingScan()
+    index.refresh(scan, SaveManager._read_save_info)
+    assert not index.refresh(scan, SaveManager._read_save_info)
+    assert scan.calls <= 1
+
+    # Fichier ajouté par un autre programme : la date du dossier change
+    with open(os.path.join(SaveManager.SAVES_DIR, "b.sav"), "wb") as f:
+        with open(os.path.join(SaveManager.SAVES_DIR, "a.sav"), "rb") as source:
+            f.write(source.read())
+    os.utime(SaveManager.SAVES_DIR, ns=(0, 0))
+    assert index.refresh(scan, SaveManager._read_save_info)
+    assert [save["name"] for save in index.query(order="name", descending=False)] == ["a", "b"]
+
+    index.changed()
+    assert index.refresh(scan, SaveManager._read_save_info)
+    assert not index.refresh(scan, SaveManager._read_save_info)
+
+
+def test_rebuild_in_one_transaction(monkeypatch):
+    for i in range(5):
+        GameController(2, seed=i).save_game(f"game{i}")
+    # Index vidé : tout est relu d'un coup
+    index = SaveManager.index()
+    with index._db:
+        index._db.execute("DELETE FROM saves")
+    index.changed()
+    commits = []
+    monkeypatch.setattr(index, "_db", CommitCounter(index._db, commits))
+    assert index.refresh(SaveManager._scan_saves, SaveManager._read_save_info)
+    assert index.count() == 5
+    assert len(commits) == 1
+
+
+class CommitCounter:
+    """Connexion SQLite qui compte les transactions validées."""
+
+    def __init__(self, db, commits):
+        self._db = db
+        self._commits = commits
+
+    def __getattr__(self, name):
+        return getattr(self._db, name)
+
+    def __enter__(self):
+        return self._db.__enter__()
+
+    def __exit__(self, *exc):
+        self._commits.append(exc)
+        return self._db.__exit__(*exc)
+
+    def commit(self):
+        self._commits.append(None)
+        self._db.commit()
@@ -0,0 +1,117 @@
+import asyncio
+import json
+
+import pytest
+
+from config import settings
+from controller.game_controller import GameController
+from models.save_journal import SaveJournal
+from models.save_manager import SaveManager
+from models.save_worker import save_worker
+from network.server import GameServer
+
+
+@pytest.fixture(autouse=True)
+def saves_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(SaveManager, "SAVES_DIR", str(tmp_path / "saves"))
+    monkeypatch.setattr(settings, "SAVE_MODE", "journal")
+    yield
+    save_worker.flush()
+
+
+class Client:
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.ids = 0
+
+    async def request(self, op, **fields):
+        self.ids += 1
+        message = {"id": self.ids, "op": op, **fields}
+        self.writer.write(json.dumps(message).encode("utf-8") + b"\n")
+        await self.writer.drain()
+        while True:
+            response = json.loads(await self.reader.readline())
+            if response.get("id") == self.ids:
+                return response
+
+
+def run_with_server(scenario):
+    async def main():
+        server = GameServer()
+        await server.start("127.0.0.1", 0)
+        reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+        try:
+            return await scenario(server, Client(reader, writer))
+        finally:
+            writer.close()
+            await server.close()
+
+    return asyncio.run(main())
+
+
+def test_roll_without_keep():
+    async def scenario(server, client):
+        session = (await client.request("new", players=2))["session"]
+        response = await client.request("roll", session=session)
+        assert response["ok"], response
+        assert all(1 <= d <= 6 for d in response["state"]["dice"])
+        response = await client.request("roll", session=session, keep="0")
+        assert not response["ok"]
+
+    run_with_server(scenario)
+
+
+def test_failing_action_keeps_the_table_running(monkeypatch):
+    def broken(self, session, request):
+        raise RuntimeError("boom")
+
+    async def scenario(server, client):
+        session = (await client.request("new", players=2))["session"]
+        monkeypatch.setattr(GameServer, "apply", broken)
+        response = await client.request("validate", session=session)
+        assert not response["ok"] and "boom" in response["error"]
+        monkeypatch.undo()
+        response = await client.request("state", session=session)
+        assert response["ok"]
+
+    run_with_server(scenario)
+
+
+def test_tables_saving_together_use_their_own_files():
+    async def scenario(server, client):
+        first = (await client.request("new", players=2))["session"]
+        second = (await client.request("new", players=3))["session"]
+        for session in (first, second):
+            assert (await client.request("save", session=session))["ok"]
+        save_worker.flush()
+        names = {server.sessions[s].save_name: s for s in (first, second)}
+        assert len(names) == 2
+        for name, session in names.items():
+            game = SaveJournal.read(name)[0]
+            assert game.num_players == server.sessions[session].game.num_players
+
+    run_with_server(scenario)
+
+
+def test_journal_refuses_to_overwrite():
+    journal = SaveJournal.create(GameController(2, seed=1), "taken")
+    journal.close()
+    with pytest.raises(FileExistsError):
+        SaveJournal.create(GameController(3, seed=2), "taken")
+    assert SaveJournal.read("taken")[0].num_players == 2
+
+
+def test_end_session_closes_journal():
+    async def scenario(server, client):
+        session_id = (await client.request("new", players=2))["session"]
+        await client.request("roll", session=session_id)
+        assert (await client.request("save", session=session_id))["ok"]
+        journal = server.sessions[session_id].game.controller.journal
+        assert journal is not None
+        assert (await client.request("leave", session=session_id))["ok"]
+        assert session_id not in server.sessions
+        save_worker.flush()
+        assert journal._file.closed
+
+    run_with_server(scenario)
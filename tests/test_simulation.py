@@ -0,0 +1,40 @@
+import random
+
+import pytest
+
+from controller.game_controller import GameController
+from controller.simulation import (
+    SimulatedGame,
+    make_policy,
+    play_turn,
+    run_simulation,
+)
+
+
+def play(game, policy_names, seed):
+    policy_rng = random.Random(seed)
+    policies = [make_policy(name, policy_rng) for name in policy_names]
+    while not game.is_game_over():
+        play_turn(game, policies[game.current_player - 1])
+        game.next_player()
+    return game
+
+
+@pytest.mark.parametrize("seed", (1, 7, 42))
+@pytest.mark.parametrize("policies", (("greedy", "hold"), ("random", "first", "greedy")))
+def test_lean_game_plays_like_full_game(seed, policies):
+    lean = play(SimulatedGame(len(policies), seed=seed), policies, seed)
+    full = play(GameController(len(policies), seed=seed), policies, seed)
+    assert lean.kingdoms == full.kingdoms
+    assert lean.calculate_scores() == full.calculate_scores()
+    full.check_kingdom_index()
+    # Partie complète : les lancers sont notés, la partie légère n'a rien gardé
+    assert any(action[0] == "roll" for action in full.actions)
+    assert lean.actions == []
+
+
+def test_simulation_is_reproducible():
+    first = run_simulation(200, num_players=3, policy_names=["random"], seed=5)
+    again = run_simulation(200, num_players=3, policy_names=["random"], seed=5)
+    assert first.to_dict() == again.to_dict()
+    assert first.games == 200
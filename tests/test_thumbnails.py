@@ -0,0 +1,77 @@
+import pygame
+import pytest
+
+from controller.game_controller import GameController
+from models.save_manager import SaveManager
+from models.save_worker import SaveWorker
+from view.local_game_screen import LocalGameScreen, die_color
+from view.offscreen import init_headless
+from view.screen_manager import ScreenManager
+from view.thumbnails import THUMBNAIL_SIZE, ThumbnailCache, schedule_thumbnail
+
+
+@pytest.fixture(autouse=True)
+def saves_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(SaveManager, "SAVES_DIR", str(tmp_path / "saves"))
+
+
+def game_screen(game):
+    """Écran de jeu en mémoire, entré dans la partie comme à l'écran."""
+    init_headless()
+    screen = LocalGameScreen(ScreenManager(pygame.Surface((1280, 720))))
+    screen.enter(game)
+    return screen
+
+
+class RecordingWorker:
+    """Garde les travaux soumis au lieu de les exécuter."""
+
+    def __init__(self):
+        self.jobs = []
+
+    def submit(self, key, job, notify=True):
+        self.jobs.append((key, job))
+
+
+def test_worker_only_gets_bytes():
+    game = GameController(3, seed=5)
+    path = game.save_game("thumb")
+    worker = RecordingWorker()
+    schedule_thumbnail(game_screen(game), path, worker=worker)
+
+    (key, job), = worker.jobs
+    assert key == ("thumbnail", "thumb")
+    # Rien que le thread de sauvegarde partagerait avec le thread principal
+    assert not any(isinstance(arg, pygame.Surface) for arg in job.args)
+    assert game not in job.args
+    assert isinstance(job.args[0], bytes)
+
+
+def test_thumbnail_written_by_worker():
+    game = GameController(2, seed=9)
+    path = game.save_game("thumb")
+    screen = game_screen(game)
+    worker = SaveWorker()
+    try:
+        schedule_thumbnail(screen, path, worker=worker)
+        worker.flush()
+        assert worker.poll() == []
+    finally:
+        worker.close()
+
+    surface = pygame.image.load(SaveManager.thumbnail_path("thumb"))
+    assert surface.get_size() == THUMBNAIL_SIZE
+    assert ThumbnailCache(45).get("thumb").get_height() == 45
+
+
+def test_thumbnail_shows_the_dice_on_screen():
+    game = GameController(2, seed=4)
+    screen = game_screen(game)
+    screen.do_roll()
+    thumbnail = screen.thumbnail(THUMBNAIL_SIZE)
+    assert thumbnail.get_size() == THUMBNAIL_SIZE
+    # Centre du premier dé, à l'échelle de la miniature
+    x = (screen.width // 2 - 180) * THUMBNAIL_SIZE[0] // screen.width
+    y = (screen.height // 2 - 50) * THUMBNAIL_SIZE[1] // screen.height
+    color = tuple(thumbnail.get_at((x, y)))[:3]
+    assert color == die_color(screen.session.dice_pool.dice[0])
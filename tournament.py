@@ -0,0 +1,72 @@
+import argparse
+import json
+import os
+import time
+
+from controller.ai_player import AIPlayer
+from controller.simulation import POLICIES
+from controller.tournament import ROUND_ROBIN, SWISS, run_tournament
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Tournoi entre politiques de jeu, avec classement Elo."
+    )
+    parser.add_argument(
+        "--policy",
+        action="append",
+        choices=sorted(POLICIES),
+        help="politique participante (répéter l'option) ; par défaut toutes sauf "
+        "expectimax, bien plus lente",
+    )
+    parser.add_argument(
+        "-p",
+        "--players",
+        type=int,
+        nargs="+",
+        default=[2],
+        choices=(2, 3, 4),
+        help="tailles de table",
+    )
+    parser.add_argument("-n", "--games", type=int, default=100000)
+    parser.add_argument("--format", choices=(ROUND_ROBIN, SWISS), default=ROUND_ROBIN)
+    parser.add_argument("--rounds", type=int, default=5, help="manches (suisse)")
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--chunk", type=int, default=500, help="parties par job")
+    parser.add_argument(
+        "-o",
+        "--output",
+        default=os.path.join("cache", "tournament.jsonl"),
+        help="résultats partie par partie (JSONL)",
+    )
+    parser.add_argument(
+        "--resume", action="store_true", help="reprend un tournoi interrompu"
+    )
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    ratings = run_tournament(
+        args.policy or sorted(set(POLICIES) - {AIPlayer.name}),
+        args.output,
+        table_sizes=args.players,
+        num_games=args.games,
+        fmt=args.format,
+        rounds=args.rounds,
+        workers=args.workers,
+        seed=args.seed,
+        chunk_size=args.chunk,
+        resume=args.resume,
+    )
+    elapsed = time.perf_counter() - start
+
+    result = {
+        "games": ratings.total,
+        "elapsed_s": elapsed,
+        "ratings": ratings.table(),
+    }
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
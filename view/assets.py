@@ -0,0 +1,148 @@
+import os
+import threading
+
+import pygame
+
+
+ASSETS_DIR = "assets"
+FONT = os.path.join("fonts", "medieval.ttf")
+MENU_BACKGROUND = "menu_background.jpg"
+MENU_BANNER = "menu_banner.png"
+MENU_SONG = "menu_song.mp3"
+
+
+class AssetManager:
+    """
+    Ressources partagées par tous les écrans.
+
+    Chaque fichier n'est lu qu'une fois ; les images sont converties au
+    format de l'écran au premier usage et leurs versions redimensionnées
+    sont gardées par taille. Les polices (fichier, taille) sont partagées,
+    ce qui permet aussi au cache de texte de les reconnaître d'un écran à
+    l'autre.
+
+    preload() lit les fichiers sur un thread pendant le démarrage ; la
+    conversion, qui demande l'affichage, reste faite par le thread principal.
+    """
+
+    def __init__(self, root=ASSETS_DIR):
+        self.root = root
+        self._raw = {}  # nom -> surface lue (None si fichier absent)
+        self._images = {}  # nom -> surface convertie
+        self._scaled = {}  # (nom, taille) -> surface
+        self._fonts = {}  # (nom, taille) -> Font
+        self._music = None
+        self._lock = threading.Lock()
+        self._loader = None
+
+    def path(self, name):
+        return os.path.join(self.root, name)
+
+    # ————— Images —————
+
+    def _read(self, name):
+        """Lit un fichier image une seule fois (tout thread)."""
+        with self._lock:
+            if name in self._raw:
+                return self._raw[name]
+        try:
+            surface = pygame.image.load(self.path(name))
+        except (FileNotFoundError, pygame.error):
+            surface = None
+        with self._lock:
+            return self._raw.setdefault(name, surface)
+
+    def image(self, name):
+        """Image convertie au format de l'écran, ou None si le fichier manque."""
+        if name in self._images:
+            return self._images[name]
+        surface = self._read(name)
+        if surface is not None and pygame.display.get_surface() is not None:
+            if surface.get_flags() & pygame.SRCALPHA:
+                surface = surface.convert_alpha()
+            else:
+                surface = surface.convert()
+        self._images[name] = surface
+        return surface
+
+    def scaled(self, name, size):
+        """Image redimensionnée, gardée pour chaque taille demandée."""
+        size = (int(size[0]), int(size[1]))
+        key = (name, size)
+        if key not in self._scaled:
+            surface = self.image(name)
+            if surface is not None and surface.get_size() != size:
+                surface = pygame.transform.scale(surface, size)
+            self._scaled[key] = surface
+        return self._scaled[key]
+
+    # ————— Polices —————
+
+    def font(self, name=FONT, size=24):
+        """Police partagée ; name=None pour la police par défaut de pygame."""
+        key = (name, size)
+        font = self._fonts.get(key)
+        if font is None:
+            path = self.path(name) if name is not None else None
+            font = self._fonts[key] = pygame.font.Font(path, size)
+        return font
+
+    # ————— Musique —————
+
+    def play_music(self, name, loops=-1):
+        """
+        Joue une musique en boucle, sans la relancer si elle joue déjà.
+        Sans fichier ou sans carte son, le jeu continue en silence.
+        """
+        if self._music == name and pygame.mixer.get_init() and pygame.mixer.music.get_busy():
+            return
+        self._music = name
+        try:
+            pygame.mixer.music.load(self.path(name))
+            pygame.mixer.music.play(loops)
+        except (FileNotFoundError, pygame.error):
+            pass
+
+    # ————— Préchargement —————
+
+    def preload(self, images=(), fonts=(), background=True):
+        """
+        Lit à l'avance des images et ouvre des polices ((nom, taille)).
+        Les images sont lues sur un thread si background=True.
+        """
+        for name, size in fonts:
+            self.font(name, size)
+        images = list(images)
+        if not background:
+            for name in images:
+                self._read(name)
+            return
+
+        def load_all():
+            for name in images:
+                self._read(name)
+
+        self._loader = threading.Thread(target=load_all, name="asset-loader", daemon=True)
+        self._loader.start()
+
+    def wait(self, timeout=None):
+        """Attend la fin du préchargement."""
+        if self._loader is not None:
+            self._loader.join(timeout)
+
+    def clear(self):
+        """Oublie les images converties (ex. après un changement de mode vidéo)."""
+        self._images.clear()
+        self._scaled.clear()
+
+
+# Ressources partagées par le jeu
+assets = AssetManager()
+
+
+def preload_default_assets():
+    """Ressources des écrans principaux, chargées au démarrage."""
+    assets.preload(
+        images=[MENU_BACKGROUND, MENU_BANNER],
+        fonts=[(FONT, 36), (FONT, 24), (None, 36), (None, 24)],
+    )
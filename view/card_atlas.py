@@ -0,0 +1,220 @@
+import argparse
+import json
+import math
+import os
+
+import pygame
+
+from models.cards import registry
+from view.assets import assets, FONT
+from view.text_cache import render_text
+
+
+CARD_SIZE = (120, 160)
+
+# Couleur des cartes sans image, par type
+PLACEHOLDER_COLORS = {"habitant": (70, 130, 180)}  # Bleu
+DEFAULT_PLACEHOLDER_COLOR = (139, 69, 19)  # Marron
+
+
+def card_image_path(card):
+    """Image source d'une carte, relative au dossier assets."""
+    return os.path.join("cards", card.card_type, f"{card.name}.png")
+
+
+class CardAtlas:
+    """
+    Toutes les images de cartes d'une taille donnée, rassemblées dans une
+    seule image (grille) : une carte se dessine par un blit de sa zone.
+
+    L'atlas est rangé dans cache/card_atlas_<L>x<H>.png avec un manifeste
+    JSON (position de chaque carte, date des images sources). Il n'est
+    reconstruit que si une image source est ajoutée, supprimée ou modifiée ;
+    sinon le démarrage ne coûte qu'un seul décodage d'image.
+    """
+
+    CACHE_DIR = "cache"
+    VERSION = 1
+
+    def __init__(self, size=CARD_SIZE, cards=None):
+        self.size = (int(size[0]), int(size[1]))
+        cards = registry.cards if cards is None else cards
+        # Une case par (type, nom) : les cartes de même nom partagent l'image
+        self.cards = {}
+        for card in cards:
+            self.cards.setdefault((card.card_type, card.name), card)
+        base = os.path.join(self.CACHE_DIR, "card_atlas_{}x{}".format(*self.size))
+        self.image_path = base + ".png"
+        self.manifest_path = base + ".json"
+        self.surface = None
+        self._slots = {}  # (type, nom) -> (x, y)
+        self._tiles = {}  # (type, nom) -> sous-surface
+
+    @staticmethod
+    def slot_name(key):
+        return "/".join(key)
+
+    def sources(self):
+        """{image source: date} ; None pour une carte sans image."""
+        sources = {}
+        for card in self.cards.values():
+            path = card_image_path(card)
+            try:
+                sources[path] = os.path.getmtime(assets.path(path))
+            except OSError:
+                sources[path] = None
+        try:
+            sources[FONT] = os.path.getmtime(assets.path(FONT))
+        except OSError:
+            sources[FONT] = None
+        return sources
+
+    # ————— Construction —————
+
+    def _render_card(self, card):
+        image = assets.scaled(card_image_path(card), self.size)
+        if image is not None:
+            return image
+        # Carte sans image : rectangle coloré + nom centré
+        image = pygame.Surface(self.size)
+        image.fill(PLACEHOLDER_COLORS.get(card.card_type, DEFAULT_PLACEHOLDER_COLOR))
+        txt = render_text(assets.font(FONT, 24), card.name, (255, 255, 255))
+        image.blit(txt, txt.get_rect(center=(self.size[0] // 2, self.size[1] // 2)))
+        return image
+
+    def build(self):
+        """Dessine toutes les cartes dans l'atlas et l'écrit sur disque."""
+        keys = sorted(self.cards)
+        columns = max(1, math.ceil(math.sqrt(len(keys))))
+        rows = max(1, math.ceil(len(keys) / columns))
+        w, h = self.size
+        surface = pygame.Surface((columns * w, rows * h), pygame.SRCALPHA)
+        slots = {}
+        for i, key in enumerate(keys):
+            pos = ((i % columns) * w, (i // columns) * h)
+            surface.blit(self._render_card(self.cards[key]), pos)
+            slots[key] = pos
+
+        os.makedirs(self.CACHE_DIR, exist_ok=True)
+        tmp_image = self.image_path[: -len(".png")] + ".tmp.png"
+        pygame.image.save(surface, tmp_image)
+        os.replace(tmp_image, self.image_path)
+        manifest = {
+            "version": self.VERSION,
+            "size": list(self.size),
+            "sources": self.sources(),
+            "slots": {self.slot_name(k): list(pos) for k, pos in slots.items()},
+        }
+        tmp_manifest = self.manifest_path + ".tmp"
+        with open(tmp_manifest, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=1)
+        os.replace(tmp_manifest, self.manifest_path)
+        self._use(surface, slots)
+        return self
+
+    # ————— Chargement —————
+
+    def _read_manifest(self):
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def is_fresh(self):
+        """Vrai si l'atlas sur disque correspond aux images sources actuelles."""
+        manifest = self._read_manifest()
+        return (
+            manifest is not None
+            and manifest.get("version") == self.VERSION
+            and manifest.get("size") == list(self.size)
+            and manifest.get("sources") == self.sources()
+            and set(manifest.get("slots", ())) == {self.slot_name(k) for k in self.cards}
+            and os.path.exists(self.image_path)
+        )
+
+    def load(self):
+        """Charge l'atlas depuis le disque, ou le reconstruit s'il est périmé."""
+        if not self.is_fresh():
+            return self.build()
+        manifest = self._read_manifest()
+        try:
+            surface = pygame.image.load(self.image_path)
+        except (OSError, pygame.error):
+            return self.build()
+        slots = {
+            tuple(name.split("/", 1)): tuple(pos)
+            for name, pos in manifest["slots"].items()
+        }
+        self._use(surface, slots)
+        return self
+
+    def _use(self, surface, slots):
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        self.surface = surface
+        self._slots = slots
+        self._tiles = {}
+
+    # ————— Dessin —————
+
+    def get(self, card):
+        """Image de la carte (sous-surface de l'atlas)."""
+        key = (card.card_type, card.name)
+        tile = self._tiles.get(key)
+        if tile is None:
+            if key not in self._slots:
+                # Carte inconnue lors de la construction : on la dessine seule
+                tile = self._render_card(card)
+            else:
+                tile = self.surface.subsurface(pygame.Rect(self._slots[key], self.size))
+            self._tiles[key] = tile
+        return tile
+
+    def blit(self, surface, card, pos):
+        """Dessine une carte directement depuis l'atlas."""
+        key = (card.card_type, card.name)
+        if key in self._slots:
+            surface.blit(self.surface, pos, pygame.Rect(self._slots[key], self.size))
+        else:
+            surface.blit(self.get(card), pos)
+
+
+_atlases = {}
+
+
+def card_atlas(size=CARD_SIZE):
+    """Atlas partagé pour une taille de carte, chargé au premier appel."""
+    size = (int(size[0]), int(size[1]))
+    atlas = _atlases.get(size)
+    if atlas is None:
+        atlas = _atlases[size] = CardAtlas(size).load()
+    return atlas
+
+
+def parse_size(text):
+    w, h = text.lower().split("x")
+    return int(w), int(h)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Construit l'atlas des cartes")
+    parser.add_argument(
+        "--size",
+        type=parse_size,
+        action="append",
+        help="taille des cartes, ex. 120x160 (plusieurs possibles)",
+    )
+    parser.add_argument(
+        "--force", action="store_true", help="reconstruit même si l'atlas est à jour"
+    )
+    args = parser.parse_args()
+
+    pygame.font.init()
+    for size in args.size or [CARD_SIZE]:
+        atlas = CardAtlas(size)
+        if args.force or not atlas.is_fresh():
+            atlas.build()
+            print(f"{atlas.image_path} : {len(atlas.cards)} cartes")
+        else:
+            print(f"{atlas.image_path} : à jour")
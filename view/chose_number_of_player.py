@@ -1,71 +1,68 @@
-import pygame, os
 from view.components.button import Button
+from view.screen_manager import Screen
+from view.text_cache import render_text
+from view.assets import assets, FONT, MENU_BACKGROUND
 
 
-def chose_number_of_player(screen, *args, **kwargs):
-    clock = pygame.time.Clock()
-    width, height = screen.get_size()
+class ChoseNumberOfPlayerScreen(Screen):
+    def __init__(self, manager):
+        super().__init__(manager)
+        width, height = self.width, self.height
 
-    bg = pygame.image.load(os.path.join("assets", "menu_background.jpg"))
-    bg = pygame.transform.scale(bg, (width, height))
+        self.bg = assets.scaled(MENU_BACKGROUND, (width, height))
 
-    font_path = os.path.join("assets", "fonts", "medieval.ttf")
-    font = pygame.font.Font(font_path, 36)
-    small_font = pygame.font.Font(font_path, 24)
+        self.font = assets.font(FONT, 36)
+        small_font = assets.font(FONT, 24)
 
-    button_width = 200
-    button_height = 60
-    button_spacing = 20
-    start_y = height // 2 - (button_height * 3 + button_spacing * 2) // 2
+        button_width = 200
+        button_height = 60
+        button_spacing = 20
+        start_y = height // 2 - (button_height * 3 + button_spacing * 2) // 2
 
-    player_buttons = []
-    for i in range(2, 5):
-        button = Button(
-            x=width // 2 - button_width // 2,
-            y=start_y + (i - 2) * (button_height + button_spacing),
-            width=button_width,
-            height=button_height,
-            text=f"{i} Joueurs",
-            font=font,
-            callback=lambda x=i: ("local_game", x),
-        )
-        player_buttons.append(button)
-
-    back_button = Button(
-        x=20,
-        y=20,
-        width=100,
-        height=40,
-        text="Retour",
-        font=small_font,
-        callback=lambda: ("menu", None),
-    )
+        self.player_buttons = []
+        for i in range(2, 5):
+            button = Button(
+                x=width // 2 - button_width // 2,
+                y=start_y + (i - 2) * (button_height + button_spacing),
+                width=button_width,
+                height=button_height,
+                text=f"{i} Joueurs",
+                font=self.font,
+                callback=lambda x=i: ("local_game", x),
+            )
+            self.player_buttons.append(button)
 
-    while True:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                return "quit"
+        self.back_button = Button(
+            x=20,
+            y=20,
+            width=100,
+            height=40,
+            text="Retour",
+            font=small_font,
+            callback=lambda: ("menu", None),
+        )
 
-            back_result = back_button.handle_event(event)
-            if back_result is not None:
-                return back_result
+    def handle_event(self, event):
+        back_result = self.back_button.handle_event(event)
+        if back_result is not None:
+            return back_result
 
-            for button in player_buttons:
-                result = button.handle_event(event)
-                if result is not None:
-                    return result
+        for button in self.player_buttons:
+            result = button.handle_event(event)
+            if result is not None:
+                return result
+        return None
 
-        screen.blit(bg, (0, 0))
+    def draw(self, surface):
+        surface.blit(self.bg, (0, 0))
 
         title_text = "Choisissez le nombre de joueurs"
-        title_surf = font.render(title_text, True, (30, 20, 0))
-        title_rect = title_surf.get_rect(center=(width // 2, 100))
-        screen.blit(title_surf, title_rect)
-
-        for button in player_buttons:
-            button.draw(screen)
+        title_surf = render_text(self.font, title_text, (30, 20, 0))
+        title_rect = title_surf.get_rect(center=(self.width // 2, 100))
+        surface.blit(title_surf, title_rect)
 
-        back_button.draw(screen)
+        for button in self.player_buttons:
+            button.draw(surface)
 
-        pygame.display.flip()
-        clock.tick(60)
+        self.back_button.draw(surface)
+        return None
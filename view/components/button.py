@@ -1,4 +1,5 @@
 import pygame
+from view.text_cache import render_text
 
 
 class Button:
@@ -24,7 +25,7 @@ class Button:
 
     def draw(self, screen):
         pygame.draw.rect(screen, self.current_color, self.rect, border_radius=10)
-        text_surf = self.font.render(self.text, True, (30, 20, 0))
+        text_surf = render_text(self.font, self.text, (30, 20, 0))
         text_rect = text_surf.get_rect(center=self.rect.center)
         screen.blit(text_surf, text_rect)
 
@@ -0,0 +1,198 @@
+from collections import OrderedDict
+
+import pygame
+from view.text_cache import render_text
+
+
+class VirtualList:
+    """
+    Liste déroulante virtualisée : seules les lignes visibles sont
+    dessinées, et les données sont demandées par pages au fur et à mesure
+    du défilement.
+
+    count()              -> nombre total de lignes
+    fetch(offset, limit) -> éléments [offset, offset + limit)
+    row_text(élément)    -> texte affiché sur la ligne
+    callback(élément)    -> résultat retourné au clic (ou Entrée)
+    row_icon(élément)    -> image dessinée à gauche de la ligne, ou None
+
+    Le défilement se fait à la molette, aux flèches, Page préc./suiv.,
+    Début/Fin ; la ligne sous la souris est trouvée par calcul d'indice.
+    """
+
+    def __init__(
+        self,
+        rect,
+        row_height,
+        count,
+        fetch,
+        row_text,
+        font,
+        callback,
+        row_spacing=20,
+        page_size=50,
+        max_pages=8,
+        base_color=(160, 130, 90),
+        hover_color=(200, 170, 110),
+        row_icon=None,
+    ):
+        self.rect = pygame.Rect(rect)
+        self.row_height = row_height
+        self.row_spacing = row_spacing
+        self.stride = row_height + row_spacing
+        self._count = count
+        self._fetch = fetch
+        self.row_text = row_text
+        self.font = font
+        self.callback = callback
+        self.row_icon = row_icon
+        self.page_size = page_size
+        self.max_pages = max_pages
+        self.base_color = base_color
+        self.hover_color = hover_color
+        self._pages = OrderedDict()  # numéro de page -> éléments (LRU)
+        self.scroll = 0  # en pixels
+        self.hovered = None
+        self.selected = None
+        self.refresh()
+
+    def refresh(self):
+        """Relit le nombre de lignes et oublie les pages déjà chargées."""
+        self.count = self._count()
+        self._pages.clear()
+        self.scroll = min(self.scroll, self.max_scroll())
+        if self.selected is not None and self.selected >= self.count:
+            self.selected = self.count - 1 if self.count else None
+
+    # ————— Données —————
+
+    def item(self, index):
+        """Élément de la ligne index (sa page est chargée si besoin)."""
+        page, pos = divmod(index, self.page_size)
+        items = self._pages.get(page)
+        if items is None:
+            items = self._fetch(page * self.page_size, self.page_size)
+            self._pages[page] = items
+            if len(self._pages) > self.max_pages:
+                self._pages.popitem(last=False)
+        else:
+            self._pages.move_to_end(page)
+        return items[pos] if pos < len(items) else None
+
+    # ————— Géométrie —————
+
+    def content_height(self):
+        return max(0, self.count * self.stride - self.row_spacing)
+
+    def max_scroll(self):
+        return max(0, self.content_height() - self.rect.height)
+
+    def scroll_to(self, scroll):
+        self.scroll = max(0, min(int(scroll), self.max_scroll()))
+
+    def scroll_by(self, dy):
+        self.scroll_to(self.scroll + dy)
+
+    def visible_range(self):
+        """Indices (début, fin) des lignes au moins en partie visibles."""
+        first = self.scroll // self.stride
+        last = (self.scroll + self.rect.height) // self.stride + 1
+        return first, min(last, self.count)
+
+    def row_rect(self, index):
+        y = self.rect.top + index * self.stride - self.scroll
+        return pygame.Rect(self.rect.left, y, self.rect.width, self.row_height)
+
+    def index_at(self, pos):
+        """Indice de la ligne sous pos, ou None (marge ou hors liste)."""
+        if not self.rect.collidepoint(pos):
+            return None
+        index, offset = divmod(pos[1] - self.rect.top + self.scroll, self.stride)
+        if offset >= self.row_height or index >= self.count:
+            return None
+        return index
+
+    def ensure_visible(self, index):
+        top = index * self.stride
+        if top < self.scroll:
+            self.scroll_to(top)
+        elif top + self.row_height > self.scroll + self.rect.height:
+            self.scroll_to(top + self.row_height - self.rect.height)
+
+    def select(self, index):
+        if self.count:
+            self.selected = max(0, min(index, self.count - 1))
+            self.ensure_visible(self.selected)
+
+    # ————— Événements —————
+
+    def activate(self, index):
+        item = self.item(index)
+        return None if item is None else self.callback(item)
+
+    def handle_event(self, event):
+        if event.type == pygame.MOUSEMOTION:
+            self.hovered = self.index_at(event.pos)
+        elif event.type == pygame.MOUSEWHEEL:
+            self.scroll_by(-event.y * self.stride)
+            self.hovered = self.index_at(pygame.mouse.get_pos())
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            index = self.index_at(event.pos)
+            if index is not None:
+                return self.activate(index)
+        elif event.type == pygame.KEYDOWN and self.count:
+            rows_per_page = max(1, self.rect.height // self.stride)
+            current = -1 if self.selected is None else self.selected
+            if event.key == pygame.K_DOWN:
+                self.select(current + 1)
+            elif event.key == pygame.K_UP:
+                self.select(max(0, current - 1))
+            elif event.key == pygame.K_PAGEDOWN:
+                self.select(current + rows_per_page)
+            elif event.key == pygame.K_PAGEUP:
+                self.select(max(0, current - rows_per_page))
+            elif event.key == pygame.K_HOME:
+                self.select(0)
+            elif event.key == pygame.K_END:
+                self.select(self.count - 1)
+            elif event.key in (pygame.K_RETURN, pygame.K_KP_ENTER):
+                if self.selected is not None:
+                    return self.activate(self.selected)
+        return None
+
+    # ————— Dessin —————
+
+    def draw(self, screen):
+        previous_clip = screen.get_clip()
+        screen.set_clip(self.rect)
+        first, last = self.visible_range()
+        for index in range(first, last):
+            item = self.item(index)
+            if item is None:
+                continue
+            rect = self.row_rect(index)
+            active = index == self.hovered or index == self.selected
+            color = self.hover_color if active else self.base_color
+            pygame.draw.rect(screen, color, rect, border_radius=10)
+            text_rect = rect
+            icon = self.row_icon(item) if self.row_icon else None
+            if icon is not None:
+                icon_rect = icon.get_rect(midleft=(rect.left + 10, rect.centery))
+                screen.blit(icon, icon_rect)
+                text_rect = rect.copy()
+                text_rect.width -= icon_rect.right - rect.left
+                text_rect.left = icon_rect.right
+            text_surf = render_text(self.font, self.row_text(item), (30, 20, 0))
+            screen.blit(text_surf, text_surf.get_rect(center=text_rect.center))
+        screen.set_clip(previous_clip)
+
+        # Barre de défilement
+        if self.max_scroll():
+            track = pygame.Rect(self.rect.right + 10, self.rect.top, 6, self.rect.height)
+            thumb_h = max(20, track.height * self.rect.height // self.content_height())
+            thumb_y = track.top + (track.height - thumb_h) * self.scroll // self.max_scroll()
+            pygame.draw.rect(screen, (80, 80, 80), track, border_radius=3)
+            pygame.draw.rect(
+                screen, (200, 170, 110), (track.left, thumb_y, track.width, thumb_h),
+                border_radius=3,
+            )
@@ -1,84 +1,97 @@
 import pygame
 from view.components.button import Button
+from view.components.virtual_list import VirtualList
+from view.screen_manager import Screen
 from models.save_manager import SaveManager
+from view.text_cache import render_text
+from view.assets import assets
+from view.thumbnails import ThumbnailCache
 
 
-def load_game_loop(screen, *args, **kwargs):
-    clock = pygame.time.Clock()
-    width, height = screen.get_size()
+class LoadGameScreen(Screen):
+    def __init__(self, manager):
+        super().__init__(manager)
+        width, height = self.width, self.height
 
-    # Charger la police
-    font_path = pygame.font.get_default_font()
-    font = pygame.font.Font(font_path, 24)
-    title_font = pygame.font.Font(font_path, 36)
+        # Charger la police
+        self.font = font = assets.font(None, 24)
+        title_font = assets.font(None, 36)
 
-    # Charger le fond d'écran
-    bg = pygame.Surface((width, height))
-    bg.fill((50, 50, 50))  # Fond gris foncé
+        # Charger le fond d'écran
+        self.bg = pygame.Surface((width, height))
+        self.bg.fill((50, 50, 50))  # Fond gris foncé
 
-    # Titre
-    title = title_font.render("Charger une partie", True, (255, 255, 255))
-    title_rect = title.get_rect(center=(width // 2, 50))
+        # Titre
+        self.title = render_text(title_font, "Charger une partie", (255, 255, 255))
+        self.title_rect = self.title.get_rect(center=(width // 2, 50))
 
-    # Obtenir la liste des sauvegardes
-    saves = SaveManager.get_save_files()
+        # Liste des sauvegardes : seules les lignes visibles sont lues et dessinées
+        def save_text(save):
+            return (
+                f"{save['name']} - {save['date']} - "
+                f"{save['num_players']} joueurs, tour {save['turn']}"
+            )
 
-    # Créer les boutons pour chaque sauvegarde
-    buttons = []
-    button_height = 60
-    button_spacing = 20
-    start_y = 120
+        # Miniatures du plateau (écrites par le thread de sauvegarde)
+        self.thumbnails = ThumbnailCache(height=52)
+        self.message = None
 
-    for save in saves:
-        save_text = f"{save['name']} - {save['date']}"
-        b = Button(
-            x=width // 2 - 200,
-            y=start_y,
-            width=400,
-            height=button_height,
-            text=save_text,
+        self.save_list = VirtualList(
+            rect=(width // 2 - 350, 120, 700, height - 120 - 110),
+            row_height=60,
+            count=SaveManager.count_saves,
+            fetch=lambda offset, limit: SaveManager.get_save_files(offset, limit),
+            row_text=save_text,
             font=font,
-            callback=lambda s=save["name"]: ("load_save", s),
+            callback=lambda save: ("load_save", save["name"]),
+            row_icon=lambda save: self.thumbnails.get(save["name"]),
         )
-        buttons.append(b)
-        start_y += button_height + button_spacing
 
-    # Bouton retour
-    back_button = Button(
-        x=width // 2 - 100,
-        y=height - 80,
-        width=200,
-        height=50,
-        text="Retour",
-        font=font,
-        callback=lambda: ("menu", None),
-    )
-    buttons.append(back_button)
+        # Bouton retour
+        self.back_button = Button(
+            x=width // 2 - 100,
+            y=height - 80,
+            width=200,
+            height=50,
+            text="Retour",
+            font=font,
+            callback=lambda: ("menu", None),
+        )
 
-    while True:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                return "quit"
+    def enter(self, message=None, *args, **kwargs):
+        # Des sauvegardes ont pu être ajoutées depuis la dernière visite
+        self.save_list.refresh()
+        self.thumbnails.clear()
+        # Message d'erreur (sauvegarde illisible), affiché sous le titre
+        self.message = None
+        if message:
+            self.message = render_text(self.font, message, (255, 120, 120))
 
-            for button in buttons:
-                result = button.handle_event(event)
-                if result is not None:
-                    return result
+    def handle_event(self, event):
+        for widget in (self.save_list, self.back_button):
+            result = widget.handle_event(event)
+            if result is not None:
+                return result
+        return None
 
-        # Dessiner
-        screen.blit(bg, (0, 0))
-        screen.blit(title, title_rect)
+    def draw(self, surface):
+        surface.blit(self.bg, (0, 0))
+        surface.blit(self.title, self.title_rect)
+        if self.message is not None:
+            surface.blit(
+                self.message, self.message.get_rect(center=(self.width // 2, 95))
+            )
 
         # Message si pas de sauvegarde
-        if not saves:
-            no_saves = font.render(
-                "Aucune sauvegarde disponible", True, (255, 255, 255)
+        if not self.save_list.count:
+            no_saves = render_text(
+                self.font, "Aucune sauvegarde disponible", (255, 255, 255)
             )
-            no_saves_rect = no_saves.get_rect(center=(width // 2, height // 2))
-            screen.blit(no_saves, no_saves_rect)
-
-        for button in buttons:
-            button.draw(screen)
+            no_saves_rect = no_saves.get_rect(
+                center=(self.width // 2, self.height // 2)
+            )
+            surface.blit(no_saves, no_saves_rect)
 
-        pygame.display.flip()
-        clock.tick(60)
+        self.save_list.draw(surface)
+        self.back_button.draw(surface)
+        return None
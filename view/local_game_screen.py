@@ -1,272 +1,464 @@
 import pygame
-import os
 from view.components.button import Button
+from view.scene import Scene
+from view.screen_manager import Screen
+from view.text_cache import render_text
+from view.assets import assets, FONT, MENU_BACKGROUND
+from view.card_atlas import card_atlas
 from controller.game_controller import GameController
-from models.dice import Dice
+from controller.game_session import GameSession
+from controller.ai_player import AIPlayer
+from network.client import RemoteError, RemoteGameSession
+from models.dice import ROLLS_PER_TURN
+from models.save_worker import save_worker
+from view.thumbnails import schedule_thumbnail
 
 
-def local_game_loop(screen, game_or_players, *args, **kwargs):
+AI_STEP_MS = 700  # délai entre deux actions de l'IA, pour qu'on puisse suivre
+SAVE_MESSAGE_MS = 2500  # durée d'affichage du résultat d'une sauvegarde
+MAX_PLAYERS = 4
+
+DICE_COLORS = {"rouge": (255, 0, 0), "bleu": (0, 100, 255), "vert": (0, 180, 0)}
+
+
+def die_color(die):
+    """Couleur RVB d'un dé (blanc par défaut)."""
+    return DICE_COLORS.get(die.get_color().lower(), (255, 255, 255))
+
+
+class GameOverOverlay(Screen):
+    """
+    Surimpression de fin de partie, au-dessus de l'écran de jeu. Elle laisse
+    passer les clics : « Suivant » ramène au menu.
+    """
+
+    blocks_input = False
+
+    def __init__(self, manager):
+        super().__init__(manager)
+        self.title_font = assets.font(FONT, 36)
+        self.small_font = assets.font(FONT, 24)
+        # Surface translucide pré-rendue
+        self.overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        self.overlay.fill((0, 0, 0, 180))
+        self.winners = []
+        self.winning_score = None
+
+    def enter(self, winners, winning_score):
+        self.winners = winners
+        self.winning_score = winning_score
+
+    def draw(self, surface):
+        width, height = self.width, self.height
+        surface.blit(self.overlay, (0, 0))
+
+        over_surf = render_text(self.title_font, "PARTIE TERMINÉE", (255, 255, 255))
+        surface.blit(
+            over_surf, over_surf.get_rect(center=(width // 2, height // 2 - 100))
+        )
+
+        win_str = "Gagnant" + ("s" if len(self.winners) > 1 else "")
+        win_surf = render_text(
+            self.small_font,
+            f"{win_str} : {', '.join('Joueur '+str(w) for w in self.winners)}",
+            (255, 255, 0),
+        )
+        surface.blit(win_surf, win_surf.get_rect(center=(width // 2, height // 2 - 50)))
+
+        score_surf = render_text(
+            self.small_font, f"Score : {self.winning_score}", (255, 255, 0)
+        )
+        surface.blit(score_surf, score_surf.get_rect(center=(width // 2, height // 2)))
+        return None
+
+
+class LocalGameScreen(Screen):
     """
     Écran de jeu local avec gestion des images de cartes manquantes.
-    game_or_players peut être soit un nombre de joueurs (int) soit un GameController
+
+    Les boutons, le fond et la scène sont construits une seule fois ;
+    enter() ne fait que démarrer (ou reprendre) une partie.
     """
-    clock = pygame.time.Clock()
-    width, height = screen.get_size()
-
-    if isinstance(game_or_players, GameController):
-        controller = game_or_players
-        number_of_players = controller.num_players
-    else:
-        number_of_players = game_or_players
-        controller = GameController(number_of_players)
-
-    # Fond
-    bg = pygame.image.load(os.path.join("assets", "menu_background.jpg")).convert()
-    bg = pygame.transform.scale(bg, (width, height))
-
-    # Polices
-    font_path = os.path.join("assets", "fonts", "medieval.ttf")
-    title_font = pygame.font.Font(font_path, 36)
-    small_font = pygame.font.Font(font_path, 24)
-
-    # État du tour
-    rolls_remaining = 3
-    dice_list = [
-        Dice(6, "rouge"),
-        Dice(6, "rouge"),
-        Dice(6, "bleu"),
-        Dice(6, "bleu"),
-        Dice(6, "vert"),
-        Dice(6, "vert"),
-    ]
-    dice_values = [0] * 6
-    validated = False
-    result_card = None
-    is_penalty = False
-
-    # Fin de partie
-    game_over = False
-    winners = []
-    winning_score = None
-
-    # Cache pour images et placeholders
-    image_cache = {}
-
-    def load_card_image(card, ctype, size=(120, 160)):
+
+    # Au repos (tour d'un humain, rien en cours) : quelques images par
+    # seconde suffisent à suivre le thread de sauvegarde
+    idle_fps = 10
+
+    def __init__(self, manager, client=None):
+        """client : GameClient connecté à un serveur (network.client), ou None"""
+        super().__init__(manager)
+        width, height = self.width, self.height
+        self.client = client
+
+        # Fond
+        bg = assets.scaled(MENU_BACKGROUND, (width, height))
+
+        # Polices
+        self.title_font = assets.font(FONT, 36)
+        self.small_font = small_font = assets.font(FONT, 24)
+
+        # Joueurs ordinateur
+        self.ai = AIPlayer()
+        self.ai_players = ()
+
+        self.session = None
+        self.game_over_overlay = GameOverOverlay(manager)
+
+        # Boutons
+        self.back_button = Button(
+            20, 210, 100, 40, "Retour", small_font, callback=lambda: ("menu", None)
+        )
+        self.roll_button = Button(
+            width // 2 - 75,
+            height - 180,
+            150,
+            50,
+            "Lancer",
+            small_font,
+            callback=self.human_only(self.do_roll),
+        )
+        self.validate_button = Button(
+            width // 2 - 75,
+            height - 120,
+            150,
+            50,
+            "Valider",
+            small_font,
+            callback=self.human_only(self.validate_action),
+        )
+        self.next_button = Button(
+            width - 150,
+            height - 70,
+            130,
+            50,
+            "Suivant",
+            small_font,
+            callback=self.human_only(self.next_turn_action),
+        )
+        self.save_button = Button(
+            20, 150, 100, 40, "Sauver", small_font, callback=self.save_game_action
+        )
+        self.buttons = (
+            self.back_button,
+            self.roll_button,
+            self.validate_button,
+            self.next_button,
+            self.save_button,
+        )
+
+        # Images des cartes : un seul atlas, gardé d'une partie à l'autre
+        self.card_w, self.card_h = 120, 160
+        self.atlas = card_atlas((self.card_w, self.card_h))
+        self.start_x = 210
+        self.y_hab = 20
+        self.y_lieu = self.y_hab + self.card_h + 10
+
+        self._build_scene(bg)
+        self._thumbnail_bg = None  # fond de la scène à la taille des miniatures
+
+    # ————— Partie —————
+
+    def enter(self, game_or_players, *args, ai_players=(), **kwargs):
         """
-        Tente de charger assets/cards/{ctype}/{card.name}.png
-        Si absent, retourne un placeholder coloré avec le texte.
+        game_or_players peut être soit un nombre de joueurs (int), soit un
+        GameController, soit une session déjà prête (ex. RemoteGameSession)
+        ai_players : numéros des joueurs contrôlés par l'ordinateur
         """
-        key = (card.name, ctype)
-        if key in image_cache:
-            return image_cache[key]
-
-        path = os.path.join("assets", "cards", ctype, f"{card.name}.png")
-        try:
-            img = pygame.image.load(path).convert_alpha()
-            img = pygame.transform.scale(img, size)
-        except FileNotFoundError:
-            # fallback : rectangle + nom
-            img = pygame.Surface(size)
-            # couleur selon type
-            if ctype == "habitant":
-                img.fill((70, 130, 180))  # Bleu
-            else:
-                img.fill((139, 69, 19))  # Marron
-            # nom centré
-            txt = small_font.render(card.name, True, (255, 255, 255))
-            tr = txt.get_rect(center=(size[0] // 2, size[1] // 2))
-            img.blit(txt, tr)
-        image_cache[key] = img
-        return img
+        self.save_message = None  # (texte, couleur, fin d'affichage)
+        if isinstance(game_or_players, GameController):
+            self.session = GameSession(game_or_players)
+        elif isinstance(game_or_players, int):
+            self.session = None
+            # Les parties contre l'ordinateur restent locales
+            if self.client is not None and not ai_players:
+                try:
+                    self.session = RemoteGameSession.create(
+                        self.client, game_or_players
+                    )
+                except (RemoteError, OSError) as exc:
+                    # Serveur injoignable : on joue quand même, en local
+                    self.show_message(f"Partie locale ({exc})", (200, 0, 0))
+            if self.session is None:
+                self.session = GameSession.new(game_or_players)
+        else:
+            self.session = game_or_players
+        self.ai_players = ai_players if isinstance(self.session, GameSession) else ()
+
+        # Les sauvegardes sont écrites par le thread de sauvegarde
+        if isinstance(self.session, GameSession):
+            self.session.controller.attach_save_worker(save_worker)
+        self.game_over_shown = False
+        self.next_ai_step = 0
+
+    def exit(self):
+        # Ferme le journal de la partie (après les écritures en attente)
+        if isinstance(self.session, GameSession):
+            journal = self.session.controller.journal
+            if journal is not None:
+                journal.close()
+                self.session.controller.journal = None
 
     # Callbacks
-    def do_roll():
-        nonlocal rolls_remaining, dice_values
-        if rolls_remaining > 0 and not validated and not game_over:
-            for i, die in enumerate(dice_list):
-                dice_values[i] = die.roll()
-            rolls_remaining -= 1
+    def do_roll(self, keep=()):
+        self.session.roll(keep)
         return None
 
-    def validate_action():
-        nonlocal validated, result_card, is_penalty, game_over, winners, winning_score
-        if not validated and not game_over:
-            result_card, is_penalty = controller.recruit_or_penalize(dice_values)
-            validated = True
-            if controller.is_game_over():
-                game_over = True
-                winners, winning_score = controller.get_winner()
+    def validate_action(self):
+        self.session.validate()
         return None
 
-    def next_turn_action():
-        nonlocal rolls_remaining, dice_values, validated, result_card, is_penalty
-        if not game_over:
-            controller.next_player()
-            rolls_remaining = 3
-            dice_values = [0] * 6
-            validated = False
-            result_card = None
-            is_penalty = False
-        else:
+    def next_turn_action(self):
+        if self.session.game_over:
             return "menu", None
+        self.session.next_turn()
         return None
 
-    def save_game_action():
-        """Sauvegarde la partie en cours"""
-        if not game_over:
-            controller.save_game()
+    def is_ai_turn(self):
+        session = self.session
+        return not session.game_over and session.current_player in self.ai_players
+
+    def human_only(self, action):
+        """Ignore les clics des boutons de jeu pendant le tour de l'IA."""
+        return lambda: None if self.is_ai_turn() else action()
+
+    def ai_step(self):
+        """Une action de l'IA : lancer, garder/relancer, valider, passer."""
+        session = self.session
+        if session.validated:
+            self.next_turn_action()
+        elif session.rolls_remaining == ROLLS_PER_TURN:
+            self.do_roll()
+        else:
+            keep = None
+            if session.rolls_remaining > 0:
+                keep = self.ai.decide(
+                    session.controller, session.dice_values, session.rolls_remaining
+                )
+            if keep is None:
+                self.validate_action()
+            else:
+                self.do_roll(keep)
+
+    def save_game_action(self):
+        """Sauvegarde la partie en cours, puis sa miniature en arrière-plan"""
+        path = self.session.save()
+        if path and isinstance(self.session, GameSession):
+            schedule_thumbnail(self, path)
         return None
 
-    # Boutons
-    back_button = Button(
-        20, 210, 100, 40, "Retour", small_font, callback=lambda: ("menu", None)
-    )
-    roll_button = Button(
-        width // 2 - 75, height - 180, 150, 50, "Lancer", small_font, callback=do_roll
-    )
-    validate_button = Button(
-        width // 2 - 75,
-        height - 120,
-        150,
-        50,
-        "Valider",
-        small_font,
-        callback=validate_action,
-    )
-    next_button = Button(
-        width - 150,
-        height - 70,
-        130,
-        50,
-        "Suivant",
-        small_font,
-        callback=next_turn_action,
-    )
-    save_button = Button(
-        20, 150, 100, 40, "Sauver", small_font, callback=save_game_action
-    )
-
-    # Boucle principale
-    while True:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                return "quit", None
-            for btn in (
-                back_button,
-                roll_button,
-                validate_button,
-                next_button,
-                save_button,
-            ):
-                res = btn.handle_event(event)
-                if res is not None:
-                    return res
-
-        screen.blit(bg, (0, 0))
+    # ————— Boucle (appelée par ScreenManager) —————
 
-        # Scores à gauche
-        scores = controller.calculate_scores()
+    def handle_event(self, event):
+        for btn in self.buttons:
+            res = btn.handle_event(event)
+            if res is not None:
+                return res
+        return None
+
+    def update(self):
+        for _, error in save_worker.poll():
+            if error is None:
+                save_message = ("Partie sauvegardée", (0, 200, 0))
+            else:
+                save_message = (f"Erreur de sauvegarde : {error}", (200, 0, 0))
+            self.show_message(*save_message)
+
+        self.session.update()
+        error = getattr(self.session, "error", None)
+        if error:
+            self.session.error = None
+            self.show_message(f"Serveur : {error}", (200, 0, 0))
+
+        if self.is_ai_turn() and pygame.time.get_ticks() >= self.next_ai_step:
+            self.ai_step()
+            self.next_ai_step = pygame.time.get_ticks() + AI_STEP_MS
+
+        # Fin de partie (y compris annoncée par le serveur)
+        if self.session.game_over and not self.game_over_shown:
+            self.game_over_shown = True
+            self.manager.push_overlay(
+                self.game_over_overlay, self.session.winners, self.session.winning_score
+            )
+        return None
+
+    def is_idle(self):
+        return not (
+            self.is_ai_turn()
+            or self.session.is_waiting()
+            or self.save_message_visible()
+            or save_worker.pending()
+        )
+
+    def draw(self, surface):
+        return self.scene.render(surface)
+
+    def invalidate(self):
+        self.scene.invalidate()
+
+    # ————— Scène : fond pré-rendu + éléments redessinés s'ils changent —————
+
+    def _build_scene(self, bg):
+        width, height = self.width, self.height
+        background = bg.copy()
         panel = pygame.Surface((200, height), pygame.SRCALPHA)
         panel.fill((30, 30, 30, 200))
-        screen.blit(panel, (0, 0))
-        for i in range(1, number_of_players + 1):
-            txt = small_font.render(
-                f"Joueur {i}: {scores[i]} pts", True, (255, 255, 255)
-            )
-            screen.blit(txt, (10, 20 + (i - 1) * 30))
-
-        # Cartes visibles en haut
-        vis_hab, vis_lieu = controller.get_visible_cards()
-        card_w, card_h = 120, 160
-        start_x = 210
-        y_hab = 20
-        for idx, card in enumerate(vis_hab):
-            if card:
-                img = load_card_image(card, "habitant", (card_w, card_h))
-                screen.blit(img, (start_x + idx * (card_w + 10), y_hab))
-        y_lieu = y_hab + card_h + 10
-        for idx, card in enumerate(vis_lieu):
-            if card:
-                img = load_card_image(card, "lieu", (card_w, card_h))
-                screen.blit(img, (start_x + idx * (card_w + 10), y_lieu))
-
-        if not game_over:
-            # Dés
-            for idx, (die, val) in enumerate(zip(dice_list, dice_values)):
-                x = width // 2 - 180 + (idx % 3) * 120
-                y = height // 2 - 50 + (idx // 3) * 100
-                rect = pygame.Rect(x - 25, y - 25, 50, 50)
-                # Convertir la couleur du texte en RGB
-                color_name = die.get_color().lower()
-                if color_name == "rouge":
-                    color = (255, 0, 0)
-                elif color_name == "bleu":
-                    color = (0, 100, 255)
-                elif color_name == "vert":
-                    color = (0, 180, 0)
-                else:
-                    color = (255, 255, 255)  # Blanc par défaut
-
-                pygame.draw.rect(screen, color, rect)
-                pygame.draw.rect(screen, (50, 50, 50), rect, 2)  # Bordure plus foncée
-                # Texte en blanc pour toutes les couleurs pour un meilleur contraste
-                txt = small_font.render(str(val), True, (255, 255, 255))
-                screen.blit(txt, txt.get_rect(center=(x, y)))
-
-            # Infos du tour
-            p_txt = title_font.render(
-                f"Joueur {controller.current_player}", True, (30, 20, 0)
-            )
-            screen.blit(p_txt, p_txt.get_rect(center=(width // 2, 50)))
-            rem = small_font.render(
-                f"Relances : {rolls_remaining}", True, (255, 255, 0)
-            )
-            screen.blit(rem, (220, height - 40))
+        background.blit(panel, (0, 0))
+        scene = self.scene = Scene(background)
 
-            if validated and result_card:
-                label = (
-                    f"+ {result_card.name}"
-                    if not is_penalty
-                    else f"- {result_card.name}"
-                )
-                clr = (0, 200, 0) if not is_penalty else (200, 0, 0)
-                info = small_font.render(label, True, clr)
-                screen.blit(info, info.get_rect(center=(width // 2, height // 2 + 150)))
+        card_w, card_h = self.card_w, self.card_h
+        scene.add(
+            (0, 0, 200, 30 + MAX_PLAYERS * 30),
+            self.draw_scores,
+            key=lambda: tuple(self.session.scores().values()),
+        )
+        scene.add(
+            (self.start_x, self.y_hab, 4 * (card_w + 10), card_h),
+            self.draw_card_row(lambda: self.session.visible_habitants, self.y_hab),
+            key=lambda: tuple(map(id, self.session.visible_habitants)),
+        )
+        scene.add(
+            (self.start_x, self.y_lieu, 4 * (card_w + 10), card_h),
+            self.draw_card_row(lambda: self.session.visible_lieux, self.y_lieu),
+            key=lambda: tuple(map(id, self.session.visible_lieux)),
+        )
+        scene.add(
+            (width // 2 - 205, height // 2 - 75, 290, 150),
+            self.draw_dice,
+            key=lambda: (self.session.game_over, tuple(self.session.dice_values)),
+        )
+        scene.add(
+            (width // 2 - 200, 25, 400, 50),
+            self.draw_player,
+            key=lambda: (self.session.game_over, self.session.current_player),
+        )
+        scene.add(
+            (220, height - 45, 300, 40),
+            self.draw_rolls,
+            key=lambda: (self.session.game_over, self.session.rolls_remaining),
+        )
+        scene.add(
+            (width // 2 - 300, height // 2 + 130, 600, 40),
+            self.draw_result,
+            key=lambda: (
+                self.session.game_over,
+                self.session.validated,
+                self.session.result_card,
+                self.session.is_penalty,
+            ),
+        )
+        scene.add(
+            (20, 255, width - 40, 40),
+            self.draw_save_message,
+            key=lambda: self.save_message if self.save_message_visible() else None,
+        )
+        for btn in self.buttons:
+            scene.add(btn.rect, btn.draw, key=lambda b=btn: b.current_color)
 
-        else:
-            # Overlay fin de partie
-            overlay = pygame.Surface((width, height), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 180))
-            screen.blit(overlay, (0, 0))
-
-            over_surf = title_font.render("PARTIE TERMINÉE", True, (255, 255, 255))
-            screen.blit(
-                over_surf, over_surf.get_rect(center=(width // 2, height // 2 - 100))
+    def draw_scores(self, surface):
+        # Scores à gauche
+        scores = self.session.scores()
+        for i in range(1, self.session.num_players + 1):
+            txt = render_text(
+                self.small_font, f"Joueur {i}: {scores[i]} pts", (255, 255, 255)
             )
+            surface.blit(txt, (10, 20 + (i - 1) * 30))
 
-            win_str = "Gagnant" + ("s" if len(winners) > 1 else "")
-            win_surf = small_font.render(
-                f"{win_str} : {', '.join('Joueur '+str(w) for w in winners)}",
-                True,
-                (255, 255, 0),
-            )
-            screen.blit(
-                win_surf, win_surf.get_rect(center=(width // 2, height // 2 - 50))
-            )
+    def draw_card_row(self, cards, y):
+        def draw(surface):
+            for idx, card in enumerate(cards()):
+                if card:
+                    self.atlas.blit(
+                        surface, card, (self.start_x + idx * (self.card_w + 10), y)
+                    )
 
-            score_surf = small_font.render(
-                f"Score : {winning_score}", True, (255, 255, 0)
-            )
-            screen.blit(
-                score_surf, score_surf.get_rect(center=(width // 2, height // 2))
-            )
+        return draw
+
+    def draw_dice(self, surface):
+        if self.session.game_over:
+            return
+        width, height = self.width, self.height
+        dice = zip(self.session.dice_pool.dice, self.session.dice_values)
+        for idx, (die, val) in enumerate(dice):
+            x = width // 2 - 180 + (idx % 3) * 120
+            y = height // 2 - 50 + (idx // 3) * 100
+            rect = pygame.Rect(x - 25, y - 25, 50, 50)
+            pygame.draw.rect(surface, die_color(die), rect)
+            pygame.draw.rect(surface, (50, 50, 50), rect, 2)  # Bordure plus foncée
+            # Texte en blanc pour toutes les couleurs pour un meilleur contraste
+            txt = render_text(self.small_font, str(val), (255, 255, 255))
+            surface.blit(txt, txt.get_rect(center=(x, y)))
+
+    def draw_player(self, surface):
+        if self.session.game_over:
+            return
+        p_label = f"Joueur {self.session.current_player}"
+        if self.session.current_player in self.ai_players:
+            p_label += " (IA)"
+        p_txt = render_text(self.title_font, p_label, (30, 20, 0))
+        surface.blit(p_txt, p_txt.get_rect(center=(self.width // 2, 50)))
+
+    def draw_rolls(self, surface):
+        if self.session.game_over:
+            return
+        rem = render_text(
+            self.small_font, f"Relances : {self.session.rolls_remaining}", (255, 255, 0)
+        )
+        surface.blit(rem, (220, self.height - 40))
+
+    def draw_result(self, surface):
+        session = self.session
+        if session.game_over or not (session.validated and session.result_card):
+            return
+        name = session.result_card.name
+        label = f"+ {name}" if not session.is_penalty else f"- {name}"
+        clr = (0, 200, 0) if not session.is_penalty else (200, 0, 0)
+        info = render_text(self.small_font, label, clr)
+        surface.blit(
+            info, info.get_rect(center=(self.width // 2, self.height // 2 + 150))
+        )
+
+    def show_message(self, text, color):
+        """Affiche un message sous les boutons pendant SAVE_MESSAGE_MS."""
+        self.save_message = (text, color, pygame.time.get_ticks() + SAVE_MESSAGE_MS)
+
+    def save_message_visible(self):
+        return bool(self.save_message) and pygame.time.get_ticks() < self.save_message[2]
+
+    def draw_save_message(self, surface):
+        if self.save_message_visible():
+            msg = render_text(self.small_font, self.save_message[0], self.save_message[1])
+            surface.blit(msg, (20, 260))
+
+    # ————— Miniature —————
+
+    def thumbnail(self, size):
+        """
+        Plateau dessiné directement à size (miniature de sauvegarde) : fond
+        de la scène réduit une fois, cartes de l'atlas à cette taille et dés,
+        tels qu'ils sont affichés. Sans texte, illisible à cette taille.
+        """
+        session = self.session
+        sx, sy = size[0] / self.width, size[1] / self.height
+        if self._thumbnail_bg is None or self._thumbnail_bg.get_size() != tuple(size):
+            self._thumbnail_bg = pygame.transform.smoothscale(self.scene.background, size)
+        surface = self._thumbnail_bg.copy()
 
-        back_button.draw(screen)
-        roll_button.draw(screen)
-        validate_button.draw(screen)
-        next_button.draw(screen)
-        save_button.draw(screen)
+        atlas = card_atlas((round(self.card_w * sx), round(self.card_h * sy)))
+        for y, cards in (
+            (self.y_hab, session.visible_habitants),
+            (self.y_lieu, session.visible_lieux),
+        ):
+            for idx, card in enumerate(cards):
+                if card:
+                    x = self.start_x + idx * (self.card_w + 10)
+                    atlas.blit(surface, card, (round(x * sx), round(y * sy)))
 
-        pygame.display.flip()
-        clock.tick(60)
+        if not session.game_over:
+            side = max(2, round(50 * sx))
+            for idx, die in enumerate(session.dice_pool.dice):
+                x = self.width // 2 - 180 + (idx % 3) * 120
+                y = self.height // 2 - 50 + (idx // 3) * 100
+                rect = pygame.Rect(0, 0, side, side)
+                rect.center = (round(x * sx), round(y * sy))
+                surface.fill(die_color(die), rect)
+        return surface
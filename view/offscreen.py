@@ -0,0 +1,98 @@
+import argparse
+import os
+
+import pygame
+from view.screen_manager import ScreenManager
+
+
+def init_headless():
+    """
+    Prépare pygame pour dessiner sans fenêtre : pilote vidéo « dummy » si
+    aucun affichage n'est ouvert, et un mode 1×1 pour que les images soient
+    converties (convert) comme à l'écran. Sans effet pendant le jeu.
+    """
+    pygame.font.init()
+    if pygame.display.get_surface() is not None:
+        return
+    if not pygame.display.get_init():
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+        pygame.display.init()
+    pygame.display.set_mode((1, 1))
+
+
+class OffscreenRenderer:
+    """
+    Dessine des écrans dans une Surface en mémoire, à n'importe quelle
+    résolution, sans fenêtre ni boucle d'événements (captures).
+
+    Les écrans sont enregistrés comme dans ScreenManager et gardés d'un
+    rendu à l'autre ; ils ne voient que la surface cible et sa taille. Un
+    renderer ne doit servir qu'à un thread à la fois.
+    """
+
+    def __init__(self, size):
+        init_headless()
+        self.surface = pygame.Surface((int(size[0]), int(size[1])))
+        self.manager = ScreenManager(self.surface)
+
+    def register_screen(self, name, screen_class):
+        self.manager.register_screen(name, screen_class)
+
+    def render(self, name, *args, **kwargs):
+        """Entre dans l'écran avec ces arguments, le dessine en entier et retourne la surface."""
+        screen = self.manager.get_screen(name)
+        screen.enter(*args, **kwargs)
+        screen.invalidate()
+        screen.draw(self.surface)
+        screen.exit()
+        return self.surface
+
+
+def render_screen(screen_class, size, *args, **kwargs):
+    """Rendu unique d'un écran : Surface de la taille demandée."""
+    renderer = OffscreenRenderer(size)
+    renderer.register_screen("screen", screen_class)
+    return renderer.render("screen", *args, **kwargs)
+
+
+def main(argv=None):
+    from controller.game_controller import GameController
+    from view.card_atlas import parse_size
+    from view.chose_number_of_player import ChoseNumberOfPlayerScreen
+    from view.load_game_screen import LoadGameScreen
+    from view.local_game_screen import LocalGameScreen
+    from view.menu_screen import MenuScreen
+
+    screens = {
+        "menu": MenuScreen,
+        "chose_players": ChoseNumberOfPlayerScreen,
+        "load_game": LoadGameScreen,
+        "local_game": LocalGameScreen,
+    }
+    parser = argparse.ArgumentParser(description="Capture d'un écran, sans fenêtre.")
+    parser.add_argument("screen", choices=sorted(screens))
+    parser.add_argument("-s", "--size", type=parse_size, default=(1280, 720), help="LxH")
+    parser.add_argument("-o", "--output", help="fichier image (défaut : ECRAN.png)")
+    parser.add_argument("--save", help="local_game : sauvegarde à afficher")
+    parser.add_argument("-p", "--players", type=int, default=2, help="local_game : nouvelle partie")
+    parser.add_argument("--seed", type=int, help="local_game : graine de la nouvelle partie")
+    args = parser.parse_args(argv)
+
+    enter_args = ()
+    if args.screen == "local_game":
+        if args.save:
+            game = GameController.load_game(args.save)
+            if game is None:
+                parser.error(f"sauvegarde introuvable : {args.save}")
+        else:
+            game = GameController(args.players, seed=args.seed)
+        enter_args = (game,)
+
+    surface = render_screen(screens[args.screen], args.size, *enter_args)
+    output = args.output or f"{args.screen}.png"
+    pygame.image.save(surface, output)
+    print(f"{output} ({surface.get_width()}x{surface.get_height()})")
+
+
+if __name__ == "__main__":
+    main()
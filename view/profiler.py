@@ -0,0 +1,203 @@
+import json
+import os
+import time
+from collections import deque
+
+import pygame
+
+from config import settings
+from view.assets import assets
+from view.text_cache import text_cache
+
+
+class FrameProfiler:
+    """
+    Mesure du temps passé dans chaque phase d'une image.
+
+    Dans la boucle principale (ScreenManager.run) :
+        profiler.frame()          # début d'image (termine la précédente)
+        ...événements...
+        profiler.mark("events")   # temps écoulé depuis la marque précédente
+        ...dessin...
+        profiler.mark("draw")
+
+    Les durées des dernières images sont gardées par phase (p50/p95/p99),
+    affichées en surimpression (F3) et, si la trace est active (F4),
+    enregistrées au format Chrome trace (chrome://tracing, Perfetto).
+
+    Désactivé, chaque appel se limite à un test de booléen.
+    """
+
+    WINDOW = 300  # images gardées pour les percentiles
+    MAX_TRACE_EVENTS = 200_000
+    REFRESH_MS = 500  # rafraîchissement du texte de la surimpression
+    OVERLAY_RECT = pygame.Rect(-270, 10, 260, 190)  # x négatif : depuis la droite
+    TOGGLE_KEY = pygame.K_F3
+    TRACE_KEY = pygame.K_F4
+
+    def __init__(self, enabled=False, trace_dir="cache"):
+        self.enabled = enabled
+        self.tracing = False
+        self.trace_dir = trace_dir
+        self.screen_name = ""
+        self.windows = {}  # phase -> deque des durées (s)
+        self.trace_events = []
+        self._frame_start = None
+        self._last = None
+        self._lines = []  # surfaces des lignes de la surimpression
+        self._lines_at = 0
+
+    # ————— Mesure —————
+
+    def set_screen(self, name):
+        self.screen_name = name
+        self._frame_start = None
+
+    def frame(self):
+        """Début d'une image : enregistre la durée totale de la précédente."""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        if self._frame_start is not None:
+            self._record("frame", self._frame_start, now)
+        self._frame_start = self._last = now
+
+    def mark(self, phase):
+        """Fin d'une phase : durée depuis la marque (ou l'image) précédente."""
+        if not self.enabled or self._last is None:
+            return
+        now = time.perf_counter()
+        self._record(phase, self._last, now)
+        self._last = now
+
+    def _record(self, phase, start, end):
+        window = self.windows.get(phase)
+        if window is None:
+            window = self.windows[phase] = deque(maxlen=self.WINDOW)
+        window.append(end - start)
+        if self.tracing and len(self.trace_events) < self.MAX_TRACE_EVENTS:
+            self.trace_events.append(
+                {
+                    "name": phase,
+                    "cat": self.screen_name,
+                    "ph": "X",
+                    "ts": start * 1e6,
+                    "dur": (end - start) * 1e6,
+                    "pid": 0,
+                    "tid": 1 if phase == "frame" else 0,
+                }
+            )
+
+    # ————— Statistiques —————
+
+    @staticmethod
+    def percentile(values, q):
+        ordered = sorted(values)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    def stats(self):
+        """{phase: {"p50", "p95", "p99", "max"}} en millisecondes."""
+        return {
+            phase: {
+                "p50": self.percentile(window, 0.50) * 1000,
+                "p95": self.percentile(window, 0.95) * 1000,
+                "p99": self.percentile(window, 0.99) * 1000,
+                "max": max(window) * 1000,
+            }
+            for phase, window in self.windows.items()
+            if window
+        }
+
+    # ————— Commandes —————
+
+    def toggle(self):
+        """Active / désactive la mesure et la surimpression."""
+        self.enabled = not self.enabled
+        self.windows.clear()
+        self._frame_start = self._last = None
+        self._lines = []
+        if not self.enabled and self.tracing:
+            self.stop_trace()
+
+    def start_trace(self):
+        self.enabled = True
+        self.tracing = True
+        self.trace_events = []
+
+    def stop_trace(self):
+        """Arrête la trace et l'écrit sur disque. Retourne le chemin du fichier."""
+        self.tracing = False
+        if not self.trace_events:
+            return None
+        return self.export_trace()
+
+    def export_trace(self, path=None):
+        """Écrit la trace au format Chrome trace (JSON)."""
+        if path is None:
+            os.makedirs(self.trace_dir, exist_ok=True)
+            path = os.path.join(
+                self.trace_dir, time.strftime("trace_%Y%m%d_%H%M%S.json")
+            )
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "traceEvents": self.trace_events,
+                    "displayTimeUnit": "ms",
+                    "otherData": {"stats_ms": self.stats()},
+                },
+                f,
+            )
+        return path
+
+    def handle_event(self, event):
+        """F3 : surimpression, F4 : démarre / arrête la trace. Vrai si utilisé."""
+        if event.type != pygame.KEYDOWN:
+            return False
+        if event.key == self.TOGGLE_KEY:
+            self.toggle()
+            return True
+        if event.key == self.TRACE_KEY:
+            if self.tracing:
+                self.stop_trace()
+            else:
+                self.start_trace()
+            return True
+        return False
+
+    # ————— Surimpression —————
+
+    def overlay_rect(self, surface):
+        rect = self.OVERLAY_RECT.copy()
+        if rect.x < 0:
+            rect.x += surface.get_width()
+        return rect
+
+    def _refresh_lines(self):
+        now = pygame.time.get_ticks()
+        if self._lines and now - self._lines_at < self.REFRESH_MS:
+            return
+        self._lines_at = now
+        lines = [f"{self.screen_name}  p50/p95/p99 (ms)"]
+        for phase, s in self.stats().items():
+            lines.append(f"{phase:<7}{s['p50']:6.2f}{s['p95']:6.2f}{s['p99']:6.2f}")
+        text = text_cache.stats()
+        lines.append(f"textes : {text['hits']} en cache, {text['misses']} rendus")
+        if self.tracing:
+            lines.append(f"trace : {len(self.trace_events)} évén.")
+        # Rendu direct, hors du cache partagé : ces textes changent à chaque
+        # rafraîchissement et en chasseraient ceux du jeu
+        font = assets.font(None, 18)
+        self._lines = [font.render(line, True, (0, 255, 0)) for line in lines]
+
+    def draw_overlay(self, surface):
+        if not self.enabled:
+            return
+        self._refresh_lines()
+        rect = self.overlay_rect(surface)
+        surface.fill((0, 0, 0), rect)
+        for i, line in enumerate(self._lines[: rect.height // 18]):
+            surface.blit(line, (rect.x + 6, rect.y + 4 + i * 18))
+
+
+# Profileur partagé, utilisé par le gestionnaire d'écrans
+profiler = FrameProfiler(enabled=settings.PROFILE_FRAMES)
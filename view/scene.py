@@ -0,0 +1,96 @@
+import pygame
+
+
+_UNSET = object()
+
+
+class SceneNode:
+    """
+    Élément d'une scène : une zone fixe de l'écran, une fonction de dessin
+    et une fonction « clé » qui résume ce qui est affiché. L'élément n'est
+    redessiné que lorsque sa clé change.
+
+    draw(surface) ne doit pas dessiner hors de rect.
+    """
+
+    def __init__(self, rect, draw, key=None):
+        self.rect = pygame.Rect(rect)
+        self.draw = draw
+        self.key = key
+        self._last_key = _UNSET
+        self.dirty = True
+
+    def update(self):
+        if self.key is None:
+            return
+        key = self.key()
+        if key != self._last_key:
+            self._last_key = key
+            self.dirty = True
+
+
+class Scene:
+    """
+    Scène conservée d'un écran : un fond pré-rendu et des éléments dessinés
+    dans l'ordre d'ajout. render() ne redessine que les zones dont un
+    élément a changé (fond + éléments qui touchent la zone) et retourne ces
+    rectangles : ScreenManager n'envoie qu'eux à l'affichage.
+    """
+
+    def __init__(self, background):
+        self.background = background
+        self.nodes = []
+        self._full_redraw = True
+
+    def add(self, rect, draw, key=None):
+        node = SceneNode(rect, draw, key)
+        self.nodes.append(node)
+        return node
+
+    def invalidate(self):
+        """Force un rendu complet à la prochaine image."""
+        self._full_redraw = True
+
+    @staticmethod
+    def _merge(rects):
+        """Fusionne les rectangles qui se chevauchent."""
+        merged = []
+        for rect in rects:
+            rect = rect.copy()
+            i = 0
+            while i < len(merged):
+                if rect.colliderect(merged[i]):
+                    rect.union_ip(merged.pop(i))
+                    i = 0
+                else:
+                    i += 1
+            merged.append(rect)
+        return merged
+
+    def render(self, surface):
+        """Dessine les zones modifiées et retourne les rectangles mis à jour."""
+        for node in self.nodes:
+            node.update()
+
+        if self._full_redraw:
+            self._full_redraw = False
+            surface.blit(self.background, (0, 0))
+            for node in self.nodes:
+                node.draw(surface)
+                node.dirty = False
+            return [surface.get_rect()]
+
+        dirty = [node.rect for node in self.nodes if node.dirty]
+        if not dirty:
+            return []
+        rects = self._merge(dirty)
+        for rect in rects:
+            surface.set_clip(rect)
+            surface.blit(self.background, rect, rect)
+            for node in self.nodes:
+                if node.rect.colliderect(rect):
+                    node.draw(surface)
+            surface.set_clip(None)
+        for node in self.nodes:
+            node.dirty = False
+        return rects
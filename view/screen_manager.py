@@ -1,45 +1,246 @@
 import pygame
-from typing import Callable, Dict, Any, Optional
+from view.profiler import profiler
+from typing import Callable, Dict, Any, List, Optional, Union
+
+
+class Screen:
+    """
+    Base class for screens driven by ScreenManager.
+
+    A screen is created once, the first time it is shown, and kept alive:
+    its buttons, surfaces and fonts survive switches. enter() receives the
+    switch arguments each time the screen becomes active.
+
+    handle_event() and update() may return a transition: "quit",
+    (screen_name, data), or None to stay on this screen.
+    draw() returns the list of rects it changed, or None if the whole
+    surface must be shown.
+    """
+
+    # Overlays only: let events through to the screens underneath
+    blocks_input = True
+
+    # Frames per second while idle (0: redraw on input only)
+    idle_fps = 0
+
+    def __init__(self, manager: "ScreenManager"):
+        self.manager = manager
+        self.surface = manager.screen
+        self.width, self.height = manager.screen.get_size()
+
+    def enter(self, *args, **kwargs) -> None:
+        pass
+
+    def exit(self) -> None:
+        pass
+
+    def handle_event(self, event: pygame.event.Event):
+        return None
+
+    def update(self):
+        return None
+
+    def draw(self, surface: pygame.Surface) -> Optional[List[pygame.Rect]]:
+        return None
+
+    def invalidate(self) -> None:
+        """Ask for a full redraw on the next frame."""
+        pass
+
+    def is_idle(self) -> bool:
+        """True when nothing animates: the manager then sleeps until input."""
+        return True
 
 
 class ScreenManager:
+    """
+    Single main loop: one event pump, one clock, one display update per
+    frame for whichever screen is active, plus a stack of overlays drawn
+    on top of it.
+
+    When every layer is idle the loop blocks in pygame.event.wait instead
+    of spinning at FPS, and static screens are only redrawn after input.
+    """
+
+    FPS = 60
+    IDLE_TIMEOUT_MS = 1000  # longest sleep of an idle screen
+
     def __init__(self, screen: pygame.Surface):
         self.screen = screen
-        self.current_screen: Optional[Callable] = None
+        self.current_screen: Optional[Screen] = None
+        self.current_name: Optional[str] = None
+        self.overlays: List[Screen] = []
         self.screen_data: Dict[str, Any] = {}
+        self.instances: Dict[str, Screen] = {}
+        self.actions: Dict[str, Callable] = {}
         self.running = True
+        self._needs_draw = True
+
+    def register_screen(self, screen_name: str, screen_class: Callable) -> None:
+        """Register a screen class (or factory taking the manager) with a name."""
+        self.screen_data[screen_name] = screen_class
 
-    def register_screen(self, screen_name: str, screen_func: Callable) -> None:
-        """Register a screen function with a name."""
-        self.screen_data[screen_name] = screen_func
+    def register_action(self, name: str, action: Callable) -> None:
+        """
+        Register a named action: switching to it calls action(*args, **kwargs),
+        which returns a transition (or switches screens itself).
+        """
+        self.actions[name] = action
+
+    def get_screen(self, screen_name: str) -> Screen:
+        """The screen instance, created on first use and then kept."""
+        instance = self.instances.get(screen_name)
+        if instance is None:
+            instance = self.instances[screen_name] = self.screen_data[screen_name](self)
+        return instance
 
     def switch_screen(self, screen_name: str, *args, **kwargs) -> None:
-        """Switch to a different screen."""
-        if screen_name in self.screen_data:
-            self.current_screen = self.screen_data[screen_name]
-            self.current_screen_args = args
-            self.current_screen_kwargs = kwargs
+        """Switch to a different screen (closing any overlay)."""
+        if screen_name in self.actions:
+            self.apply(self.actions[screen_name](*args, **kwargs))
+            return
+        if screen_name not in self.screen_data:
+            return
+        while self.overlays:
+            self.pop_overlay()
+        if self.current_screen is not None:
+            self.current_screen.exit()
+        self.current_screen = self.get_screen(screen_name)
+        self.current_name = screen_name
+        profiler.set_screen(screen_name)
+        self.current_screen.enter(*args, **kwargs)
+        self.current_screen.invalidate()
+        self._needs_draw = True
+
+    def push_overlay(self, overlay: Union[str, Screen], *args, **kwargs) -> Screen:
+        """Show an overlay above the current screen, which stays alive."""
+        if isinstance(overlay, str):
+            overlay = self.get_screen(overlay)
+        self.overlays.append(overlay)
+        overlay.enter(*args, **kwargs)
+        self._needs_draw = True
+        return overlay
+
+    def pop_overlay(self, overlay: Optional[Screen] = None) -> None:
+        """Close the top overlay (or the given one)."""
+        if overlay is None:
+            overlay = self.overlays[-1]
+        if overlay in self.overlays:
+            self.overlays.remove(overlay)
+            overlay.exit()
+            self._needs_draw = True
+            if self.current_screen is not None:
+                self.current_screen.invalidate()
+
+    def apply(self, result) -> bool:
+        """Apply a transition returned by a screen. True if something changed."""
+        if result is None:
+            return False
+        if isinstance(result, tuple):
+            screen_name, data = result
+            if screen_name == "quit":
+                self.running = False
+            else:
+                self.switch_screen(screen_name, data)
+        elif result == "quit":
+            self.running = False
+        return True
+
+    def _layers(self) -> List[Screen]:
+        return [self.current_screen] + self.overlays
+
+    def _idle_fps(self) -> Optional[int]:
+        """Frame rate while idle, or None if something animates."""
+        if profiler.enabled:
+            return None
+        layers = self._layers()
+        if not all(layer.is_idle() for layer in layers):
+            return None
+        return max(layer.idle_fps for layer in layers)
+
+    def _events(self) -> List[pygame.event.Event]:
+        """Pending events; if idle, sleeps until input (or the idle timeout)."""
+        idle_fps = self._idle_fps()
+        if idle_fps is None:
+            return pygame.event.get()
+        timeout = 1000 // idle_fps if idle_fps else self.IDLE_TIMEOUT_MS
+        event = pygame.event.wait(timeout)
+        events = [] if event.type == pygame.NOEVENT else [event]
+        events.extend(pygame.event.get())
+        return events
+
+    def _dispatch(self, event: pygame.event.Event) -> bool:
+        """Send an event to the top overlay first, down to the screen."""
+        for layer in reversed(self._layers()):
+            if self.apply(layer.handle_event(event)):
+                return True
+            if layer.blocks_input:
+                break
+        return False
+
+    def _draw(self) -> Optional[List[pygame.Rect]]:
+        if self.overlays:
+            # Overlays are drawn over a full redraw of the screen underneath
+            self.current_screen.invalidate()
+        rects = self.current_screen.draw(self.screen)
+        for overlay in self.overlays:
+            overlay.draw(self.screen)
+        if self.overlays:
+            rects = None
+        if profiler.enabled:
+            profiler.draw_overlay(self.screen)
+            if rects is not None:
+                rects.append(profiler.overlay_rect(self.screen))
+        return rects
 
     def run(self) -> None:
-        """Main game loop."""
+        """Main game loop. pygame.quit() is left to the caller."""
         clock = pygame.time.Clock()
 
-        while self.running:
-            if self.current_screen:
-                result = self.current_screen(
-                    self.screen, *self.current_screen_args, **self.current_screen_kwargs
-                )
-
-                if isinstance(result, tuple):
-                    screen_name, data = result
-                    if screen_name == "quit":
-                        self.running = False
-                    else:
-                        self.switch_screen(screen_name, data)
-                elif result == "quit":
+        while self.running and self.current_screen is not None:
+            profiler.frame()
+            events = self._events()
+            if events:
+                self._needs_draw = True
+            for event in events:
+                if event.type == pygame.QUIT:
                     self.running = False
+                    break
+                if profiler.handle_event(event):
+                    # The overlay area must be repainted once it is hidden
+                    self.current_screen.invalidate()
+                    continue
+                if self._dispatch(event):
+                    # Remaining events belonged to the previous screen
+                    break
+            profiler.mark("events")
+            if not self.running:
+                break
+
+            for layer in self._layers():
+                if self.apply(layer.update()):
+                    break
+            profiler.mark("update")
+            if not self.running:
+                break
 
-            pygame.display.flip()
-            clock.tick(60)
+            # A screen idle at 0 fps with no new input looks exactly the same;
+            # screens with an idle frame rate redraw what changed themselves
+            if self._needs_draw or self._idle_fps() != 0:
+                rects = self._draw()
+                profiler.mark("draw")
+                if rects is None:
+                    pygame.display.flip()
+                elif rects:
+                    pygame.display.update(rects)
+                profiler.mark("flip")
+                self._needs_draw = False
+            clock.tick(self.FPS)
+            profiler.mark("wait")
 
-        pygame.quit()
+        # Leaving the loop leaves the screens too, so they can release
+        # what they hold (open save journals, for instance)
+        while self.overlays:
+            self.pop_overlay()
+        if self.current_screen is not None:
+            self.current_screen.exit()
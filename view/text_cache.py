@@ -0,0 +1,58 @@
+from collections import OrderedDict
+
+
+class TextCache:
+    """
+    Cache LRU des textes rendus, partagé par tous les écrans.
+
+    La clé est (police, texte, couleur, antialias) ; les surfaces rendues
+    sont partagées et ne doivent donc pas être modifiées par l'appelant.
+    hits / misses permettent de vérifier que le rendu de texte ne coûte
+    plus rien d'une image à l'autre (surimpression F3). Thread principal
+    seulement, comme les polices.
+    """
+
+    def __init__(self, max_entries=512):
+        self.max_entries = max_entries
+        self._surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._surfaces)
+
+    def render(self, font, text, color, antialias=True):
+        key = (font, text, tuple(color), antialias)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "entries": len(self._surfaces),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+    def clear(self):
+        self._surfaces.clear()
+        self.hits = self.misses = 0
+
+
+# Cache partagé par Button et tous les écrans
+text_cache = TextCache()
+
+
+def render_text(font, text, color, antialias=True):
+    """font.render(text, antialias, color), via le cache partagé."""
+    return text_cache.render(font, text, color, antialias)
@@ -0,0 +1,67 @@
+import io
+import os
+from collections import OrderedDict
+from functools import partial
+
+import pygame
+from models.save_journal import write_atomic
+from models.save_manager import SaveManager
+from models.save_worker import save_worker
+
+
+THUMBNAIL_SIZE = (320, 180)
+
+
+def write_thumbnail(pixels, size, save_name):
+    """Encode en PNG des pixels RVB et les écrit à côté de la sauvegarde."""
+    data = io.BytesIO()
+    pygame.image.save(pygame.image.frombytes(pixels, size, "RGB"), data, "png")
+    with SaveManager.index().writing():
+        write_atomic(SaveManager.thumbnail_path(save_name), data.getvalue())
+
+
+def schedule_thumbnail(screen, save_path, worker=save_worker):
+    """
+    Dessine la miniature de l'écran de jeu (screen.thumbnail, directement à
+    THUMBNAIL_SIZE) et confie au thread de sauvegarde son encodage PNG et
+    son écriture, après la sauvegarde. Le thread ne reçoit que des octets,
+    jamais d'objet pygame partagé.
+    """
+    save_name = os.path.splitext(os.path.basename(save_path))[0]
+    thumbnail = screen.thumbnail(THUMBNAIL_SIZE)
+    pixels = pygame.image.tobytes(thumbnail, "RGB")
+    job = partial(write_thumbnail, pixels, thumbnail.get_size(), save_name)
+    worker.submit(("thumbnail", save_name), job, notify=False)
+
+
+class ThumbnailCache:
+    """
+    Miniatures lues pour l'écran de chargement, à la hauteur d'une ligne de
+    liste. Les sauvegardes sans miniature sont aussi retenues (None).
+    """
+
+    def __init__(self, height, max_entries=64):
+        self.height = height
+        self.max_entries = max_entries
+        self._surfaces = OrderedDict()  # nom -> Surface ou None (LRU)
+
+    def get(self, save_name):
+        if save_name in self._surfaces:
+            self._surfaces.move_to_end(save_name)
+            return self._surfaces[save_name]
+        try:
+            surface = pygame.image.load(SaveManager.thumbnail_path(save_name))
+        except (FileNotFoundError, pygame.error):
+            surface = None
+        if surface is not None:
+            width = surface.get_width() * self.height // surface.get_height()
+            surface = pygame.transform.smoothscale(surface, (width, self.height))
+            if pygame.display.get_surface() is not None:
+                surface = surface.convert()
+        self._surfaces[save_name] = surface
+        if len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        self._surfaces.clear()